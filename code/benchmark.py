@@ -0,0 +1,760 @@
+#!/usr/bin/env python3
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from copy import deepcopy
+from hashlib import sha1
+import json
+from multiprocessing import get_context
+from os import devnull
+from statistics import mean, median
+import sys
+import sysconfig
+import tempfile
+from time import perf_counter
+from timeit import repeat as timeit_repeat
+import tracemalloc
+import warnings
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from converter import Converter, iter_converted_games
+from game_writer import encoders, encoder_available, serialize_game
+from play_by_play import PlayInfo
+from raw_data_parsers.play_by_play.attribution import TeamIndex
+from raw_data_parsers.play_by_play.classifier import classify_play
+from raw_data_parsers.play_by_play.turnover import get_turnover_type, get_turnover_teams, parse_turnover, get_parsed_turnover_teams
+from raw_data_readers.backends import backends, backend_available
+from raw_data_readers.play_rows import iter_play_rows, soup_play_rows
+
+
+def time_call(function, *args, **kwargs):
+    """Calls a function and returns the time it took along with its result.
+
+    args:
+        function: The function to call.
+        *args, **kwargs: Arguments to pass to the function.
+
+    returns:
+        A tuple of (seconds, result).
+    """
+    # We throw away anything printed, as the parser warns about every play it
+    # doesn't understand, and that would swamp the report
+    with open(devnull, "w") as fnull, redirect_stdout(fnull):
+        start = perf_counter()
+        result = function(*args, **kwargs)
+        end = perf_counter()
+    return (end - start, result)
+
+
+def print_times(label, times):
+    """Prints a one line summary of a list of per-file times.
+
+    args:
+        label: A string naming what was timed.
+        times: A list of times in seconds, one per file.
+    """
+    out = "{label:<20} files: {n:>5}  mean: {mean:>8.2f} ms  median: {median:>8.2f} ms  total: {total:>8.2f} s"
+    print(out.format(
+        label=label,
+        n=len(times),
+        mean=mean(times) * 1000,
+        median=median(times) * 1000,
+        total=sum(times)
+        ))
+
+
+def bench_parse(files, repeat):
+    """Compares converting each file with one parse per section to converting
+    with a single shared parse, with and without streaming the play-by-play
+    table, and with and without reading only the located sections.
+
+    args:
+        files: A list of raw data file names.
+        repeat: Number of times to convert each file; the fastest is kept.
+    """
+    modes = (
+            ("multi-pass", {"single_pass": False, "stream_pbp": False, "locate": False}),
+            ("single-pass", {"single_pass": True, "stream_pbp": False, "locate": False}),
+            ("single-pass+stream", {"single_pass": True, "stream_pbp": True, "locate": False}),
+            ("located", {"single_pass": True, "stream_pbp": True, "locate": True}),
+            )
+    results = []
+    for label, options in modes:
+        times = []
+        jsons = []
+        for file_name in files:
+            best = None
+            for _ in range(repeat):
+                (seconds, converter) = time_call(
+                        Converter, file_name, **options
+                        )
+                if best is None or seconds < best:
+                    best = seconds
+            times.append(best)
+            jsons.append(converter.json)
+        print_times(label, times)
+        results.append(jsons)
+
+    if all(jsons == results[0] for jsons in results):
+        print("Output is identical.")
+    else:
+        print("Output DIFFERS!")
+
+
+def soup_rows(file_name):
+    """Returns the play-by-play rows of a file by way of a strained soup."""
+    with open(file_name) as file_handle:
+        soup = BeautifulSoup(
+                file_handle.read(),
+                parse_only=SoupStrainer(id="pbp_data")
+                )
+    return list(soup_play_rows(soup))
+
+
+def stream_rows(file_name):
+    """Returns the play-by-play rows of a file by streaming it."""
+    with open(file_name) as file_handle:
+        return list(iter_play_rows(file_handle))
+
+
+def peak_memory(function, *args):
+    """Returns the peak memory in bytes allocated by Python while calling
+    function(*args)."""
+    tracemalloc.start()
+    try:
+        function(*args)
+        (_, peak) = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def bench_pbp(files, repeat):
+    """Compares reading the play-by-play rows from a soup to streaming them.
+
+    args:
+        files: A list of raw data file names.
+        repeat: Number of times to read each file; the fastest is kept.
+    """
+    results = {}
+    for label, function in (("soup rows", soup_rows), ("streamed rows", stream_rows)):
+        times = []
+        peaks = []
+        results[label] = []
+        for file_name in files:
+            best = None
+            for _ in range(repeat):
+                (seconds, rows) = time_call(function, file_name)
+                if best is None or seconds < best:
+                    best = seconds
+            times.append(best)
+            results[label].append(rows)
+            peaks.append(peak_memory(function, file_name))
+        print_times(label, times)
+        n_rows = sum(len(rows) for rows in results[label])
+        print("{label:<20} rows/s: {rate:>8.0f}  max peak memory: {peak:>8.1f} KiB".format(
+            label='',
+            rate=n_rows / sum(times),
+            peak=max(peaks) / 1024.
+            ))
+
+    if results["soup rows"] == results["streamed rows"]:
+        print("Rows are identical.")
+    else:
+        print("Rows DIFFER!")
+
+
+def peak_rss():
+    """Returns the peak resident set size of this process in KiB, or None if
+    it can't be found."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, everyone else KiB
+    if sys.platform == "darwin":
+        peak /= 1024.
+    return peak
+
+
+def convert_with_backend(files, backend):
+    """Converts files with one backend. This is run in its own process so that
+    the peak memory use belongs to the backend alone.
+
+    returns:
+        A tuple of (seconds, peak RSS in KiB, list of output hashes). The hash
+            of the JSON is None for files that failed to convert.
+    """
+    warnings.simplefilter("ignore")
+    total = 0.
+    hashes = []
+    for file_name in files:
+        try:
+            (seconds, converter) = time_call(Converter, file_name, backend)
+        except Exception:
+            hashes.append(None)
+            continue
+        total += seconds
+        # The same options the converter uses to write files
+        text = json.dumps(
+                converter.json,
+                sort_keys=True,
+                indent=2,
+                separators=(',', ': '),
+                ensure_ascii=False
+                )
+        hashes.append(sha1(text.encode("utf-8")).hexdigest())
+    return (total, peak_rss(), hashes)
+
+
+def bench_backends(files, reference="html.parser"):
+    """Converts files with each HTML parser backend, reporting the speed, the
+    memory used, and whether the output matches the reference backend.
+
+    args:
+        files: A list of raw data file names.
+        reference: The backend whose output is taken as correct.
+    """
+    results = {}
+    # Each backend gets a fresh process, so the peak memory is its own
+    context = get_context("spawn")
+    for backend in backends:
+        if not backend_available(backend):
+            print("{backend:<12} not installed".format(backend=backend))
+            continue
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results[backend] = executor.submit(
+                    convert_with_backend, files, backend
+                    ).result()
+
+    for backend in backends:
+        if backend not in results:
+            continue
+        (seconds, peak, hashes) = results[backend]
+        failed = hashes.count(None)
+        if reference not in results:
+            same = "no reference"
+        elif hashes == results[reference][2]:
+            same = "identical"
+        else:
+            n_diff = sum(
+                    1 for (a, b) in zip(hashes, results[reference][2]) if a != b
+                    )
+            same = "{n} files differ".format(n=n_diff)
+        if peak is None:
+            peak_string = "n/a"
+        else:
+            peak_string = "{peak:.1f} MiB".format(peak=peak / 1024.)
+        rate = (len(files) - failed) / seconds if seconds else 0.
+        out = "{backend:<12} files/s: {rate:>7.2f}  peak RSS: {peak:>10}  failed: {failed:>4}  output: {same}"
+        print(out.format(
+            backend=backend,
+            rate=rate,
+            peak=peak_string,
+            failed=failed,
+            same=same
+            ))
+
+
+def bench_state(number, repeat):
+    """Compares the per-row cost of snapshotting the play-by-play state as a
+    dictionary with deepcopy(), as was once done, to copying a PlayInfo.
+
+    args:
+        number: Number of copies to time in each run.
+        repeat: Number of runs; the fastest is kept.
+    """
+    info_dict = {
+            "time": 398,
+            "quarter": 2,
+            "offense": "home",
+            "home score": 14,
+            "away score": 7,
+            "description": "Jerome Bettis up the middle for 4 yards",
+            "type": "run",
+            "number": 57
+            }
+    info = PlayInfo(398, 2, "home", 14, 7, "Jerome Bettis up the middle for 4 yards", "run", 57)
+    for label, function in (
+            ("dict deepcopy", lambda: deepcopy(info_dict)),
+            ("PlayInfo.copy", info.copy),
+            ):
+        best = min(timeit_repeat(function, number=number, repeat=repeat))
+        print("{label:<20} per row: {time:>8.3f} us".format(
+            label=label,
+            time=best / number * 1e6
+            ))
+
+
+def turnover_strings(files):
+    """Returns every turnover string in the play-by-play tables of files, as
+    the converter splits them out of the play descriptions."""
+    strings = []
+    for file_name in files:
+        for row in stream_rows(file_name):
+            if len(row.cells) < 6:
+                continue
+            description = row.cells[5].replace('\n', ' ')
+            try:
+                classification = classify_play(description)
+            except IndexError:
+                continue
+            text = classification["description"]
+            for (start, end) in classification["turnovers"]:
+                strings.append(text[start:end])
+    return strings
+
+
+def bench_turnovers(files, number, repeat):
+    """Compares finding the type and teams of each turnover string with the
+    separate get_turnover_*() functions to finding them with parse_turnover().
+
+    args:
+        files: A list of raw data file names to take the turnovers from.
+        number: Number of passes over the turnovers to time in each run.
+        repeat: Number of runs; the fastest is kept.
+    """
+    strings = turnover_strings(files)
+    if not strings:
+        print("No turnovers found.")
+        return
+    # The players are unknown, which exercises every lookup
+    players = set()
+    team_index = TeamIndex("", "", players, players)
+
+    def separate(string):
+        try:
+            return (get_turnover_type(string), get_turnover_teams(string, players, players))
+        except IndexError:
+            return None
+
+    def parsed(string):
+        try:
+            turnover = parse_turnover(string)
+            return (turnover["type"], get_parsed_turnover_teams(turnover, team_index))
+        except IndexError:
+            return None
+
+    results = []
+    with open(devnull, "w") as fnull, redirect_stdout(fnull):
+        for function in (separate, parsed):
+            best = min(timeit_repeat(
+                lambda: [function(string) for string in strings],
+                number=number,
+                repeat=repeat
+                ))
+            results.append((best, [function(string) for string in strings]))
+    for label, (best, _) in zip(("separate functions", "parse_turnover"), results):
+        print("{label:<20} per turnover: {time:>8.3f} us".format(
+            label=label,
+            time=best / number / len(strings) * 1e6
+            ))
+    if results[0][1] == results[1][1]:
+        print("Results are identical for {n} turnovers.".format(n=len(strings)))
+    else:
+        print("Results DIFFER!")
+
+
+def load_rosters(source, team_seasons, trace=False):
+    """Loads the rosters of some team-seasons from a fresh start, as a game
+    does. This is run in its own process so that nothing is loaded already.
+
+    args:
+        source: "rosters.py" to import the Python literal, or "store" to read
+            the compiled roster store.
+        team_seasons: A list of (team, season) tuples, or None for all of
+            them.
+        trace: If true, the memory allocated is traced, which slows the load
+            down.
+
+    returns:
+        A tuple of (seconds, bytes still allocated afterwards or None if not
+            traced, list of sorted lists of name keys).
+    """
+    if trace:
+        tracemalloc.start()
+    start = perf_counter()
+    if source == "rosters.py":
+        from data_helpers.rosters import rosters
+        if team_seasons is None:
+            team_seasons = [
+                    (team, season) for team in sorted(rosters)
+                    for season in sorted(rosters[team])
+                    ]
+        players = [rosters[team][season] for (team, season) in team_seasons]
+    else:
+        from data_helpers.roster_store import RosterStore
+        store = RosterStore()
+        if team_seasons is None:
+            team_seasons = [
+                    (team, season) for (team, seasons) in sorted(store.teams().items())
+                    for season in seasons
+                    ]
+        players = [store.roster(team, season) for (team, season) in team_seasons]
+    seconds = perf_counter() - start
+    retained = None
+    if trace:
+        # Everything loaded is still referenced, from sys.modules or the store
+        (retained, _) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    if source == "rosters.py":
+        # The store holds each player once, by their name key
+        from data_helpers.aliases import name_key
+        players = [set(name_key(player) for player in roster) for roster in players]
+    return (seconds, retained, [sorted(roster) for roster in players])
+
+
+def bench_rosters(team_seasons, repeat):
+    """Compares importing rosters.py to reading the compiled roster store,
+    each in a fresh process.
+
+    args:
+        team_seasons: A list of (team, season) tuples to load, or None to
+            load all of them, as a long batch run would.
+        repeat: Number of fresh processes to time for each; the fastest is
+            kept.
+    """
+    context = get_context("spawn")
+    results = {}
+    for source in ("rosters.py", "store"):
+        runs = []
+        # The last run only measures the memory
+        for run in range(repeat + 1):
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                runs.append(executor.submit(
+                    load_rosters, source, team_seasons, run == repeat
+                    ).result())
+        seconds = min(run[0] for run in runs[:-1])
+        (_, retained, results[source]) = runs[-1]
+        print("{label:<20} load: {time:>8.2f} ms  memory retained: {memory:>8.1f} KiB".format(
+            label=source,
+            time=seconds * 1000,
+            memory=retained / 1024.
+            ))
+
+    if results["rosters.py"] == results["store"]:
+        print("Rosters are identical.")
+    else:
+        print("Rosters DIFFER!")
+
+
+def bench_batch(files, workers, repeat):
+    """Times converting a batch of files serially, in a pool of threads, and
+    in a pool of processes. Threads only help on a free-threaded build of
+    Python, where the GIL is disabled.
+
+    args:
+        files: A list of raw data files or archives of them.
+        workers: A list of the numbers of threads and processes to try.
+        repeat: Number of runs of each; the fastest is kept.
+    """
+    gil_disabled = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    if gil_disabled and hasattr(sys, "_is_gil_enabled"):
+        gil_disabled = not sys._is_gil_enabled()
+    print("Python {version}, GIL {state}".format(
+        version=sys.version.split()[0],
+        state="disabled" if gil_disabled else "enabled"
+        ))
+
+    runs = [("serial", 1, 1)]
+    for number in workers:
+        runs.append(("{n} threads".format(n=number), 1, number))
+        runs.append(("{n} processes".format(n=number), number, 1))
+
+    reference = None
+    with tempfile.TemporaryDirectory() as directory:
+        for (label, jobs, threads) in runs:
+            times = []
+            for _ in range(repeat):
+                with open(devnull, "w") as fnull, redirect_stdout(fnull):
+                    (seconds, results) = time_call(
+                            lambda: list(iter_converted_games(
+                                files,
+                                jobs,
+                                output_directory=directory,
+                                force_overwrite=True,
+                                threads=threads
+                                ))
+                            )
+                times.append(seconds)
+            # The versions are the same in every run, so the texts can be
+            # compared directly
+            if reference is None:
+                reference = results
+            same = "identical" if results == reference else "DIFFER!"
+            best = min(times)
+            print("{label:<14} total: {time:>8.2f} s  files/s: {rate:>8.1f}  results: {same}".format(
+                label=label,
+                time=best,
+                rate=len(results) / best,
+                same=same
+                ))
+
+
+def bench_writers(files, largest, number, repeat):
+    """Compares the time to serialize a game with each JSON encoder, on the
+    games with the most plays.
+
+    args:
+        files: A list of raw data file names to convert.
+        largest: The number of games to time, taking those with the most
+            plays.
+        number: Number of times to serialize each game in each run.
+        repeat: Number of runs; the fastest is kept.
+    """
+    games = []
+    with open(devnull, "w") as fnull, redirect_stdout(fnull):
+        for file_name in files:
+            try:
+                games.append(Converter(file_name).json)
+            except Exception:
+                continue
+    if not games:
+        print("No games converted.")
+        return
+    games.sort(key=lambda game: len(game["plays"]), reverse=True)
+    games = games[:largest]
+    print("{n} games, {plays} to {most} plays".format(
+        n=len(games),
+        plays=len(games[-1]["plays"]),
+        most=len(games[0]["plays"])
+        ))
+
+    results = {}
+    for encoder in encoders:
+        if not encoder_available(encoder):
+            print("{label:<10} not installed".format(label=encoder))
+            continue
+        times = []
+        for game in games:
+            times.append(min(timeit_repeat(
+                lambda: serialize_game(game, encoder),
+                number=number,
+                repeat=repeat
+                )) / number)
+        results[encoder] = [serialize_game(game, encoder) for game in games]
+        print("{label:<10} per game: {time:>8.3f} ms  largest game: {large:>8.3f} ms".format(
+            label=encoder,
+            time=mean(times) * 1000,
+            large=times[0] * 1000
+            ))
+
+    outputs = list(results.values())
+    if all(output == outputs[0] for output in outputs):
+        print("Output is identical.")
+    else:
+        print("Output DIFFERS!")
+
+
+if __name__ == '__main__':
+    # We only need to parse command line flags if running as the main script
+    import argparse
+
+    argparser = argparse.ArgumentParser(
+            description="Time the converter on a set of raw data files."
+            )
+    subparsers = argparser.add_subparsers(dest="benchmark")
+    subparsers.required = True
+
+    parse_parser = subparsers.add_parser(
+            "parse",
+            help="compare one parse per section to a single shared parse"
+            )
+    parse_parser.add_argument(
+            "file",
+            type=str,
+            nargs="+",
+            help="a raw data file (or files) to convert"
+            )
+    parse_parser.add_argument(
+            "--repeat",
+            type=int,
+            default=1,
+            help="convert each file this many times and keep the fastest"
+            )
+
+    pbp_parser = subparsers.add_parser(
+            "pbp",
+            help="compare reading play-by-play rows from a soup to streaming them"
+            )
+    pbp_parser.add_argument(
+            "file",
+            type=str,
+            nargs="+",
+            help="a raw data file (or files) to read"
+            )
+    pbp_parser.add_argument(
+            "--repeat",
+            type=int,
+            default=1,
+            help="read each file this many times and keep the fastest"
+            )
+
+    backends_parser = subparsers.add_parser(
+            "backends",
+            help="compare the HTML parser backends"
+            )
+    backends_parser.add_argument(
+            "file",
+            type=str,
+            nargs="+",
+            help="a raw data file (or files) to convert"
+            )
+    backends_parser.add_argument(
+            "--reference",
+            help="the backend whose output is taken as correct (default: html.parser)",
+            choices=backends,
+            default="html.parser"
+            )
+
+    state_parser = subparsers.add_parser(
+            "state",
+            help="compare ways of snapshotting the play-by-play state"
+            )
+    state_parser.add_argument(
+            "--number",
+            type=int,
+            default=100000,
+            help="number of copies to time in each run"
+            )
+    state_parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="time this many runs and keep the fastest"
+            )
+
+    turnovers_parser = subparsers.add_parser(
+            "turnovers",
+            help="compare ways of parsing the turnover strings in a set of files"
+            )
+    turnovers_parser.add_argument(
+            "file",
+            type=str,
+            nargs="+",
+            help="a raw data file (or files) to take the turnovers from"
+            )
+    turnovers_parser.add_argument(
+            "--number",
+            type=int,
+            default=100,
+            help="number of passes over the turnovers to time in each run"
+            )
+    turnovers_parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="time this many runs and keep the fastest"
+            )
+
+    rosters_parser = subparsers.add_parser(
+            "rosters",
+            help="compare importing rosters.py to reading the roster store"
+            )
+    rosters_parser.add_argument(
+            "--teams",
+            nargs="+",
+            default=["PIT", "BAL"],
+            help="the team codes to load (default: PIT BAL)"
+            )
+    rosters_parser.add_argument(
+            "--season",
+            type=int,
+            default=2010,
+            help="the season to load (default: 2010)"
+            )
+    rosters_parser.add_argument(
+            "--all",
+            action="store_true",
+            help="load every team-season, as a long batch run would"
+            )
+    rosters_parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="time this many fresh processes and keep the fastest"
+            )
+
+    batch_parser = subparsers.add_parser(
+            "batch",
+            help="compare converting a batch serially, with threads, and with processes"
+            )
+    batch_parser.add_argument(
+            "file",
+            type=str,
+            nargs="+",
+            help="a raw data file (or files) to convert"
+            )
+    batch_parser.add_argument(
+            "--workers",
+            type=int,
+            nargs="+",
+            default=[2, 4],
+            help="the numbers of threads and processes to try (default: 2 4)"
+            )
+    batch_parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="time this many runs and keep the fastest"
+            )
+
+    writers_parser = subparsers.add_parser(
+            "writers",
+            help="compare the JSON encoders on the largest games"
+            )
+    writers_parser.add_argument(
+            "file",
+            type=str,
+            nargs="+",
+            help="a raw data file (or files) to convert"
+            )
+    writers_parser.add_argument(
+            "--largest",
+            type=int,
+            default=10,
+            help="time this many of the games with the most plays (default: 10)"
+            )
+    writers_parser.add_argument(
+            "--number",
+            type=int,
+            default=20,
+            help="number of times to serialize each game in each run"
+            )
+    writers_parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="time this many runs and keep the fastest"
+            )
+
+    args = argparser.parse_args()
+
+    # BeautifulSoup warns when it has to guess the parser; once per file is
+    # too noisy for a benchmark
+    warnings.simplefilter("ignore")
+
+    if args.benchmark == "parse":
+        bench_parse(args.file, args.repeat)
+    elif args.benchmark == "pbp":
+        bench_pbp(args.file, args.repeat)
+    elif args.benchmark == "backends":
+        bench_backends(args.file, args.reference)
+    elif args.benchmark == "state":
+        bench_state(args.number, args.repeat)
+    elif args.benchmark == "turnovers":
+        bench_turnovers(args.file, args.number, args.repeat)
+    elif args.benchmark == "rosters":
+        if args.all:
+            team_seasons = None
+        else:
+            team_seasons = [(team, args.season) for team in args.teams]
+        bench_rosters(team_seasons, args.repeat)
+    elif args.benchmark == "batch":
+        bench_batch(args.file, args.workers, args.repeat)
+    elif args.benchmark == "writers":
+        bench_writers(args.file, args.largest, args.number, args.repeat)
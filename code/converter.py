@@ -1,36 +1,93 @@
 #!/usr/bin/env python3
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import json
-from bs4 import BeautifulSoup, SoupStrainer
 from copy import deepcopy
-from os import getcwd, chdir, devnull, makedirs
-from os.path import dirname, realpath, normpath
-from subprocess import check_output, CalledProcessError
+from io import BytesIO, TextIOWrapper
+from os.path import abspath, dirname, realpath, normpath
 
 from raw_data_parsers.game_info import convert_time, convert_weather, convert_duration, convert_overunder, convert_vegas_line, convert_stadium
 from raw_data_parsers.team_stats import convert_rush_info, convert_pass_info, convert_sack_info, convert_fumble_info, convert_penalty_info
 from raw_data_parsers.title_info import convert_title_teams, convert_title_date, get_season, get_output_date
+from raw_data_parsers.players import iter_starters, iter_stats_players, iter_general_players
 
-from data_helpers.rosters import rosters
-from data_helpers.team_list import names_to_code, team_names
+from data_helpers.roster_store import get_roster, PlayerSet
+
+from raw_data_readers.archives import iter_raw_files
+from raw_data_readers.backends import backends, backend_available, make_tree, make_soup
+from raw_data_readers.compressed import open_raw_file
+from raw_data_readers.locator import read_sections
+from raw_data_readers.play_rows import iter_play_rows, soup_play_rows
+from raw_data_readers.sections import Section
 
 from play_by_play import PlayByPlay
 
+from game_writer import encoders, default_encoder, encoder_available, serialize_game, read_content_hash, write_game, SeasonBundles
+from git_version import get_git_version
+from manifest import Manifest
+
+
+# The hard coded strainers for each section of the page. Each is a dictionary
+# of arguments that can be used to make a SoupStrainer or to search a soup
+# with find_all().
+strainers = {
+        "title": {"name": "title"},
+        "game_info": {"id": "game_info"},
+        "ref_info": {"id": "ref_info"},
+        "team_stats": {"id": "team_stats"},
+        "pbp_data": {"id": "pbp_data"},
+        "starters": {"name": "table", "id": ""},
+        "def_stats": {"name": "table", "id": "def_stats"},
+        "off_stats": {"name": "table", "id": "skill_stats"},
+        "kick_stats": {"name": "table", "id": "kick_stats"},
+        "all_tables": {"name": "table"},
+        }
+
 
 class Converter:
 
-    def __init__(self, file_name):
+    def __init__(
+            self,
+            file_name,
+            backend="html.parser",
+            single_pass=True,
+            stream_pbp=True,
+            locate=True,
+            file_obj=None,
+            raw_dir=None,
+            parser_version=None,
+            raw_version=None
+            ):
         """Given the file name of a raw data file, opens it and converts it to
-        JSON.
+        JSON. Files ending in .gz, .bz2, .xz, or .zst are decompressed as they are
+        read.
 
         args:
             file_name: A string containing the name of a file to open
+            backend: The HTML parser used to build trees, one of the names in
+                raw_data_readers.backends.backends.
+            single_pass: If true, the file is parsed once and each section is
+                found in the shared tree. Otherwise each section is parsed
+                separately, which is much slower but is kept for comparison.
+            stream_pbp: If true, the play-by-play table is read with an event
+                driven parser straight from the HTML, and no tree is built for
+                it.
+            locate: If true, the file is memory mapped and only the title and
+                the tables are read from it. Otherwise the whole file is read.
+            file_obj: A binary file object to read the page from instead of
+                opening file_name, for example a member of an archive.
+            raw_dir: The directory holding the raw data's git repository.
+                Defaults to the directory containing file_name.
+            parser_version, raw_version: The git commits of the parser and
+                of the raw data, for the _version tag. Each is looked up if
+                it is not given.
         """
         # Set up some internal variables
         self.home_team = None
         self.away_team = None
-        self.home_players = set([])
-        self.away_players = set([])
+        self.home_players = PlayerSet()
+        self.away_players = PlayerSet()
         self.season = None
         self.output_date = None
 
@@ -42,16 +99,37 @@ class Converter:
 
         # Open the file and load the soup
         self.file_name = file_name
+        self.raw_dir = raw_dir
         self.soups = {}
-        with open(self.file_name) as file_handle:
-            cont = file_handle.read()
+        if locate:
+            cont = read_sections(self.file_name, file_obj=file_obj)
+        else:
+            with TextIOWrapper(open_raw_file(self.file_name, file_obj)) as file_handle:
+                cont = file_handle.read()
 
         # Make the Soups
-        for key, value in self.strainers.items():
-            self.soups[key] = BeautifulSoup(cont, parse_only=value)
+        if stream_pbp:
+            del self.strainers["pbp_data"]
+            skip_ids = ("pbp_data",)
+        else:
+            skip_ids = ()
+        if single_pass:
+            # The play-by-play table is left out of the tree if it is streamed
+            tree = make_tree(cont, backend, skip_ids)
+            for key, value in self.strainers.items():
+                self.soups[key] = Section(tree, value)
+        else:
+            for key, value in self.strainers.items():
+                self.soups[key] = make_soup(cont, value, backend)
+
+        # Get the rows of the play-by-play table
+        if stream_pbp:
+            pbp_rows = iter_play_rows(cont)
+        else:
+            pbp_rows = soup_play_rows(self.soups["pbp_data"])
 
         # Save the version of the parser code used to create the data file
-        self.__set_version()
+        self.__set_version(parser_version, raw_version)
 
         # Parse the various tables
         self.__parse_title()
@@ -66,7 +144,7 @@ class Converter:
 
         # Parse Play-by-play
         self.pbp = PlayByPlay(
-                self.soups["pbp_data"],
+                pbp_rows,
                 self.season,
                 self.home_team,
                 self.away_team,
@@ -102,70 +180,19 @@ class Converter:
         self.json["team stats"]["away"] = deepcopy(teamstats)
 
     def __set_strainers(self):
-        """ Set up a list of hard coded SoupStrainers. """
-        self.strainers = {}
-        self.strainers["title"] = SoupStrainer("title")
-        self.strainers["game_info"] = SoupStrainer(id="game_info")
-        self.strainers["ref_info"] = SoupStrainer(id="ref_info")
-        self.strainers["team_stats"] = SoupStrainer(id="team_stats")
-        self.strainers["pbp_data"] = SoupStrainer(id="pbp_data")
-        self.strainers["starters"] = SoupStrainer("table", id="")
-        self.strainers["def_stats"] = SoupStrainer("table", id="def_stats")
-        self.strainers["off_stats"] = SoupStrainer("table", id="skill_stats")
-        self.strainers["kick_stats"] = SoupStrainer("table", id="kick_stats")
-        self.strainers["all_tables"] = SoupStrainer("table")
-
-    def __set_version(self):
-        """ Sets the valuse of the  _version tag with the hashes from the
-        various git repos. """
-        self.json["_version"]["parser"] = self.__get_parser_version()
-        self.json["_version"]["raw"] = self.__get_raw_data_version()
-
-    def __get_raw_data_version(self):
-        """ Returns a string indicating the latest git commit from the raw
-        data's git repository. """
-        # Try to get the raw data version
-        raw_dir = dirname(realpath(self.file_name))
-        current_dir = getcwd()
-
-        # Try to change dir
-        try:
-            chdir(raw_dir)
-        except OSError:
-            raw_version = "unknown"
-        else:
-            # Now that we're in the raw directory, look for git
-            try:
-                with open(devnull, "w") as fnull:
-                    raw_version = check_output(['git', 'rev-parse', 'HEAD'], stderr=fnull)
-            except CalledProcessError:
-                raw_version = "unknown"
-            else:
-                # Having succeeded, we now clean up the output and save it
-                raw_version = raw_version.decode("utf-8").strip()
-            finally:
-                # Always change back to the starting dir!
-                chdir(current_dir)
-
-        return raw_version
-
-    def __get_parser_version(self):
-        """ Returns a string indicating the latest git commit from the parser's
-        git repository. """
-        # Try to get the parser version
-        try:
-            with open(devnull, "w") as fnull:
-                parser_version = check_output(
-                        ['git', 'rev-parse', 'HEAD'],
-                        stderr=fnull
-                        )
-        except CalledProcessError:
-            parser_version = "unknown"
-        else:
-            # Having succeeded, we now clean up the output and save it
-            parser_version = parser_version.decode("utf-8").strip()
+        """ Set up a list of hard coded strainers, copied from strainers so
+        that they can be changed. """
+        self.strainers = dict(strainers)
 
-        return parser_version
+    def __set_version(self, parser_version, raw_version):
+        """ Sets the valuse of the  _version tag with the hashes from the
+        various git repos, looking up any that were not given. """
+        if parser_version is None:
+            parser_version = get_parser_version()
+        if raw_version is None:
+            raw_version = get_raw_data_version(self.file_name, self.raw_dir)
+        self.json["_version"]["parser"] = parser_version
+        self.json["_version"]["raw"] = raw_version
 
     def __parse_title(self):
         """ Parse the title tag from the HTML. This sets the two teams and the
@@ -282,97 +309,46 @@ class Converter:
 
     def __parse_starter(self):
         """ Parse the list of starter and their positions. """
-        soup = self.soups["starters"]
-        # We get all the elements the match data-stat="pos", which is the table
-        # element that has the words "Pos", which is unique to these tables.
-        # Once we have these elements, we find their parents to get the whole
-        # table.
-        ths = soup.find_all("th", attrs={"data-stat": "pos"})
-        for th in ths:
-            table = th.parent.parent  # th.parent == row, row.parent == table
-            for row in table.find_all("tr"):
-                # We read through the rows in order. Since the header with the
-                # name always comes before the players for a team, we can set
-                # the dictionary at the first time we hit it and it will be
-                # good for the rest of the table.
-
-                # Header row with team name
-                if "stat_total" in row["class"]:
-                    team_name = row.get_text(' ', strip=True)
-                    team_code = names_to_code[team_name]
-                    # Set the working dictionary based on the team
-                    if team_code == self.home_team:
-                        p_dict = self.json["players"]["home"]
-                        p_set = self.home_players
-                    else:
-                        p_dict = self.json["players"]["away"]
-                        p_set = self.away_players
-                # Normal rows have blank classes
-                elif row["class"] == ['']:
-                    cols = row.find_all("td")
-                    player = cols[0].get_text(' ', strip=True).replace('\n', ' ')
-                    position = cols[1].get_text(' ', strip=True).replace('\n', ' ')
-                    # We try to add the player to the list, but if the list
-                    # doesn't exist, we have to make it first
-                    try:
-                        p_dict[position].append(player)
-                    except KeyError:
-                        p_dict[position] = [player]
-                    # We also add to our internal set used to get teams from
-                    # players in playbyplay
-                    p_set.add(player)
+        for (team_code, position, player) in iter_starters(self.soups["starters"]):
+            # Set the working dictionary based on the team
+            if team_code == self.home_team:
+                p_dict = self.json["players"]["home"]
+                p_set = self.home_players
+            else:
+                p_dict = self.json["players"]["away"]
+                p_set = self.away_players
+            # We try to add the player to the list, but if the list doesn't
+            # exist, we have to make it first
+            try:
+                p_dict[position].append(player)
+            except KeyError:
+                p_dict[position] = [player]
+            # We also add to our internal set used to get teams from players
+            # in playbyplay
+            p_set.add(player)
 
     def __get_all_players(self):
         """ Get all player names from the various tables and store them in the
         player sets. """
-        l_soups = [self.soups["def_stats"]]
-        l_soups.append(self.soups["off_stats"])
-        l_soups.append(self.soups["kick_stats"])
-
-        # Each soup is essentially the same, and we only care about the first
-        # two columns
-        for soup in l_soups:
-            body = soup.find_all("tbody")
-            for row in body[0].find_all("tr"):
-                # The rows with players have blank classes
-                if row["class"] == ['']:
-                    cols = row.find_all("td")
-                    player = cols[0].get_text(' ', strip=True).replace('\n', ' ')
-                    team_code = cols[1].get_text(' ', strip=True).replace('\n', ' ')
-                    # Assign by team code
-                    if team_code == self.home_team:
-                        self.home_players.add(player)
-                    elif team_code == self.away_team:
-                        self.away_players.add(player)
+        for key in ("def_stats", "off_stats", "kick_stats"):
+            for (team_code, player) in iter_stats_players(self.soups[key]):
+                # Assign by team code
+                if team_code == self.home_team:
+                    self.home_players.add(player)
+                elif team_code == self.away_team:
+                    self.away_players.add(player)
 
         # Now parse the soups from the general stats tables
-        soup = self.soups["all_tables"]
-        # The tables we are interested in have no id set, and have class =
-        # ['stats_table', 'no_highlight'].
-        team_set = None
-        for table in soup.find_all("table"):
-            if table.has_attr("class") and not table.has_attr("id") \
-            and table["class"] == ['stats_table', 'no_highlight']:
-                for metarow in table.find_all("tr"):
-                    # If it is a row with a team name, use that to set the
-                    # target set
-                    team_name = metarow.get_text(' ', strip=True).replace('\n', ' ')
-                    if team_name in team_names:
-                        team_code = names_to_code[team_name]
-                        if team_code == self.home_team:
-                            team_set = self.home_players
-                        elif team_code == self.away_team:
-                            team_set = self.away_players
-                        else:
-                            team_set = None
-                    # Otherwise we find the rows of player stats and pull out
-                    # their names.
-                    else:
-                        for body in metarow.find_all("tbody"):
-                            for row in body.find_all("tr"):
-                                cols = row.find_all("td")
-                                player = cols[0].get_text(' ', strip=True).replace('\n', ' ')
-                                team_set.add(player)
+        for (team_code, player) in iter_general_players(self.soups["all_tables"]):
+            if team_code == self.home_team:
+                self.home_players.add(player)
+            elif team_code == self.away_team:
+                self.away_players.add(player)
+            else:
+                raise ValueError(
+                        "'" + player + "' is not listed under " + self.home_team
+                        + " or " + self.away_team
+                        )
 
     def __add_rosters(self):
         """Add the roster information to our player list"""
@@ -380,8 +356,8 @@ class Converter:
         # NOTE: Sometimes there are degenerate players, either because they
         # have the same name of one player played for both teams during the
         # season. TODO: Find an acceptable solution to this case.
-        self.home_players = rosters[self.home_team][self.season].copy()
-        self.away_players = rosters[self.away_team][self.season].copy()
+        self.home_players = PlayerSet(get_roster(self.home_team, self.season))
+        self.away_players = PlayerSet(get_roster(self.away_team, self.season))
 
     def print_soups(self):
         """ Print out all the soups. """
@@ -398,6 +374,26 @@ class Converter:
         return self.json.__str__()
 
 
+def get_parser_version():
+    """ Returns a string indicating the latest git commit from the parser's
+    git repository, or "unknown". It is only looked up once per process. """
+    return get_git_version(dirname(realpath(__file__)))
+
+
+def get_raw_data_version(file_name, raw_dir=None):
+    """ Returns a string indicating the latest git commit from the raw data's
+    git repository, or "unknown". It is only looked up once per directory.
+
+    args:
+        file_name: A string containing the name of a raw data file.
+        raw_dir: The directory holding the raw data's git repository.
+            Defaults to the directory containing file_name.
+    """
+    if raw_dir is None:
+        raw_dir = dirname(realpath(file_name))
+    return get_git_version(raw_dir)
+
+
 def json_unchanged(file_name, json_obj):
     """Takes a filename and a object that will be serialized into a json and
     tests their equality after stripping the _version hashes.
@@ -414,29 +410,227 @@ def json_unchanged(file_name, json_obj):
     # Try to open the target file, return false if it can't be opened for
     # reading, otherwise we continue trying to compare it
     try:
-        with open(out_file_name, "r") as old_file:
+        with open(file_name, "r") as old_file:
             old_json = json.load(old_file)
     except IOError:
         return False
     else:
-        # Deep copy to avoid mangling the input json
-        new_json = deepcopy(json_obj)
-
         # Remove the _version key; if that is all that has changed,
-        # we don't care and won't write the file
-        try:
-            del old_json["_version"]
-        except KeyError:
-            pass  # That's ok, we want to remove it anyway...
-        try:
-            del new_json["_version"]
-        except KeyError:
-            pass
+        # we don't care and won't write the file. The input json is not
+        # changed.
+        old_json.pop("_version", None)
+        new_json = {key: value for (key, value) in json_obj.items() if key != "_version"}
 
         # If they are the same, don't write
         return old_json == new_json
 
 
+def get_output_file_name(converter, output_directory, do_not_sort=False):
+    """Returns the name of the file to save a converted game to, which
+    depends only on the game, so it is the same however the files are split
+    between processes.
+
+    args:
+        converter: A Converter.
+        output_directory: User specified directory.
+        do_not_sort: If true, do not make subdirectories for each season.
+
+    returns:
+        A normalized file name.
+    """
+    output_dir = get_output_dir(
+            output_directory,
+            converter.season,
+            do_not_sort
+            )
+    tmp_out_file_name = "{output_dir}/{season}_{date}_{away}_at_{home}.json".format(
+            output_dir=output_dir,
+            season=converter.season,
+            date=converter.output_date,
+            away=converter.away_team,
+            home=converter.home_team
+        )
+    return normpath(tmp_out_file_name)
+
+
+def convert_game(
+        raw_file,
+        file_obj=None,
+        raw_dir=None,
+        backend="html.parser",
+        output_directory=".",
+        do_not_sort=False,
+        force_overwrite=False,
+        encoder="json",
+        parser_version=None,
+        raw_version=None
+        ):
+    """Converts a raw data file, and returns the JSON to write for it.
+
+    args:
+        raw_file: A string containing the name of a raw data file.
+        file_obj: A binary file object to read instead of opening raw_file.
+        raw_dir: The directory holding the raw data's git repository.
+        backend: The HTML parser to use.
+        output_directory: User specified directory.
+        do_not_sort: If true, do not make subdirectories for each season.
+        force_overwrite: If false, no JSON is returned when the output file
+            already holds the same game, ignoring the _version hashes.
+        encoder: The JSON encoder to use, one of the names in
+            game_writer.encoders.
+        parser_version, raw_version: As for Converter.
+
+    returns:
+        A tuple of (out_file_name, season, text), where text is the
+            serialized JSON, or None if the file does not need to be written.
+
+    raises:
+        Any exception raised by the Converter.
+    """
+    converter = Converter(
+            raw_file,
+            backend,
+            file_obj=file_obj,
+            raw_dir=raw_dir,
+            parser_version=parser_version,
+            raw_version=raw_version
+            )
+    out_file_name = get_output_file_name(converter, output_directory, do_not_sort)
+    (text, content_hash) = serialize_game(converter.json, encoder)
+    # If force_overwrite is not set, we test to make sure the file has
+    # changed before writing. We do this so that it is easier to find
+    # meaningful changes in git (otherwise every file changes every time we
+    # make a new parser commit, even if the data is unchanged).
+    if not force_overwrite:
+        old_hash = read_content_hash(out_file_name)
+        if old_hash == content_hash:
+            return (out_file_name, converter.season, None)
+        # Files written before the content hash was added are compared the
+        # slow way
+        if old_hash == "" and json_unchanged(out_file_name, converter.json):
+            return (out_file_name, converter.season, None)
+    return (out_file_name, converter.season, text)
+
+
+def _convert_game_or_error(args):
+    """Calls convert_game(*args), and returns a tuple of (raw_file,
+    out_file_name, season, text, error) instead of raising, so that a worker process
+    can hand failures back. Archive members are passed as bytes, as file
+    objects can't be sent to another process."""
+    (raw_file, data) = args[:2]
+    if isinstance(data, bytes):
+        args = (raw_file, BytesIO(data)) + tuple(args[2:])
+    try:
+        (out_file_name, season, text) = convert_game(*args)
+    except Exception as err:
+        return (raw_file, None, None, None, repr(err))
+    return (raw_file, out_file_name, season, text, None)
+
+
+def _iter_game_args(file_names, options, manifest=None, read_members=False):
+    """Takes a list of raw data files and archives of them, and yields what
+    to do with each file: either the output of a file the manifest says is
+    current, or the arguments to convert it with. The git versions are
+    looked up here, once per directory, rather than by each Converter.
+
+    args:
+        file_names: A list of raw data files or archives of them.
+        options: A tuple of the arguments of convert_game() after raw_dir.
+        manifest: A Manifest, or None to convert every file.
+        read_members: If true, archive members are passed as bytes instead of
+            file objects.
+
+    returns:
+        A generator of (raw_file, out_file_name, args) tuples, where
+            out_file_name is None and args is not if the file must be
+            converted.
+    """
+    for (raw_file, file_obj, raw_dir) in iter_raw_files(file_names):
+        data = None
+        if file_obj is not None and (read_members or manifest is not None):
+            data = file_obj.read()
+            file_obj = data if read_members else BytesIO(data)
+        if manifest is not None:
+            out_file_name = manifest.is_current(raw_file, data)
+            if out_file_name is not None:
+                yield (raw_file, out_file_name, None)
+                continue
+        versions = (get_parser_version(), get_raw_data_version(raw_file, raw_dir))
+        yield (raw_file, None, (raw_file, file_obj, raw_dir) + options + versions)
+
+
+def iter_converted_games(
+        file_names,
+        jobs=1,
+        backend="html.parser",
+        output_directory=".",
+        do_not_sort=False,
+        force_overwrite=False,
+        manifest=None,
+        threads=1,
+        encoder="json"
+        ):
+    """Converts raw data files, in a pool of processes if jobs is more than
+    one or a pool of threads if threads is, and yields the results in the
+    order of the files. Only a few files per worker are read ahead, so the
+    whole batch is never in memory. The processes last for the whole batch,
+    so each loads a roster at most once, and threads share the rosters.
+
+    args:
+        file_names: A list of raw data files or archives of them.
+        jobs: The number of processes to use.
+        threads: The number of threads to use, if jobs is 1. Threads only
+            convert files in parallel on a free-threaded build of Python.
+        backend, output_directory, do_not_sort, force_overwrite, encoder: As
+            for convert_game().
+        manifest: A Manifest. Files it says are current are skipped without
+            being parsed.
+
+    returns:
+        A generator of (raw_file, out_file_name, season, text, error)
+            tuples. error is None unless the file failed to convert, and text
+            is None if the file does not need to be written. The season is
+            None for files the manifest skipped.
+    """
+    options = (backend, output_directory, do_not_sort, force_overwrite, encoder)
+    if jobs > 1:
+        executor = ProcessPoolExecutor(max_workers=jobs)
+        workers = jobs
+    elif threads > 1:
+        executor = ThreadPoolExecutor(max_workers=threads)
+        workers = threads
+    else:
+        for (raw_file, out_file_name, args) in _iter_game_args(file_names, options, manifest):
+            if args is None:
+                yield (raw_file, out_file_name, None, None, None)
+            else:
+                yield _convert_game_or_error(args)
+        return
+
+    # Holds futures for the files being converted, and results for the ones
+    # that were skipped, so that everything comes out in order. Archive
+    # members are read whole, as a tar file must be read in order.
+    pending = deque()
+    with executor:
+        for (raw_file, out_file_name, args) in _iter_game_args(file_names, options, manifest, True):
+            if args is None:
+                pending.append((raw_file, out_file_name, None, None, None))
+            else:
+                pending.append(executor.submit(_convert_game_or_error, args))
+            while len(pending) >= 4 * workers or (pending and isinstance(pending[0], tuple)):
+                yield _get_result(pending.popleft())
+        while pending:
+            yield _get_result(pending.popleft())
+
+
+def _get_result(item):
+    """Returns the result of a future, or the item itself if it is a
+    result already."""
+    if isinstance(item, tuple):
+        return item
+    return item.result()
+
+
 def get_output_dir(spec_dir, season, do_not_sort=False):
     """ Returns the output directory for the file.
 
@@ -469,7 +663,7 @@ if __name__ == '__main__':
             "file",
             type=str,
             nargs="+",
-            help="a raw data file (or files) to convert to JSON"
+            help="a raw data file (or files) to convert to JSON, optionally compressed with gzip, bzip2, xz, or zstd, or a tar (optionally compressed the same way) or zip archive of them"
             )
     argparser.add_argument(
             "-o",
@@ -482,6 +676,41 @@ if __name__ == '__main__':
             help="do not sort files into subdirectories by season",
             action="store_true"
             )
+    argparser.add_argument(
+            "--bundle-season",
+            help="write one file per season, SEASON.json, holding all of its games, instead of one file per game; the files given must hold every game of each season, as its bundle is replaced, and the old bundles are kept if any game fails to convert",
+            action="store_true"
+            )
+    argparser.add_argument(
+            "--parser",
+            help="the HTML parser to use (default: html.parser)",
+            choices=backends,
+            default="html.parser"
+            )
+    argparser.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            default=1,
+            help="number of processes to convert files with (default: 1)"
+            )
+    argparser.add_argument(
+            "--threads",
+            type=int,
+            default=1,
+            help="number of threads to convert files with, which only helps on a free-threaded build of Python (default: 1)"
+            )
+    argparser.add_argument(
+            "--manifest",
+            help="a file recording the raw files already converted, so that those whose bytes and parser version are unchanged are skipped without being parsed",
+            default=None
+            )
+    argparser.add_argument(
+            "--encoder",
+            help="the JSON encoder to write files with, which give identical output (default: orjson if it is installed, otherwise json)",
+            choices=encoders,
+            default=None
+            )
     argparser.add_argument(
             "--force-overwrite",
             help="overwrite files and update the '_version' hashes, even if nothing else has changed",
@@ -490,49 +719,70 @@ if __name__ == '__main__':
 
     args = argparser.parse_args()
 
-    for raw_file in args.file:
-        # Try to convert the file
-        try:
-            converter = Converter(raw_file)
-        # Continue if we fail
-        except:
-            continue
-        # If we succeed, write it
-        else:
-            # Get the output directory, and try to make it
-            output_dir = get_output_dir(
-                    args.output_directory,
-                    converter.season,
-                    args.do_not_sort
-                    )
-            try:
-                makedirs(output_dir, exist_ok=True)
-            except OSError:
-                err_string = "Failed to make directory '" + output_dir
-                err_string += "'. Skipping file '" + raw_file + "'."
-                print(err_string)
-                continue
-            # Now make the full file name
-            tmp_out_file_name = "{output_dir}/{season}_{date}_{away}_at_{home}.json".format(
-                    output_dir=output_dir,
-                    season=converter.season,
-                    date=converter.output_date,
-                    away=converter.away_team,
-                    home=converter.home_team
+    # Otherwise every file would fail to convert, silently
+    if not backend_available(args.parser):
+        argparser.error("the '" + args.parser + "' parser is not installed")
+
+    if args.encoder is None:
+        args.encoder = default_encoder()
+    elif not encoder_available(args.encoder):
+        argparser.error("the '" + args.encoder + "' encoder is not installed")
+    if args.jobs < 1:
+        argparser.error("--jobs must be at least 1")
+    if args.threads < 1:
+        argparser.error("--threads must be at least 1")
+    if args.jobs > 1 and args.threads > 1:
+        argparser.error("--jobs and --threads can't be used together")
+    if args.bundle_season and args.manifest is not None:
+        argparser.error("--bundle-season can't skip files, so it can't be used with --manifest")
+
+    # Files are skipped before parsing only if they would not be written.
+    # The backends may not give identical output, so changing the parser
+    # drops every entry. The encoders always give identical bytes, so they
+    # are left out.
+    manifest = None
+    if args.manifest is not None:
+        manifest = Manifest(
+                args.manifest,
+                get_parser_version(),
+                [abspath(args.output_directory), args.do_not_sort, args.parser]
                 )
-            out_file_name = normpath(tmp_out_file_name)
-            # If force_overwrite is not set, we test to make sure the file has
-            # changed before writing. We do this so that it is easier to find
-            # meaningful changes in git (otherwise every file changes every
-            # time we make a new parser commit, even if the data is unchanged).
-            if not args.force_overwrite:
-                if json_unchanged(out_file_name, converter.json):
-                    continue
-            # Write our file
-            with open(out_file_name, "w") as out_file:
-                try:
-                    json.dump(converter.json, out_file, sort_keys=True, indent=2, separators=(',', ': '), ensure_ascii=False)
-                except IOError:
-                    err_string = "Failed to write '" + out_file_name + "'."
-                    print(err_string)
-                    continue
+        if args.force_overwrite:
+            manifest.files = {}
+
+    # Archives are read member by member, without extracting them. Bundles
+    # are always rewritten, so every game is needed.
+    results = iter_converted_games(
+            args.file,
+            args.jobs,
+            args.parser,
+            args.output_directory,
+            args.do_not_sort,
+            args.force_overwrite or args.bundle_season,
+            manifest,
+            args.threads,
+            args.encoder
+            )
+    if args.bundle_season:
+        with SeasonBundles(args.output_directory) as bundles:
+            for (raw_file, _, season, text, error) in results:
+                if error is not None:
+                    print("Failed to convert '" + raw_file + "': " + error)
+                    # The season of a game that failed is not known, so no
+                    # new bundle can be trusted to hold all of its season
+                    if bundles.discarded is not None:
+                        print("Keeping the old season bundles.")
+                    bundles.discard()
+                else:
+                    bundles.add(season, text)
+    else:
+        for (raw_file, out_file_name, _, text, error) in results:
+            if error is not None:
+                print("Failed to convert '" + raw_file + "': " + error)
+                if manifest is not None:
+                    manifest.forget(raw_file)
+            elif text is None or write_game(raw_file, out_file_name, text):
+                if manifest is not None:
+                    manifest.record(raw_file, out_file_name)
+        if manifest is not None:
+            manifest.save()
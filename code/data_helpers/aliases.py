@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+# Players that rosters.py lists under more than one first name. Each variant
+# maps to the spelling taken as the player's canonical name. Variants that
+# differ only in punctuation, spacing or case don't need to be listed, as
+# normalize_name() already makes them the same.
+aliases = {
+    "Bill Baber": "Billy Baber",
+    "Cam Cleeland": "Cameron Cleeland",
+    "Chris Owens": "Christopher Owens",
+    "Dan Campbell": "Daniel Campbell",
+    "Dan Connolly": "Daniel Connolly",
+    "Ed Hartwell": "Edgerton Hartwell",
+    "Ed Jasper": "Edward Jasper",
+    "Herb Taylor": "Herbert Taylor",
+    "Ike Ndukwe": "Ikechuku Ndukwe",
+    "Jeff Linkenbach": "Jeffrey Linkenbach",
+    "Jim Kleinsasser": "Jimmy Kleinsasser",
+    "Jon Stinchcomb": "Jonathan Stinchcomb",
+    "Marshal Yanda": "Marshall Yanda",
+    "Matt Hatchette": "Matthew Hatchette",
+    "Pat Johnson": "Patrick Johnson",
+    "Pat Lee": "Patrick Lee",
+    "Pernel McPhee": "Pernell McPhee",
+    "Ray Austin": "Raymond Austin",
+    "Ray Perryman": "Raymond Perryman",
+    "Ray Thompson": "Raynoch Thompson",
+    "Rob Francois": "Robert Francois",
+    "Rod Coleman": "Roderick Coleman",
+    "Rod Monroe": "Rodrick Monroe",
+    "Tre' Stallings": "Tre Stallings",
+    "Trent Robinson": "Trenton Robinson",
+    "Vlad Ducasse": "Vladimir Ducasse",
+    "Will Beatty": "William Beatty",
+    "Will James": "William James",
+    "Will Peterson": "William Peterson",
+    "Zack Bowman": "Zackary Bowman",
+}
+
+
+def normalize_name(name):
+    """Takes a player's name and returns it with the punctuation, spacing and
+    case that vary between listings of the same player made uniform.
+
+    Periods become spaces, runs of whitespace become one space, a run of
+    initials is joined into one word, and the name is case folded, so "J.J.
+    McCleskey", "J. J. McCleskey" and "JJ McCleskey" all become
+    "jj mccleskey".
+
+    args:
+        name: A string containing a player's name.
+
+    returns:
+        A string.
+    """
+    words = []
+    last_was_initial = False
+    for word in name.replace(".", " ").split():
+        is_initial = (len(word) == 1)
+        if is_initial and last_was_initial:
+            words[-1] += word
+        else:
+            words.append(word)
+        last_was_initial = is_initial
+    return " ".join(words).casefold()
+
+
+# The aliases, normalized
+_alias_keys = {
+        normalize_name(variant): normalize_name(canonical)
+        for (variant, canonical) in aliases.items()
+        }
+
+
+def name_key(name):
+    """Takes a player's name and returns the normalized form of their
+    canonical name, which is the same for every spelling of the player that
+    normalize_name() or the alias table knows about.
+
+    args:
+        name: A string containing a player's name.
+
+    returns:
+        A string.
+    """
+    key = normalize_name(name)
+    return _alias_keys.get(key, key)
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+
+from array import array
+from bisect import bisect_left
+import json
+import mmap
+from os.path import dirname, join, realpath
+import struct
+import sys
+from threading import Lock
+
+from data_helpers.aliases import name_key
+
+# The compiled form of rosters.py, which stays the copy to edit by hand
+store_file = join(dirname(realpath(__file__)), "rosters.dat")
+
+# The store starts with a magic string and the length of a JSON index. The
+# rest of the file is a block of every player's name key (see name_key()) in
+# sorted order, one per line, followed by a sorted array of name IDs for each
+# team-season, and the index gives the (offset, length) of each of these.
+_magic = b"FDCROSTERS3\n"
+_header = struct.Struct("<I")
+
+
+def _to_little_endian(ids):
+    """Byte swaps an array of IDs in place if this machine is big endian,
+    which converts it to or from the little endian order of the store."""
+    if sys.byteorder == "big":
+        ids.byteswap()
+
+
+def write_store(rosters, file_name=store_file):
+    """Writes rosters to a store that RosterStore can load.
+
+    args:
+        rosters: A dictionary mapping team codes to dictionaries that map
+            seasons to iterables of player names, as in rosters.py.
+        file_name: The name of the file to write.
+    """
+    # Every spelling of a player is stored once, as their name key
+    keys = {
+            team: {
+                season: {name_key(player) for player in players}
+                for (season, players) in seasons.items()
+                }
+            for (team, seasons) in rosters.items()
+            }
+    names = sorted({
+        key for seasons in keys.values()
+        for players in seasons.values()
+        for key in players
+        })
+    ids = {name: player_id for (player_id, name) in enumerate(names)}
+    if len(names) < 2**16:
+        typecode = "H"
+    else:
+        typecode = "I"
+
+    blocks = ["\n".join(names).encode("utf-8")]
+    index = {
+            "names": [0, len(blocks[0])],
+            "typecode": typecode,
+            "rosters": {},
+            }
+    offset = len(blocks[0])
+    for team in sorted(rosters):
+        index["rosters"][team] = {}
+        for season in sorted(rosters[team]):
+            team_ids = array(
+                    typecode,
+                    sorted(ids[key] for key in keys[team][season])
+                    )
+            _to_little_endian(team_ids)
+            block = team_ids.tobytes()
+            index["rosters"][team][str(season)] = [offset, len(block)]
+            blocks.append(block)
+            offset += len(block)
+
+    header = json.dumps(index, sort_keys=True, separators=(',', ':'))
+    header = header.encode("utf-8")
+    with open(file_name, "wb") as file_handle:
+        file_handle.write(_magic)
+        file_handle.write(_header.pack(len(header)))
+        file_handle.write(header)
+        for block in blocks:
+            file_handle.write(block)
+
+
+class Roster:
+
+    __slots__ = ("store", "ids")
+
+    def __init__(self, store, ids):
+        """The players on a team in a season, held as a sorted array of their
+        IDs in a RosterStore. Supports 'in', which matches any spelling of a
+        player that name_key() knows about, iteration over the name keys,
+        and len().
+
+        args:
+            store: The RosterStore the IDs belong to.
+            ids: A sorted array of name IDs.
+        """
+        self.store = store
+        self.ids = ids
+
+    def has_key(self, key):
+        """Returns True if a name key, as from name_key(), is on the
+        roster."""
+        player_id = self.store.player_id(key)
+        if player_id is None:
+            return False
+        i = bisect_left(self.ids, player_id)
+        return i < len(self.ids) and self.ids[i] == player_id
+
+    def __contains__(self, name):
+        if not isinstance(name, str):
+            return False
+        return self.has_key(name_key(name))
+
+    def __iter__(self):
+        names = self.store.names
+        return (names[player_id] for player_id in self.ids)
+
+    def __len__(self):
+        return len(self.ids)
+
+
+class RosterStore:
+
+    def __init__(self, file_name=store_file):
+        """Reads team-season rosters out of a store written by write_store(),
+        which is memory mapped, loading the table of names when the first
+        roster is asked for and each roster only when it is first asked for.
+        It can be shared between threads.
+
+        args:
+            file_name: The name of the store to read.
+        """
+        self.file_name = file_name
+        # The mapped file, its index, and where the blocks start
+        self.buffer = None
+        self.index = None
+        self.start = None
+        # Every name key in sorted order, so a key's ID is its position
+        self.names = None
+        # The rosters already loaded, by (team, season)
+        self.cache = {}
+        # Held while loading, so that threads don't see a half loaded store
+        self.lock = Lock()
+
+    def __read(self, offset, length):
+        start = self.start + offset
+        return self.buffer[start:start + length]
+
+    def __load_index(self):
+        with open(self.file_name, "rb") as file_handle:
+            try:
+                buf = mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # Empty files can't be mapped
+                buf = b''
+        if buf[:len(_magic)] != _magic:
+            raise ValueError(self.file_name + " is not a roster store")
+        header_end = len(_magic) + _header.size
+        (length,) = _header.unpack(buf[len(_magic):header_end])
+        self.index = json.loads(buf[header_end:header_end + length].decode("utf-8"))
+        self.start = header_end + length
+        self.buffer = buf
+
+    def __load_names(self):
+        names = self.__read(*self.index["names"]).decode("utf-8")
+        if names:
+            self.names = names.split("\n")
+        else:
+            self.names = []
+
+    def player_id(self, key):
+        """Returns the ID of a name key, or None if it isn't in the store.
+        The table of names must have been loaded by asking for a roster."""
+        i = bisect_left(self.names, key)
+        if i < len(self.names) and self.names[i] == key:
+            return i
+        return None
+
+    def roster(self, team, season):
+        """Returns the players on a team in a season.
+
+        args:
+            team: A team code.
+            season: The season, as an int.
+
+        returns:
+            A Roster.
+
+        raises:
+            KeyError if the store has no roster for the team and season.
+        """
+        key = (team, season)
+        try:
+            return self.cache[key]
+        except KeyError:
+            pass
+        with self.lock:
+            if key in self.cache:
+                return self.cache[key]
+            if self.index is None:
+                self.__load_index()
+            (offset, length) = self.index["rosters"][team][str(season)]
+            if self.names is None:
+                self.__load_names()
+            ids = array(self.index["typecode"])
+            ids.frombytes(self.__read(offset, length))
+            _to_little_endian(ids)
+            roster = Roster(self, ids)
+            self.cache[key] = roster
+        return roster
+
+    def teams(self):
+        """Returns a dictionary mapping each team code to a list of the
+        seasons it has rosters for."""
+        with self.lock:
+            if self.index is None:
+                self.__load_index()
+        return {
+                team: sorted(int(season) for season in seasons)
+                for (team, seasons) in self.index["rosters"].items()
+                }
+
+
+class PlayerSet:
+
+    def __init__(self, roster=()):
+        """The players on a team in one game: a roster, which is shared and
+        not copied, plus the players found in the page that aren't on it.
+        Supports add(), and like a Roster, 'in' with any known spelling of a
+        player, iteration over the name keys, and len().
+
+        args:
+            roster: A Roster, or any container of name keys.
+        """
+        self.roster = roster
+        # The name keys of the players that aren't on the roster
+        self.extra = set()
+
+    def __has_key(self, key):
+        if key in self.extra:
+            return True
+        if isinstance(self.roster, Roster):
+            return self.roster.has_key(key)
+        return key in self.roster
+
+    def add(self, name):
+        """Adds a player."""
+        key = name_key(name)
+        if not self.__has_key(key):
+            self.extra.add(key)
+
+    def __contains__(self, name):
+        if not isinstance(name, str):
+            return False
+        return self.__has_key(name_key(name))
+
+    def __iter__(self):
+        yield from self.roster
+        yield from self.extra
+
+    def __len__(self):
+        return len(self.roster) + len(self.extra)
+
+
+# The store used by get_roster()
+_store = RosterStore()
+
+
+def get_roster(team, season):
+    """Returns the players on a team in a season from the compiled rosters.
+
+    args:
+        team: A team code.
+        season: The season, as an int.
+
+    returns:
+        A Roster.
+
+    raises:
+        KeyError if there is no roster for the team and season.
+    """
+    return _store.roster(team, season)
+
+
+if __name__ == '__main__':
+    # We only need to parse command line flags if running as the main script
+    import argparse
+
+    argparser = argparse.ArgumentParser(
+            description="Compile rosters.py into the roster store the converter reads."
+            )
+    argparser.add_argument(
+            "-o",
+            "--output",
+            help="the file to write (default: " + store_file + ")",
+            default=store_file
+            )
+    args = argparser.parse_args()
+
+    from data_helpers.rosters import rosters
+    write_store(rosters, args.output)
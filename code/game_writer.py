@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+
+import hashlib
+from importlib import import_module
+import json
+from math import isfinite
+from os import makedirs, remove, replace
+from os.path import dirname, normpath
+import re
+
+# The JSON encoders we can write games with. They give identical bytes, but
+# orjson is much faster.
+encoders = ("json", "orjson")
+
+# How every game is written
+json_format = {
+        "sort_keys": True,
+        "indent": 2,
+        "separators": (',', ': '),
+        "ensure_ascii": False,
+        }
+
+# The content hash is the first thing in a written file, as "_version" sorts
+# before the other keys
+_content_hash_regex = re.compile(
+        r'^\{\s*"_version": \{\s*"content": "([0-9a-f]{64})"'
+        )
+
+
+def encoder_available(encoder):
+    """Returns True if the module an encoder needs can be imported.
+
+    raises:
+        ValueError if the encoder is unknown.
+    """
+    if encoder not in encoders:
+        raise ValueError("Unknown encoder '" + encoder + "'")
+    try:
+        import_module(encoder)
+    except ImportError:
+        return False
+    else:
+        return True
+
+
+def default_encoder():
+    """Returns the fastest encoder that is installed."""
+    if encoder_available("orjson"):
+        return "orjson"
+    return "json"
+
+
+def _floats_match(obj):
+    """Returns True if every float in an object is written the same way by
+    json and orjson. They differ for floats that Python writes with an
+    exponent, and for NaN and infinity, which orjson writes as null."""
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        item_type = type(item)
+        if item_type is dict:
+            stack.extend(item.values())
+        elif item_type is list or item_type is tuple:
+            stack.extend(item)
+        elif item_type is float:
+            if item != 0. and not (isfinite(item) and 1e-4 <= abs(item) < 1e16):
+                return False
+    return True
+
+
+def dumps(obj, encoder="json"):
+    """Serializes an object in the format every game is written in, that of
+    json.dumps() with json_format.
+
+    With orjson the output is identical: anything orjson would write
+    differently, such as floats with exponents, integers over 64 bits, or
+    keys that are not strings, is written with json instead.
+
+    args:
+        obj: The object to serialize.
+        encoder: One of the encoders.
+
+    returns:
+        A string.
+
+    raises:
+        ImportError if the encoder is not installed.
+    """
+    if encoder == "orjson" and _floats_match(obj):
+        orjson = import_module("orjson")
+        try:
+            text = orjson.dumps(
+                    obj,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+                    )
+        except TypeError:  # orjson.JSONEncodeError is a TypeError
+            pass
+        else:
+            return text.decode("utf-8")
+    return json.dumps(obj, **json_format)
+
+
+def serialize_game(json_obj, encoder="json"):
+    """Serializes a game, adding the hash of everything but its _version
+    hashes to them as "content". Everything but _version is only serialized
+    once, and the hash of it is what is compared to decide whether a file
+    has changed.
+
+    args:
+        json_obj: The dictionary of a game, as from Converter.json.
+        encoder: One of the encoders.
+
+    returns:
+        A tuple of (text, content_hash).
+    """
+    content = {key: value for (key, value) in json_obj.items() if key != "_version"}
+    content_text = dumps(content, encoder)
+    content_hash = hashlib.sha256(content_text.encode("utf-8")).hexdigest()
+    version = dict(json_obj.get("_version", {}))
+    version["content"] = content_hash
+
+    # When _version sorts first, it can be put in front of the rest
+    if content and min(content) > "_version":
+        version_text = dumps(version, encoder).replace("\n", "\n  ")
+        text = '{\n  "_version": ' + version_text + ",\n" + content_text[2:]
+    else:
+        content["_version"] = version
+        text = dumps(content, encoder)
+    return (text, content_hash)
+
+
+def read_content_hash(file_name, size=512):
+    """Reads the content hash that serialize_game() put in a file, which is
+    near the start of it, without reading the rest.
+
+    args:
+        file_name: A string containing the file to check.
+        size: The number of bytes to read.
+
+    returns:
+        The content hash, "" if the file was written without one, or None if
+            the file can't be read.
+    """
+    try:
+        with open(file_name, "rb") as old_file:
+            head = old_file.read(size)
+    except IOError:
+        return None
+    match = _content_hash_regex.match(head.decode("utf-8", "replace"))
+    if match is None:
+        return ""
+    return match.group(1)
+
+
+def write_game(raw_file, out_file_name, text):
+    """Writes the JSON of a converted game, making its directory if needed.
+    Errors are printed instead of raised.
+
+    args:
+        raw_file: The raw data file the game was converted from.
+        out_file_name: The file to write.
+        text: The serialized JSON.
+
+    returns:
+        True if the file was written, otherwise False.
+    """
+    output_dir = dirname(out_file_name)
+    try:
+        makedirs(output_dir, exist_ok=True)
+    except OSError:
+        err_string = "Failed to make directory '" + output_dir
+        err_string += "'. Skipping file '" + raw_file + "'."
+        print(err_string)
+        return False
+    try:
+        with open(out_file_name, "w") as out_file:
+            out_file.write(text)
+    except IOError:
+        err_string = "Failed to write '" + out_file_name + "'."
+        print(err_string)
+        return False
+    return True
+
+
+def get_bundle_file_name(output_directory, season):
+    """Returns the name of the file a season's bundle is written to."""
+    return normpath("{directory}/{season}.json".format(
+        directory=output_directory, season=season
+        ))
+
+
+class SeasonBundles:
+
+    def __init__(self, output_directory):
+        """Writes games into one file per season, each holding a Seasons
+        Object as described in docs/dataformat.md. Each game is written as
+        soon as it is added, so a season is never held in memory. Bundles are
+        written to temporary files that replace the old ones when they are
+        closed.
+
+        The games are kept in the order they are added, and a bundle is
+        byte for byte what json.dumps() with json_format would give for the
+        season.
+
+        Can be used as a context manager, which closes the bundles, or
+        discards them if there is an exception.
+
+        args:
+            output_directory: The directory to write the bundles to.
+        """
+        self.output_directory = output_directory
+        # The open bundles by season, as (file name, file handle) tuples
+        self.bundles = {}
+        # The seasons whose old bundles are kept, or None for every season
+        self.discarded = set()
+
+    def add(self, season, text):
+        """Adds a game to its season's bundle. Errors are printed instead of
+        raised.
+
+        args:
+            season: The season the game took place in.
+            text: The game, as serialized by serialize_game().
+
+        returns:
+            True if the game was written, otherwise False, including when the
+                season has been discarded.
+        """
+        if self.discarded is None or season in self.discarded:
+            return False
+        # The game is nested two levels down, so each line moves over
+        text = text.replace("\n", "\n    ")
+        if season in self.bundles:
+            (file_name, file_handle) = self.bundles[season]
+            file_handle.write(",\n    " + text)
+            return True
+
+        file_name = get_bundle_file_name(self.output_directory, season)
+        try:
+            makedirs(dirname(file_name), exist_ok=True)
+            file_handle = open(file_name + ".tmp", "w")
+        except OSError:
+            err_string = "Failed to open '" + file_name + "'."
+            print(err_string)
+            return False
+        self.bundles[season] = (file_name, file_handle)
+        file_handle.write('{\n  "games": [\n    ' + text)
+        return True
+
+    def close(self):
+        """Finishes every bundle and moves it into place.
+
+        returns:
+            A list of the files written.
+        """
+        file_names = []
+        for (season, (file_name, file_handle)) in sorted(self.bundles.items()):
+            with file_handle:
+                file_handle.write('\n  ],\n  "season": ' + dumps(season) + "\n}")
+            replace(file_name + ".tmp", file_name)
+            file_names.append(file_name)
+        self.bundles = {}
+        return file_names
+
+    def discard(self, season=None):
+        """Removes the unfinished bundle of a season, leaving the old one, for
+        example because one of its games failed to convert. Games added for
+        the season afterwards are dropped too, so close() never writes a
+        season that is missing games.
+
+        args:
+            season: The season to discard, or None to discard every season.
+        """
+        if season is None:
+            seasons = list(self.bundles)
+            self.discarded = None
+        else:
+            seasons = [season] if season in self.bundles else []
+            if self.discarded is not None:
+                self.discarded.add(season)
+        for season in seasons:
+            (file_name, file_handle) = self.bundles.pop(season)
+            file_handle.close()
+            remove(file_name + ".tmp")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+
+from os import devnull
+from os.path import dirname, isdir, isfile, join, realpath
+import re
+from subprocess import check_output, CalledProcessError
+
+_hash_regex = re.compile(r"^[0-9a-f]{40}([0-9a-f]{24})?$")
+
+
+def find_git_dir(directory):
+    """Finds the git directory of the repository a directory is in, looking
+    in its parents as git does.
+
+    args:
+        directory: A string containing the name of a directory.
+
+    returns:
+        The path of the git directory, or None if there isn't one. For
+            worktrees and submodules, where .git is a file pointing at the
+            real git directory, that directory is returned.
+    """
+    directory = realpath(directory)
+    while True:
+        dot_git = join(directory, ".git")
+        if isdir(dot_git):
+            return dot_git
+        if isfile(dot_git):
+            with open(dot_git, "r") as file_handle:
+                line = file_handle.readline().strip()
+            if line.startswith("gitdir:"):
+                return realpath(join(directory, line[len("gitdir:"):].strip()))
+            return None
+        parent = dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+
+def _read_ref(git_dir, ref):
+    """Returns the hash a ref points to, from its loose file or from
+    packed-refs, or None if it can't be found."""
+    # Worktrees keep their HEAD but share the refs of the main repository
+    common_dir = git_dir
+    if isfile(join(git_dir, "commondir")):
+        with open(join(git_dir, "commondir"), "r") as file_handle:
+            common_dir = realpath(join(git_dir, file_handle.read().strip()))
+    for base in (git_dir, common_dir):
+        try:
+            with open(join(base, ref), "r") as file_handle:
+                return file_handle.read().strip()
+        except OSError:
+            pass
+    try:
+        with open(join(common_dir, "packed-refs"), "r") as file_handle:
+            for line in file_handle:
+                # Skip the header and the peeled tags
+                if line.startswith(("#", "^")):
+                    continue
+                (ref_hash, _, name) = line.strip().partition(" ")
+                if name == ref:
+                    return ref_hash
+    except OSError:
+        pass
+    return None
+
+
+def read_head(git_dir):
+    """Reads the commit that HEAD points to straight from a git directory,
+    without running git.
+
+    args:
+        git_dir: The path of a git directory, as from find_git_dir().
+
+    returns:
+        The commit hash, or None if it can't be read, for example in an
+            empty repository or one whose refs are stored in a format we
+            don't read.
+    """
+    try:
+        with open(join(git_dir, "HEAD"), "r") as file_handle:
+            head = file_handle.read().strip()
+    except OSError:
+        return None
+    if head.startswith("ref:"):
+        head = _read_ref(git_dir, head[len("ref:"):].strip())
+    if head is not None and _hash_regex.match(head):
+        return head
+    return None
+
+
+def _run_git(directory):
+    """Asks git for the commit HEAD points to in a directory, returning
+    "unknown" if that fails."""
+    try:
+        with open(devnull, "w") as fnull:
+            version = check_output(
+                    ['git', 'rev-parse', 'HEAD'],
+                    cwd=directory,
+                    stderr=fnull
+                    )
+    except (CalledProcessError, OSError):
+        return "unknown"
+    return version.decode("utf-8").strip()
+
+
+class GitVersions:
+
+    def __init__(self):
+        """Finds the latest commit of the git repositories that directories
+        are in, remembering each directory's so that git is only looked at
+        once per directory. It can be shared between threads, which at worst
+        both look up the same directory.
+        """
+        self.cache = {}
+
+    def version(self, directory):
+        """Returns the commit hash that HEAD points to in the repository a
+        directory is in. The git directory is read directly, and git is only
+        run if that fails.
+
+        args:
+            directory: A string containing the name of a directory.
+
+        returns:
+            The commit hash, or "unknown" if the directory is not in a git
+                repository or can't be read.
+        """
+        directory = realpath(directory)
+        try:
+            return self.cache[directory]
+        except KeyError:
+            pass
+        version = None
+        if isdir(directory):
+            git_dir = find_git_dir(directory)
+            if git_dir is not None:
+                version = read_head(git_dir)
+                if version is None:
+                    version = _run_git(directory)
+        if version is None:
+            version = "unknown"
+        self.cache[directory] = version
+        return version
+
+
+# The versions used by get_git_version()
+_versions = GitVersions()
+
+
+def get_git_version(directory):
+    """Returns the commit hash that HEAD points to in the repository a
+    directory is in, or "unknown", as GitVersions.version() does. Each
+    directory is only looked up once per process."""
+    return _versions.version(directory)
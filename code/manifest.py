@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+
+import hashlib
+import json
+from os import replace, stat
+from os.path import abspath, exists
+
+# Changing the layout of the manifest drops every entry in old ones
+manifest_version = 1
+
+
+def hash_file(file_name, chunk_size=1 << 20):
+    """Returns the SHA-256 hex digest of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(file_name, "rb") as file_handle:
+        for chunk in iter(lambda: file_handle.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class Manifest:
+
+    def __init__(self, file_name, parser_version, settings=None):
+        """A record of the raw data files that have been converted: for each,
+        its size, modification time and content hash, the version of the
+        parser that converted it, and the file its output was written to. A
+        raw file is current, and need not be converted again, when its bytes
+        and the parser version match and its output still exists.
+
+        A missing or unreadable manifest is treated as empty, so it is rebuilt
+        from scratch.
+
+        args:
+            file_name: The file the manifest is kept in.
+            parser_version: The version of the parser converting files now.
+                Nothing is current if it is "unknown".
+            settings: Anything else that changes the output, such as the
+                output directory. Entries made with other settings are
+                dropped.
+        """
+        self.file_name = file_name
+        self.parser_version = parser_version
+        self.settings = settings
+        # Fingerprints of the files being converted, until they are recorded
+        self.pending = {}
+        self.files = {}
+        try:
+            with open(file_name, "r") as file_handle:
+                old = json.load(file_handle)
+        except (IOError, ValueError):
+            return
+        if isinstance(old, dict) \
+        and old.get("version") == manifest_version \
+        and old.get("settings") == settings:
+            self.files = old.get("files", {})
+
+    def is_current(self, raw_file, data=None):
+        """Checks whether a raw file has already been converted. A plain file
+        whose size and modification time are unchanged is not read at all.
+
+        args:
+            raw_file: The name of the raw data file.
+            data: The bytes of the file, for members of archives, which have
+                no modification time of their own.
+
+        returns:
+            The name of the output file if the raw file is current, otherwise
+                None.
+        """
+        key = abspath(raw_file)
+        entry = self.files.get(key)
+        if data is None:
+            # Files that can't be read are left for the converter to report
+            try:
+                info = stat(raw_file)
+            except OSError:
+                return None
+            fingerprint = {"size": info.st_size, "mtime_ns": info.st_mtime_ns}
+        else:
+            fingerprint = {"size": len(data), "mtime_ns": None}
+
+        usable = entry is not None \
+            and self.parser_version != "unknown" \
+            and entry["parser"] == self.parser_version \
+            and exists(entry["output"])
+        if usable and data is None \
+        and entry["size"] == fingerprint["size"] \
+        and entry["mtime_ns"] == fingerprint["mtime_ns"]:
+            fingerprint["sha256"] = entry["sha256"]
+            self.pending[key] = fingerprint
+            return entry["output"]
+
+        # The file might have been touched without changing, so check its
+        # contents
+        if data is None:
+            try:
+                fingerprint["sha256"] = hash_file(raw_file)
+            except OSError:
+                return None
+        else:
+            fingerprint["sha256"] = hashlib.sha256(data).hexdigest()
+        self.pending[key] = fingerprint
+        if usable and entry["sha256"] == fingerprint["sha256"]:
+            return entry["output"]
+        return None
+
+    def record(self, raw_file, out_file_name):
+        """Records that a raw file checked with is_current() has been
+        converted to out_file_name by the current parser."""
+        key = abspath(raw_file)
+        fingerprint = self.pending.pop(key, None)
+        if fingerprint is None:
+            return
+        entry = dict(fingerprint)
+        entry["parser"] = self.parser_version
+        entry["output"] = abspath(out_file_name)
+        self.files[key] = entry
+
+    def forget(self, raw_file):
+        """Removes a raw file, for example because it failed to convert."""
+        key = abspath(raw_file)
+        self.pending.pop(key, None)
+        self.files.pop(key, None)
+
+    def save(self):
+        """Writes the manifest. A temporary file is written and moved into
+        place, so an interrupted save leaves the old manifest intact."""
+        manifest = {
+                "version": manifest_version,
+                "settings": self.settings,
+                "files": self.files,
+                }
+        tmp_file_name = self.file_name + ".tmp"
+        with open(tmp_file_name, "w") as file_handle:
+            json.dump(manifest, file_handle, sort_keys=True, indent=0)
+        replace(tmp_file_name, self.file_name)
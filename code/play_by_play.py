@@ -1,57 +1,124 @@
 #!/usr/bin/env python3
 
 import json
-from copy import deepcopy
-from bs4 import BeautifulSoup, SoupStrainer
 
-from raw_data_parsers.play_by_play.general import row_type, get_kicking_offense
-from raw_data_parsers.play_by_play.penalty import split_penalties, get_penalty_team, get_penalty_player, get_penalty_yards, get_penalty_type, get_penalty_name
-from raw_data_parsers.play_by_play.play import get_play_type, get_scoring_type
+from raw_data_parsers.play_by_play.attribution import TeamIndex
+from raw_data_parsers.play_by_play.classifier import classify_play
+from raw_data_parsers.play_by_play.general import play_row_type, get_indexed_kicking_offense
+from raw_data_parsers.play_by_play.penalty import parse_penalty, get_parsed_penalty_team, get_parsed_penalty_player
 from raw_data_parsers.play_by_play.state import convert_int, convert_quarter, convert_game_clock, convert_field_position
-from raw_data_parsers.play_by_play.turnover import split_turnovers, get_turnover_type, get_turnover_recoverer, get_turnover_committer, get_turnover_teams
-from raw_data_parsers.play_by_play.sanitizer import remove_challenge
+from raw_data_parsers.play_by_play.turnover import parse_turnover, get_parsed_turnover_teams
+
+
+class PlayInfo:
+
+    # Slots make the state small and quick to copy, as it is copied after
+    # every row
+    __slots__ = (
+            "time",
+            "quarter",
+            "offense",
+            "home_score",
+            "away_score",
+            "description",
+            "type",
+            "number"
+            )
+
+    def __init__(
+            self,
+            time=0,
+            quarter=1,
+            offense=None,
+            home_score=0,
+            away_score=0,
+            description='',
+            type=None,
+            number=-1
+            ):
+        """The state of the game after a play, which the next play builds on.
+
+        args:
+            time: The game clock, in seconds since the start of the game.
+            quarter: The quarter, with overtimes numbered from 5.
+            offense: The team with the ball, "home" or "away", or None.
+            home_score, away_score: The score of the home and away team,
+                respectively.
+            description: The sanitized description of the play.
+            type: The play type, as returned by get_play_type().
+            number: The number of the play, starting from 0.
+        """
+        self.time = time
+        self.quarter = quarter
+        self.offense = offense
+        self.home_score = home_score
+        self.away_score = away_score
+        self.description = description
+        self.type = type
+        self.number = number
+
+    def copy(self):
+        """Returns a copy of the state. All the values are immutable, so this
+        is as good as a deep copy."""
+        return PlayInfo(
+                self.time,
+                self.quarter,
+                self.offense,
+                self.home_score,
+                self.away_score,
+                self.description,
+                self.type,
+                self.number
+                )
 
 
 class PlayByPlay:
 
-    def __init__(self, soup, season, home_team, away_team, home_players, away_players):
-        """Given a BeautifulSoup, parses the play-by-play data.
+    def __init__(
+            self,
+            rows,
+            season,
+            home_team,
+            away_team,
+            home_players,
+            away_players,
+            parse=True
+            ):
+        """Given the rows of the play-by-play table, parses the play-by-play
+        data into self.json.
 
         args:
-            file_name: A string containing the name of a file to open
+            rows: An iterable of PlayRows (see raw_data_readers.play_rows),
+                one for each row of the table.
+            season: The season the game took place in.
+            home_team, away_team: The team code for the home and away team,
+                respectively.
+            home_players, away_players: Containers that support 'in' holding
+                all players on the home and away team, respectively.
+            parse: If true, all the plays are parsed now. Otherwise nothing is
+                parsed until plays() is iterated over.
         """
         # Save input variables
-        self.soup = soup
+        self.rows = rows
         self.season = int(season)
         self.home = home_team
         self.away = away_team
-        self.home_players = frozenset(home_players)
-        self.away_players = frozenset(away_players)
+        # Which team every player and team code belongs to
+        self.team_index = TeamIndex(
+                home_team,
+                away_team,
+                home_players,
+                away_players
+                )
         # Initialize the list to convert to JSON
         self.json = []
-        self.last_play_info = {
-                "time": 0,
-                "quarter": 1,
-                "offense": None,
-                "home score": 0,
-                "away score": 0,
-                "description": '',
-                "type": None,
-                "number": -1
-                }
-        self.current_play_info = {
-                "time": 0,
-                "quarter": 1,
-                "offense": None,
-                "home score": 0,
-                "away score": 0,
-                "description": '',
-                "type": None,
-                "number": -1
-                }
+        self.last_play_info = PlayInfo()
+        self.current_play_info = PlayInfo()
         self.is_pchange = False
         self.is_scoring = False
         self.is_penalty = False
+        # The classification of the current play's description
+        self.classification = None
 
         # Some years consider the possessing team on a kick off to be the
         # kicking team; this means that they set the "pos_change" flag in the
@@ -59,23 +126,53 @@ class PlayByPlay:
         self.kick_offense_years = {1999, 2013}
 
         # Parse the plays
-        self.__parse_play()
-
-    def __parse_play(self):
-        """ Set up the team stats dictionaries and add it to self.json """
-        soup = self.soup
-        # Find each row of the table
-        rows = soup.find_all("tr")
-        for row in rows:
+        if parse:
+            self.json.extend(self.plays())
+
+    @classmethod
+    def iter_plays(
+            cls,
+            rows,
+            season,
+            home_team,
+            away_team,
+            home_players,
+            away_players
+            ):
+        """Given the rows of the play-by-play table, yields the dictionary for
+        each play as soon as it is parsed, without keeping them.
+
+        args:
+            The same as for PlayByPlay().
+
+        returns:
+            A generator of play dictionaries, as found in PlayByPlay().json.
+        """
+        pbp = cls(
+                rows,
+                season,
+                home_team,
+                away_team,
+                home_players,
+                away_players,
+                parse=False
+                )
+        return pbp.plays()
+
+    def plays(self):
+        """ A generator that parses the rows, yielding the dictionary for each
+        play once it is finished. The rows are read as they are needed, and
+        can only be parsed once. """
+        for row in self.rows:
             # Deal with the different row types
-            r_type = row_type(row.get_text(' ', strip=True))
+            r_type = play_row_type(row)
             # When setting the quarter, we need a special case to handle
             # overtimes after the first
-            if r_type == 5 and self.last_play_info["quarter"] >= 5:
-                self.current_play_info["quarter"] = self.last_play_info["quarter"] + 1
+            if r_type == 5 and self.last_play_info.quarter >= 5:
+                self.current_play_info.quarter = self.last_play_info.quarter + 1
             # Skip all other special rows
             if r_type != 0:  # 0 indicates a normal row
-                self.last_play_info = deepcopy(self.current_play_info)
+                self.last_play_info = self.current_play_info.copy()
                 continue
 
             # Set the play class, which is used to indicate scores, turnovers,
@@ -83,32 +180,33 @@ class PlayByPlay:
             self.__set_class(row)
 
             # Find each column of the table
-            cols = row.find_all("td")
+            cols = row.cells
             if cols:  # This if removes the header
                 pbp_dict = {}
                 # Set the number of the play first, so that if a play fails to
                 # parse, we have a gap in the numbering to help us detect it
-                self.current_play_info["number"] = self.last_play_info["number"] + 1
-                pbp_dict["number"] = self.current_play_info["number"]
+                self.current_play_info.number = self.last_play_info.number + 1
+                pbp_dict["number"] = self.current_play_info.number
 
                 # Extract the plain text description and store it, because it
                 # is used so often
-                description = cols[5].get_text(' ', strip=True).replace('\n', ' ')
-                # Sanitize replay challenges that they only the final result is used
-                sanitized_description = remove_challenge(description)
-                self.current_play_info["description"] = sanitized_description
+                description = cols[5].replace('\n', ' ')
+                # Classify the play in one go; this also sanitizes replay
+                # challenges so that only the final result is used
+                self.classification = classify_play(description)
+                self.current_play_info.description = self.classification["description"]
 
                 # Assign offense
                 # We correct the 1999, 2013 kick offs when setting is_pchange
                 if self.is_pchange:
                     # For change of possession, we change the team with the
                     # ball
-                    if self.last_play_info["offense"] == "home":
-                        self.current_play_info["offense"] = "away"
+                    if self.last_play_info.offense == "home":
+                        self.current_play_info.offense = "away"
                     else:
-                        self.current_play_info["offense"] = "home"
+                        self.current_play_info.offense = "home"
                 else:
-                    self.current_play_info["offense"] = self.last_play_info["offense"]
+                    self.current_play_info.offense = self.last_play_info.offense
 
                 # Set current score
                 pbp_dict["score"] = self.__set_score(cols)
@@ -118,25 +216,22 @@ class PlayByPlay:
 
                 # Sometimes there are blank plays
                 if pbp_dict["play"]["type"] is None:
-                    self.last_play_info = deepcopy(self.current_play_info)
+                    self.last_play_info = self.current_play_info.copy()
                     continue
 
                 # On a kickoff, we make sure we have the team right
                 if pbp_dict["play"]["type"] in {"kick off", "onside kick"}:
-                    kick_text = cols[4].get_text(' ', strip=True).replace('\n', ' ')
-                    kick_team = get_kicking_offense(
+                    kick_text = cols[4].replace('\n', ' ')
+                    kick_team = get_indexed_kicking_offense(
                             kick_text,
-                            self.current_play_info["description"],
-                            self.home,
-                            self.away,
-                            self.home_players,
-                            self.away_players
+                            self.current_play_info.description,
+                            self.team_index
                             )
                     if kick_team in ["home", "away"]:
-                        self.current_play_info["offense"] = kick_team
+                        self.current_play_info.offense = kick_team
                     else:  # Assume the last team with the ball is kicking
-                        flipped_team = self.__flip(self.last_play_info["offense"])
-                        self.current_play_info["offense"] = flipped_team
+                        flipped_team = self.__flip(self.last_play_info.offense)
+                        self.current_play_info.offense = flipped_team
 
                 # Set penalty
                 if self.is_penalty:
@@ -147,21 +242,21 @@ class PlayByPlay:
                 turnovers = self.__set_turnover()
                 if turnovers:
                     pbp_dict["turnovers"] = turnovers
-                self.json.append(pbp_dict)
 
                 # Set last play info to current play info
-                self.last_play_info = deepcopy(self.current_play_info)
+                self.last_play_info = self.current_play_info.copy()
+                yield pbp_dict
                 #print(json.dumps(pbp_dict, sort_keys=True, indent=2, separators=(',', ': ')))
 
     def __set_class(self, row):
-        """ Takes a BS4 row and extracts the class, using it to set internal
+        """ Takes a PlayRow and extracts the class, using it to set internal
         variables.
 
         returns:
             Nothing, but sets self.is_scoring, self.is_penalty,
             self.is_pchange.
         """
-        row_class = row["class"]
+        row_class = row.classes
         self.is_scoring = ("is_scoring" in row_class)
         self.is_penalty = ("has_penalty" in row_class)
         # In some years the raw data considers the kicking team as the offense;
@@ -169,14 +264,14 @@ class PlayByPlay:
         # "pos_change" flag to signal onside kicks, so no special handling is
         # needed.
         if self.season in self.kick_offense_years \
-        and self.last_play_info["type"] in {"kick off", "onside kick"}:
+        and self.last_play_info.type in {"kick off", "onside kick"}:
             # The 'not' is required because if a kick off results in a turn
             # over, the "pos_change" flag isn't set, as the kicking team still
             # has the ball (and was considered the offense).
             self.is_pchange = not ("pos_change" in row_class)
         # Other years follow our definition of offense, although they fail to
         # do so correctly for onside kicks
-        elif self.last_play_info["type"] != "onside kick":
+        elif self.last_play_info.type != "onside kick":
             self.is_pchange = ("pos_change" in row_class)
         # Onside kick in 2000–2012
         else:
@@ -186,14 +281,14 @@ class PlayByPlay:
             # otherwise they give no indication. Therefore we set the correct
             # flag by hand; True if the kicking team recovered (because the
             # offense is the receiving team), False otherwise.
-            last_desc = self.last_play_info["description"]
+            last_desc = self.last_play_info.description
             if "onside kick successful" in last_desc:
                 self.is_pchange = True
             else:
                 self.is_pchange = False
 
     def __set_state(self, cols):
-        """ Takes a list of columns from an HTML table and sets the "state"
+        """ Takes a list of column texts from an HTML table and sets the "state"
         dictionary for the play.
 
         returns:
@@ -204,33 +299,33 @@ class PlayByPlay:
         state = {}
 
         # Down
-        down = convert_int(cols[2].get_text(strip=True))
+        down = convert_int(cols[2])
         if down is not None:
             state["down"] = down
 
         # Quarter (Used to set the time, also set in the __parse_play())
-        if self.current_play_info["quarter"] < 5:
-            quarter = convert_quarter(cols[0].get_text(strip=True))
-            self.current_play_info["quarter"] = quarter
+        if self.current_play_info.quarter < 5:
+            quarter = convert_quarter(cols[0])
+            self.current_play_info.quarter = quarter
         else:
-            quarter = self.current_play_info["quarter"]
+            quarter = self.current_play_info.quarter
 
         # Time
-        time_string = cols[1].get_text(strip=True)
+        time_string = cols[1]
         time = convert_game_clock(time_string, quarter)
         if time is not None:
-            self.current_play_info["time"] = time
+            self.current_play_info.time = time
         else:
-            time = self.last_play_info["time"]
+            time = self.last_play_info.time
         state["time"] = time
 
         # Yards to go
-        ytfd = convert_int(cols[3].get_text(strip=True))
+        ytfd = convert_int(cols[3])
         if ytfd is not None:
             state["yards to first down"] = ytfd
 
         # Offense
-        state["offense"] = self.current_play_info["offense"]
+        state["offense"] = self.current_play_info.offense
 
         # Yards to goal
         offense = state["offense"]
@@ -238,14 +333,14 @@ class PlayByPlay:
             team_code = self.home
         else:
             team_code = self.away
-        ytg = convert_field_position(cols[4].get_text(strip=True), team_code)
+        ytg = convert_field_position(cols[4], team_code)
         if ytg is not None:
             state["yards to goal"] = ytg
 
         return state
 
     def __set_score(self, cols):
-        """ Takes a list of columns from an HTML table and sets the "score"
+        """ Takes a list of column texts from an HTML table and sets the "score"
         dictionary for the play.
 
         returns:
@@ -253,19 +348,19 @@ class PlayByPlay:
                 { "home": 7, "away": 14 }
         """
         score = {}
-        score["away"] = int(cols[6].get_text(strip=True))
-        self.current_play_info["away score"] = score["away"]
-        score["home"] = int(cols[7].get_text(strip=True))
-        self.current_play_info["home score"] = score["home"]
+        score["away"] = int(cols[6])
+        self.current_play_info.away_score = score["away"]
+        score["home"] = int(cols[7])
+        self.current_play_info.home_score = score["home"]
 
         return score
 
     def __set_play(self, cols):
-        """ Takes a list of columns from an HTML table and sets the "play"
+        """ Takes a list of column texts from an HTML table and sets the "play"
         dictionary for the play.
 
         args:
-            cols: BS4 columns.
+            cols: A list of the text in each column.
 
         returns:
             A score dictionary with the following fields:
@@ -275,21 +370,27 @@ class PlayByPlay:
         play = {}
 
         # Set the type
-        play["type"] = get_play_type(self.current_play_info["description"])
-        self.current_play_info["type"] = play["type"]
+        play["type"] = self.classification["type"]
+        self.current_play_info.type = play["type"]
+        if play["type"] is None:
+            out = "\tUnmatched play type! '" + self.current_play_info.description.lower() + "'"
+            print(out)
 
         if not self.is_scoring:
             return play
         else:
             play["scoring"] = {}
-            play["scoring"]["type"] = get_scoring_type(self.current_play_info["description"])
+            play["scoring"]["type"] = self.classification["scoring"]
+            if play["scoring"]["type"] is None:
+                out = "\tUnmatched Score type! '" + self.current_play_info.description.lower() + "'"
+                print(out)
 
             # Assign team based on how the score changed
-            home_scored = self.current_play_info["home score"] - self.last_play_info["home score"]
+            home_scored = self.current_play_info.home_score - self.last_play_info.home_score
             if home_scored:
                 play["scoring"]["team"] = "home"
 
-            away_scored = self.current_play_info["away score"] - self.last_play_info["away score"]
+            away_scored = self.current_play_info.away_score - self.last_play_info.away_score
             if away_scored:
                 play["scoring"]["team"] = "away"
 
@@ -305,18 +406,16 @@ class PlayByPlay:
                 "away" }, ...]
         """
         turnovers = []
-        turnover = {}
 
-        for turn_string in split_turnovers(self.current_play_info["description"]):
-            t = deepcopy(turnover)
+        description = self.current_play_info.description
+        for (start, end) in self.classification["turnovers"]:
+            turn_string = description[start:end]
+            turnover = parse_turnover(turn_string)
+            t = {}
             # Set the name of the penalty
-            t["type"] = get_turnover_type(turn_string)
+            t["type"] = turnover["type"]
             # Set the teams
-            (com, rec) = get_turnover_teams(
-                    turn_string,
-                    self.home_players,
-                    self.away_players
-                    )
+            (com, rec) = get_parsed_turnover_teams(turnover, self.team_index)
             if com:
                 t["by"] = com
             if rec:
@@ -345,36 +444,34 @@ class PlayByPlay:
         # marker for the previous play and the current play. However, this
         # doesn't work if we have multiple penalties.
         no_play = False
-        for pen_string in split_penalties(self.current_play_info["description"]):
+        description = self.current_play_info.description
+        for (start, end) in self.classification["penalties"]:
+            pen_string = description[start:end]
+            penalty = parse_penalty(pen_string)
             p = {}
             # Set the name of the penalty
-            p["name"] = get_penalty_name(pen_string)
+            p["name"] = penalty["name"]
             # Set the yardage
-            yards = get_penalty_yards(pen_string)
-            if yards:
-                p["yards"] = yards
+            if penalty["yards"]:
+                p["yards"] = penalty["yards"]
             # Set the offending player
-            p["offender"] = get_penalty_player(
-                    pen_string,
+            p["offender"] = get_parsed_penalty_player(
+                    penalty,
                     self.home,
                     self.away
                     )
             # Set the team
-            p["team"] = get_penalty_team(
-                    pen_string,
-                    self.current_play_info["offense"],
-                    self.home,
-                    self.away,
-                    self.home_players,
-                    self.away_players
+            p["team"] = get_parsed_penalty_team(
+                    penalty,
+                    self.current_play_info.offense,
+                    self.team_index
                     )
             # Get type info
-            p_type = get_penalty_type(pen_string)
-            if p_type == "declined":
+            if penalty["type"] == "declined":
                 p["accepted"] = False
             else:
                 p["accepted"] = True
-                if p_type == "no play":
+                if penalty["type"] == "no play":
                     no_play = True
 
             # Fill in the full dictionary
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+from data_helpers.team_list import pfr_codes_to_code
+
+
+class TeamIndex:
+
+    def __init__(self, home_team, away_team, home_players, away_players):
+        """Maps every name a play can credit, players as well as team codes
+        and PFR codes, to the team it belongs to. Each name's team is worked
+        out the first time it is looked up and remembered for the rest of the
+        game, so after that it is found with a single lookup.
+
+        args:
+            home_team, away_team: The team code for the home and away team,
+                respectively.
+            home_players, away_players: Containers that support 'in' holding
+                all players on the home and away team, respectively. They are
+                not copied.
+        """
+        self.home = home_team
+        self.away = away_team
+        self.home_players = home_players
+        self.away_players = away_players
+        # The team of each name looked up so far. Team codes win over
+        # players, so they go in first.
+        self.teams = {away_team: "away", home_team: "home"}
+        # Players win over PFR codes, so these are only used for names on
+        # neither team
+        self.pfr_teams = {}
+        for (pfr_code, code) in pfr_codes_to_code.items():
+            if code == home_team:
+                self.pfr_teams[pfr_code] = "home"
+            elif code == away_team:
+                self.pfr_teams[pfr_code] = "away"
+        # The ambiguous names that have been reported
+        self.reported = set()
+
+    def team(self, name):
+        """Returns the team of a name.
+
+        The first time a name on both teams is looked up, it is reported as a
+        degenerate player.
+
+        args:
+            name: A player's name, a team code, or a PFR code.
+
+        returns:
+            "home", "away", "ambiguous" if the name is on both teams, or None
+                if the name is not known.
+        """
+        try:
+            team = self.teams[name]
+        except KeyError:
+            is_home = (name in self.home_players)
+            is_away = (name in self.away_players)
+            if is_home and is_away:
+                team = "ambiguous"
+            elif is_home:
+                team = "home"
+            elif is_away:
+                team = "away"
+            else:
+                team = self.pfr_teams.get(name)
+            self.teams[name] = team
+        if team == "ambiguous" and name not in self.reported:
+            self.reported.add(name)
+            print("\tDEGENERATE PLAYER!", name, self.away, 'at', self.home)
+        return team
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+from raw_data_parsers.play_by_play.play import match_play_type, match_scoring_type
+from raw_data_parsers.play_by_play.sanitizer import get_challenge_type, remove_challenge
+from raw_data_parsers.play_by_play.turnover import iter_turnover_delimiters
+
+
+def _has_turnover(lower_item):
+    """Returns True if a lower case item of split_turnovers() would be kept as
+    a turnover."""
+    return "fumble" in lower_item \
+        or "intercepted" in lower_item \
+        or "muffed" in lower_item
+
+
+def get_penalty_spans(col):
+    """Takes a string describing the play, and returns where each of the
+    strings returned by split_penalties() is in it.
+
+    args:
+        col: A string describing the play.
+
+    returns:
+        A list of (start, end) tuples, such that col[start:end] is each
+            penalty string.
+    """
+    start = col.find("Penalty on")
+    if start == -1:
+        return []
+    starts = []
+    while start != -1:
+        starts.append(start)
+        start = col.find("Penalty on", start + len("Penalty on"))
+    ends = starts[1:] + [len(col)]
+    return list(zip(starts, ends))
+
+
+def get_turnover_spans(col, lower_col=None):
+    """Takes a string describing the play, and returns where each of the
+    strings returned by split_turnovers() is in it.
+
+    args:
+        col: A string describing the play.
+        lower_col: col.lower(), if it has already been made.
+
+    returns:
+        A list of (start, end) tuples, such that col[start:end] is each
+            turnover string.
+    """
+    if lower_col is None:
+        lower_col = col.lower()
+    # Most plays have no turnover, and then there's no need to split
+    if not _has_turnover(lower_col):
+        return []
+    # re.split() returns the text between each delimiter, along with the
+    # groups in each delimiter that matched
+    items = []
+    end = 0
+    for (start, next_end, groups) in iter_turnover_delimiters(col):
+        items.append((end, start))
+        items.extend(span for span in groups if span is not None)
+        end = next_end
+    items.append((end, len(col)))
+
+    spans = []
+    for (start, end) in items:
+        item = col[start:end]
+        if _has_turnover(item.lower()):
+            # Find the stripped item
+            stripped = item.lstrip()
+            start += len(item) - len(stripped)
+            spans.append((start, start + len(stripped.rstrip())))
+    return spans
+
+
+def classify_play(description):
+    """Takes a string describing the play and finds everything the separate
+    play parsing functions would, lower casing it and searching it for each
+    thing only once.
+
+    args:
+        description: A string describing the play.
+
+    returns:
+        A dictionary with the following fields:
+            "challenge": As returned by get_challenge_type().
+            "description": The description with any challenge removed, as
+                returned by remove_challenge().
+            "type": As returned by get_play_type(), but without printing a
+                warning if there is no match.
+            "scoring": As returned by get_scoring_type(), but without printing
+                a warning if there is no match.
+            "penalties": A list of (start, end) spans of the penalty strings
+                in the sanitized description, as from get_penalty_spans().
+            "turnovers": A list of (start, end) spans of the turnover strings
+                in the sanitized description, as from get_turnover_spans().
+
+    raises:
+        IndexError if an overturned challenge can't be removed, as
+            remove_challenge() does.
+    """
+    challenge = get_challenge_type(description)
+    if challenge:
+        text = remove_challenge(description)
+    else:
+        text = description
+    lower_text = text.lower()
+
+    return {
+            "challenge": challenge,
+            "description": text,
+            "type": match_play_type(lower_text),
+            "scoring": match_scoring_type(lower_text),
+            "penalties": get_penalty_spans(text),
+            "turnovers": get_turnover_spans(text, lower_text),
+            }
@@ -39,6 +39,45 @@ def row_type(row):
         return 0
 
 
+# The number of columns in a row of the play-by-play table that describes a
+# play: quarter, time, down, to go, location, detail, and the two scores
+play_columns = 8
+
+
+def play_row_type(row):
+    """Takes a row of the play-by-play table and returns the type, as
+    row_type() does. A row with a cell for every column, and that isn't a
+    header, is a play; only the text of the other rows is looked at. This is
+    faster than joining the text of every row, and means plays that mention,
+    for example, an "End Around" are not taken to be the end of the game.
+
+    args:
+        row: A PlayRow (see raw_data_readers.play_rows).
+
+    returns:
+        An integer indicating the type of row, as returned by row_type().
+    """
+    is_header = row.classes is not None and "thead" in row.classes
+    if len(row.cells) >= play_columns and not is_header:
+        return 0
+    return row_type(row.text)
+
+
+def _get_position_offense(pfr_code, home_team, away_team):
+    """Returns the offense on a kickoff from the PFR code of the side of the
+    field it was kicked from."""
+    code = pfr_codes_to_code[pfr_code]
+    # Remember, if the "home" team is kicking, the "away" team is on
+    # offense
+    if code == home_team:
+        return "away"
+    elif code == away_team:
+        return "home"
+    else:
+        print("UNKNOWN KICKING TEAM", code, away_team, "at", home_team)
+        return None
+
+
 def get_kicking_offense(
         kick_text,
         play_text,
@@ -69,16 +108,7 @@ def get_kicking_offense(
     # sometimes this isn't provided (often because of a penalty on the
     # kickoff).
     if split_cols:
-        code = pfr_codes_to_code[split_cols[0]]
-        # Remember, if the "home" team is kicking, the "away" team is on
-        # offense
-        if code == home_team:
-            return "away"
-        elif code == away_team:
-            return "home"
-        else:
-            print("UNKNOWN KICKING TEAM", code, away_team, "at", home_team)
-            return None
+        return _get_position_offense(split_cols[0], home_team, away_team)
     # We now fall back to using the description of the play and looking at the
     # kicker
     else:
@@ -95,3 +125,38 @@ def get_kicking_offense(
         else:
             print("\tUNKNOWN KICKER!", kicker, away_team, 'at', home_team)
             return None
+
+
+def get_indexed_kicking_offense(kick_text, play_text, team_index):
+    """Takes a field position, a string describing the play, and the index of
+    the teams, and returns the offense on a kickoff, as get_kicking_offense()
+    does, except that a kicker on both teams is only reported the first time.
+
+    args:
+        kick_text: A string giving the field position.
+        play_text: A string giving a description of the play.
+        team_index: A TeamIndex for the game.
+
+    returns:
+        A string of "home" or "away", or None.
+
+    raises:
+        KeyError if the team codes don't exist.
+    """
+    split_cols = kick_text.split()
+    if split_cols:
+        return _get_position_offense(
+                split_cols[0],
+                team_index.home,
+                team_index.away
+                )
+    kicker = play_text.split("kicks")[0].strip()
+    team = team_index.team(kicker)
+    # The kicking team is on defense
+    if team == "home":
+        return "away"
+    elif team == "away":
+        return "home"
+    elif team is None:
+        print("\tUNKNOWN KICKER!", kicker, team_index.away, 'at', team_index.home)
+    return None
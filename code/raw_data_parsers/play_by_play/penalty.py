@@ -43,42 +43,41 @@ def split_penalties(col):
     return out_list
 
 
-def get_penalty_team(
-        penalty_string,
-        off_team,
+def _get_penalty_side(lower_string, lower_name):
+    """Returns "offense" or "defense" if the penalty can only be committed by
+    one side, otherwise None.
+
+    args:
+        lower_string: The lower cased penalty string.
+        lower_name: The lower cased penalty name.
+    """
+    if "offensive" in lower_string or lower_name in offense_penalties:
+        return "offense"
+    elif "defensive" in lower_string or lower_name in defense_penalties:
+        return "defense"
+    return None
+
+
+def _side_to_team(side, off_team):
+    """Returns "home" or "away" for a side, "offense" or "defense", given
+    the team on offense."""
+    if side == "offense":
+        return off_team
+    elif off_team == "home":
+        return "away"
+    else:
+        return "home"
+
+
+def _get_infractor_team(
+        infractor,
         home_team,
         away_team,
         home_players,
         away_players
         ):
-    """Takes a string describing the penalty and returns "home" or "away" for
-    the committing team.
-
-    args:
-        penalty_string: A string about the penalty, as returned by
-            split_penalties.
-        off_team: The team on offense. The value can be "home" or "away".
-        home_team, away_team: The team code for the home and away team,
-            respectively.
-        home_players, away_players: Iterables that support 'in' containing a
-            list of all players on the home and away team, respectively.
-
-    returns:
-        "home" or "away"
-    """
-    penalty_name = get_penalty_name(penalty_string).lower()
-    # First we try to assign the team based on offense or defense penalties
-    if "offensive" in penalty_string.lower() \
-    or penalty_name in offense_penalties:
-        return off_team
-    elif "defensive" in penalty_string.lower() \
-    or penalty_name in defense_penalties:
-        if off_team == "home":
-            return "away"
-        else:
-            return "home"
-    # Otherwise we need to use the player to assign the team
-    infractor = penalty_string.split("Penalty on")[1].split(":")[0].strip()
+    """Returns "home" or "away" for the team of the player or team that
+    committed a penalty, or None if it can't be found."""
     # WARNING
     if infractor in home_players and infractor in away_players:
         print("\tDEGENERATE PLAYER!", infractor, away_team, 'at', home_team)
@@ -104,6 +103,58 @@ def get_penalty_team(
         return None
 
 
+def _get_infractor_player(infractor, home_team, away_team):
+    """Returns the name of the player that committed a penalty, or "team" if
+    the infractor is a team."""
+    if infractor == home_team or infractor == away_team:
+        return "team"
+    elif infractor in pfr_codes:
+        return "team"
+    else:
+        return infractor
+
+
+def get_penalty_team(
+        penalty_string,
+        off_team,
+        home_team,
+        away_team,
+        home_players,
+        away_players
+        ):
+    """Takes a string describing the penalty and returns "home" or "away" for
+    the committing team.
+
+    args:
+        penalty_string: A string about the penalty, as returned by
+            split_penalties.
+        off_team: The team on offense. The value can be "home" or "away".
+        home_team, away_team: The team code for the home and away team,
+            respectively.
+        home_players, away_players: Iterables that support 'in' containing a
+            list of all players on the home and away team, respectively.
+
+    returns:
+        "home" or "away"
+    """
+    # First we try to assign the team based on offense or defense penalties
+    side = _get_penalty_side(
+            penalty_string.lower(),
+            get_penalty_name(penalty_string).lower()
+            )
+    if side is not None:
+        return _side_to_team(side, off_team)
+    # Otherwise we need to use the player to assign the team
+    infractor = penalty_string.split("Penalty on")[1].split(":")[0].strip()
+    return _get_infractor_team(
+            infractor,
+            home_team,
+            away_team,
+            home_players,
+            away_players
+            )
+
+
 def get_penalty_player(penalty_string, home_team, away_team):
     """Takes a string describing the penalty and returns the name of the player
     that committed the penalty.
@@ -118,13 +169,7 @@ def get_penalty_player(penalty_string, home_team, away_team):
         The name, or "team" if it is a team penalty.
     """
     infractor = penalty_string.split("Penalty on")[1].split(":")[0].strip()
-
-    if infractor == home_team or infractor == away_team:
-        return "team"
-    elif infractor in pfr_codes:
-        return "team"
-    else:
-        return infractor
+    return _get_infractor_player(infractor, home_team, away_team)
 
 
 def get_penalty_yards(penalty_string):
@@ -193,3 +238,107 @@ def get_penalty_name(penalty_string):
         return first_split.split("(Declined)")[0].strip()
     else:
         return first_split.split(",")[0].strip()
+
+
+def parse_penalty(penalty_string):
+    """Takes a string describing the penalty and finds everything the
+    get_penalty_*() functions would, splitting and lower casing it only once.
+
+    args:
+        penalty_string: A string about the penalty, as returned by
+            split_penalties.
+
+    returns:
+        A dictionary with the following fields:
+            "name": As returned by get_penalty_name().
+            "infractor": The player or team code after "Penalty on".
+            "yards": As returned by get_penalty_yards().
+            "type": As returned by get_penalty_type().
+            "side": "offense" or "defense" if the penalty tells which side
+                committed it, otherwise None.
+
+    raises:
+        IndexError if the string has no ":" or no "Penalty on".
+        ValueError if the word before yards is not an int.
+    """
+    lower_string = penalty_string.lower()
+
+    # The name is between the first and second colons
+    name = penalty_string.split(':', 2)[1].strip()
+    lower_name = name.lower()
+    if "declined" in lower_name:
+        name = name.split("(Declined)")[0].strip()
+    else:
+        name = name.split(",")[0].strip()
+
+    # The yardage is the word before the last "yards", see get_penalty_yards()
+    yards = None
+    if "declined" in lower_string:
+        p_type = "declined"
+    else:
+        if "no play" in lower_string:
+            p_type = "no play"
+        else:
+            p_type = "accepted"
+        words = penalty_string.split()
+        for i in range(len(words) - 1, -1, -1):
+            if words[i] == "yards" or words[i] == "yards,":
+                if i == 0:
+                    raise IndexError("no number before yards")
+                yards = int(words[i - 1])
+                break
+
+    infractor = penalty_string.split("Penalty on", 2)[1].split(":", 1)[0].strip()
+
+    return {
+            "name": name,
+            "infractor": infractor,
+            "yards": yards,
+            "type": p_type,
+            "side": _get_penalty_side(lower_string, name.lower()),
+            }
+
+
+def get_parsed_penalty_team(penalty, off_team, team_index):
+    """Takes a penalty as returned by parse_penalty() and returns "home" or
+    "away" for the committing team, as get_penalty_team() does, except that a
+    player on both teams is only reported the first time.
+
+    args:
+        penalty: A dictionary as returned by parse_penalty().
+        off_team: The team on offense. The value can be "home" or "away".
+        team_index: A TeamIndex for the game.
+
+    returns:
+        "home", "away", or None if the team can't be found.
+    """
+    if penalty["side"] is not None:
+        return _side_to_team(penalty["side"], off_team)
+    infractor = penalty["infractor"]
+    team = team_index.team(infractor)
+    # get_penalty_team() checks the home team first
+    if team == "ambiguous":
+        return "home"
+    elif team is not None:
+        return team
+    # A PFR code of some other team isn't reported
+    elif infractor not in pfr_codes:
+        error_text = "\t" + infractor + " not recognized as a player on "
+        error_text += team_index.home + " or " + team_index.away
+        print(error_text)
+    return None
+
+
+def get_parsed_penalty_player(penalty, home_team, away_team):
+    """Takes a penalty as returned by parse_penalty() and returns the name of
+    the player that committed it, as get_penalty_player() does.
+
+    args:
+        penalty: A dictionary as returned by parse_penalty().
+        home_team, away_team: The team code for the home and away team,
+            respectively.
+
+    returns:
+        The name, or "team" if it is a team penalty.
+    """
+    return _get_infractor_player(penalty["infractor"], home_team, away_team)
@@ -13,6 +13,25 @@ def get_play_type(col):
             "sack",
     """
     pt = col.lower()
+    play_type = match_play_type(pt)
+    # Unmatched!!!!
+    if play_type is None:
+        #raise ValueError("Unmatched play type!", pt)
+        out = "\tUnmatched play type! '" + pt + "'"
+        print(out)
+    return play_type
+
+
+def match_play_type(pt):
+    """Takes a lower case string and returns the play type, as
+    get_play_type() does, or None if it doesn't match any type.
+
+    args:
+        pt: A lower case string containing the play-by-play information.
+
+    returns:
+        A string, or None.
+    """
     # Punts
     if "punt" in pt:
         return "punt"
@@ -62,11 +81,7 @@ def get_play_type(col):
     # Run
     elif "for" in pt and ("yard" in pt or "no gain" in pt):
         return "run"
-    # Unmatched!!!!
     else:
-        #raise ValueError("Unmatched play type!", pt)
-        out = "\tUnmatched play type! '" + pt + "'"
-        print(out)
         return None
 
 
@@ -82,6 +97,25 @@ def get_scoring_type(col):
             "extra point"
     """
     pt = col.lower()
+    scoring_type = match_scoring_type(pt)
+    # Unmatched!!!!
+    if scoring_type is None:
+        #raise ValueError("Unmatched Score type!", pt)
+        out = "\tUnmatched Score type! '" + pt + "'"
+        print(out)
+    return scoring_type
+
+
+def match_scoring_type(pt):
+    """Takes a lower case string and returns the scoring type, as
+    get_scoring_type() does, or None if it doesn't match any type.
+
+    args:
+        pt: A lower case string containing the play-by-play information.
+
+    returns:
+        A string, or None.
+    """
     # Extra Point
     if "extra point" in pt:
         return "extra point"
@@ -98,8 +132,4 @@ def get_scoring_type(col):
     elif "field goal" in pt:
         return "field goal"
     else:
-    # Unmatched!!!!
-        #raise ValueError("Unmatched Score type!", pt)
-        out = "\tUnmatched Score type! '" + pt + "'"
-        print(out)
         return None
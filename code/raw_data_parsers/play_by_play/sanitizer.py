@@ -2,6 +2,10 @@
 
 import re
 
+# We split upheld challenges on something that looks like: team code +
+# challenged, or "Replay Assistant challenged"
+challenge_regex = re.compile("[A-Z][A-Z][A-Z] challenged|Replay Assistant challenged")
+
 
 def get_challenge_type(play_string):
     """Takes a string describing the play and returns the type of challenge.
@@ -35,9 +39,6 @@ def remove_challenge(play_string):
     if not challenge_type:  # Not a challenge, do nothing
         return play_string
     elif challenge_type == "upheld":
-        # We split on something that looks like:
-        # team code + challenged, or "Replay Assistant challenged"
-        split_regex = "[A-Z][A-Z][A-Z] challenged|Replay Assistant challenged"
-        return re.split(split_regex, play_string)[0].strip()
+        return challenge_regex.split(play_string)[0].strip()
     else:
         return play_string.split("overturned.")[1].strip()
@@ -5,6 +5,146 @@ import re
 from data_helpers.team_list import pfr_codes_to_code, pfr_codes
 
 
+# The substrings that end the part of a description about one turnover. The
+# last two can't be used as a regex as they are: they backtrack over every
+# word after each 'intended for' that doesn't reach a ' .', which is
+# quadratic in the length of the description. So split_turnovers() finds them
+# with a scanner, and these are kept to define what it finds.
+split_regexes = (
+        "\)\.",           # ').'
+        " yards\.",       # ' yards.'
+        " yard\.",        # ' yard.'
+        " gain\.",        # ' gain.'
+        " safety\.",      # ' safety.'
+        " incomplete\.",  # ' incomplete.'
+        " snap\.",        # ' snap.'
+        "[0-9]\.",        # Number followed by period
+        # Starting at 'intended for', match any word consisting of A
+        # through Z (ignoring case) or a period until ' .'.
+        # This is used for QB fumbles
+        "intended for( [a-zA-Z.\-']+)* \.",
+        # Starting at 'recovered by', match as above until ' .'.  This is
+        # used for onside kicks
+        "recovered by( [a-zA-Z.\-']+)* \."
+        )
+split_regex = "|".join(split_regexes)
+
+# The delimiters that end in a fixed string, which a regex finds in linear time
+_fixed_split_regex = re.compile("|".join(split_regexes[:-2]))
+# The phrases that start the other delimiters, in the order of their groups
+_split_phrases = ("intended for", "recovered by")
+# A run of words following a phrase; with nothing after it to fail, this never
+# backtracks
+_word_run_regex = re.compile(r"(?: [a-zA-Z.\-']+)*")
+
+
+class _PhraseFinder:
+
+    def __init__(self, col):
+        """Finds the delimiters that start with a phrase in a string, in
+        order, as re.finditer(split_regex) would. Each run of words is scanned
+        only once, however many phrases it contains.
+
+        args:
+            col: A string describing the play.
+        """
+        self.col = col
+        # The position to look for each phrase from, and where it was found
+        self.next_phrase = [[0, None] for _ in _split_phrases]
+        # The start and end of the last run of words scanned, and the
+        # position of the last ' .' in it
+        self.run_end = -1
+        self.run_last = -1
+
+    def __find_phrase(self, start):
+        """Returns the (position, group index) of the first phrase at or after
+        start, or None."""
+        best = None
+        for (i, found) in enumerate(self.next_phrase):
+            if found[1] is None or found[1] < start:
+                if found[0] > len(self.col):
+                    continue
+                position = self.col.find(_split_phrases[i], max(start, found[0]))
+                if position == -1:
+                    # Never look again
+                    found[0] = len(self.col) + 1
+                    found[1] = None
+                    continue
+                found[0] = position + 1
+                found[1] = position
+            if best is None or found[1] < best[0]:
+                best = (found[1], i + 1)
+        return best
+
+    def find(self, start):
+        """Returns the first delimiter starting at or after start, as a tuple
+        of (start, end, group index, group span), or None. The group span is
+        None if the delimiter has no words."""
+        while True:
+            phrase = self.__find_phrase(start)
+            if phrase is None:
+                return None
+            (position, group) = phrase
+            # Where the words after the phrase start
+            words = position + len(_split_phrases[group - 1])
+            # Every space in a run of words starts a word, so the words after
+            # a phrase inside a scanned run are the rest of that run
+            if words >= self.run_end:
+                self.run_end = _word_run_regex.match(self.col, words).end()
+                self.run_last = self.col.rfind(" .", words, self.run_end)
+            if self.col.startswith(" ", words) and self.run_last >= words:
+                # The match runs to the last ' .', and the group is the word
+                # before it
+                end = self.run_last + 2
+                if self.run_last == words:
+                    span = None
+                else:
+                    span = (self.col.rfind(" ", words, self.run_last), self.run_last)
+                return (position, end, group, span)
+            start = position + 1
+
+
+def iter_turnover_delimiters(col):
+    """Takes a string describing the play, and yields each delimiter that
+    re.split(split_regex, col) would split it on, in linear time.
+
+    args:
+        col: A string describing the play.
+
+    returns:
+        A generator of tuples of (start, end, groups), where groups is a list
+            with the span of each group in split_regex, or None for groups
+            that didn't match.
+    """
+    n_groups = len(_split_phrases)
+    # Most descriptions have none of the phrases
+    if _split_phrases[0] not in col and _split_phrases[1] not in col:
+        for match in _fixed_split_regex.finditer(col):
+            yield (match.start(), match.end(), [None] * n_groups)
+        return
+    phrases = _PhraseFinder(col)
+    position = 0
+    fixed = None
+    phrase = None
+    while position <= len(col):
+        # A match found earlier is still the first one if we haven't passed
+        # its start
+        if fixed is None or fixed.start() < position:
+            fixed = _fixed_split_regex.search(col, position)
+        if phrase is None or phrase[0] < position:
+            phrase = phrases.find(position)
+        if fixed is None and phrase is None:
+            return
+        groups = [None] * n_groups
+        if phrase is None or (fixed is not None and fixed.start() < phrase[0]):
+            (start, end) = fixed.span()
+        else:
+            (start, end, group, span) = phrase
+            groups[group - 1] = span
+        yield (start, end, groups)
+        position = end
+
+
 def split_turnovers(col):
     """Takes a string describing the play, and splits it into a list of the
     turnovers.
@@ -16,71 +156,62 @@ def split_turnovers(col):
         A list of strings.
     """
     final_list = []
-    # Split on several different substring
-    reg_list = (
-            "\)\.",           # ').'
-            " yards\.",       # ' yards.'
-            " yard\.",        # ' yard.'
-            " gain\.",        # ' gain.'
-            " safety\.",      # ' safety.'
-            " incomplete\.",  # ' incomplete.'
-            " snap\.",        # ' snap.'
-            "[0-9]\.",        # Number followed by period
-            # Starting at 'intended for', match any word consisting of A
-            # through Z (ignoring case) or a period until ' .'.
-            # This is used for QB fumbles
-            "intended for( [a-zA-Z.\-']+)* \.",
-            # Starting at 'recovered by', match as above until ' .'.  This is
-            # used for onside kicks
-            "recovered by( [a-zA-Z.\-']+)* \."
-            )
-    regex = "|".join(reg_list)
-    for item in re.split(regex, col):
-        if item is not None:
-            if "fumble" in item.lower() \
-            or "intercepted" in item.lower() \
-            or "muffed" in item.lower():
-                final_list.append(item.strip())
+    # Split on several different substring, as re.split(split_regex, col)
+    # would, including the groups
+    if _split_phrases[0] not in col and _split_phrases[1] not in col:
+        items = _fixed_split_regex.split(col)
+    else:
+        items = []
+        end = 0
+        for (start, next_end, groups) in iter_turnover_delimiters(col):
+            items.append(col[end:start])
+            for span in groups:
+                if span is not None:
+                    items.append(col[span[0]:span[1]])
+            end = next_end
+        items.append(col[end:])
+    for item in items:
+        if "fumble" in item.lower() \
+        or "intercepted" in item.lower() \
+        or "muffed" in item.lower():
+            final_list.append(item.strip())
 
     return final_list
 
 
-def get_turnover_type(turnover_string):
-    """Takes a string describing the play, and returns the type of turnover.
-
-    args:
-        turnover_string: A string about the turnover, as returned by
-            split_turnovers.
-
-    returns:
-        A string indicating the type, or None if it can't be figured out
-    """
-    if "fumble" in turnover_string.lower():
+def _match_turnover_type(lower_string):
+    """Returns the type of turnover in a lower cased turnover string, or None
+    if it can't be figured out."""
+    if "fumble" in lower_string:
         return "fumble"
-    elif "intercept" in turnover_string.lower():
+    elif "intercept" in lower_string:
         return "interception"
-    elif "muffed" in turnover_string.lower():
+    elif "muffed" in lower_string:
         return "muffed catch"
     else:
-        out = "Unknown turnover type: '" + turnover_string + "'"
-        print(out)
         return None
 
 
-def get_turnover_recoverer(turnover_string):
-    """Takes a string describing the play, and returns the player that
-    recovered the turnover.
+def get_turnover_type(turnover_string):
+    """Takes a string describing the play, and returns the type of turnover.
 
     args:
         turnover_string: A string about the turnover, as returned by
             split_turnovers.
 
     returns:
-        A string indicating the player's name, or False if the ball was
-            not recovered.
+        A string indicating the type, or None if it can't be figured out
     """
-    # Use the type to set the string to split on
-    to_type = get_turnover_type(turnover_string)
+    to_type = _match_turnover_type(turnover_string.lower())
+    if to_type is None:
+        out = "Unknown turnover type: '" + turnover_string + "'"
+        print(out)
+    return to_type
+
+
+def _find_recoverer(turnover_string, to_type):
+    """Returns the player that recovered a turnover of a known type, as
+    get_turnover_recoverer() does."""
     if to_type == "fumble":
         # Check to see if the fumble is recovered (some are fumbled out of
         # bounds for instance)
@@ -104,19 +235,25 @@ def get_turnover_recoverer(turnover_string):
     return l_string
 
 
-def get_turnover_committer(turnover_string):
+def get_turnover_recoverer(turnover_string):
     """Takes a string describing the play, and returns the player that
-    committed the turnover.
+    recovered the turnover.
 
     args:
         turnover_string: A string about the turnover, as returned by
             split_turnovers.
 
     returns:
-        A string indicating the player's name.
+        A string indicating the player's name, or False if the ball was
+            not recovered.
     """
     # Use the type to set the string to split on
-    to_type = get_turnover_type(turnover_string)
+    return _find_recoverer(turnover_string, get_turnover_type(turnover_string))
+
+
+def _find_committer(turnover_string, to_type):
+    """Returns the player that committed a turnover of a known type, as
+    get_turnover_committer() does."""
     r_split_string = None
     if to_type == "fumble":
         l_split_string = "fumbles"
@@ -136,6 +273,46 @@ def get_turnover_committer(turnover_string):
         return l_string
 
 
+def get_turnover_committer(turnover_string):
+    """Takes a string describing the play, and returns the player that
+    committed the turnover.
+
+    args:
+        turnover_string: A string about the turnover, as returned by
+            split_turnovers.
+
+    returns:
+        A string indicating the player's name.
+    """
+    # Use the type to set the string to split on
+    return _find_committer(turnover_string, get_turnover_type(turnover_string))
+
+
+def parse_turnover(turnover_string):
+    """Takes a string describing the turnover and finds everything the
+    get_turnover_*() functions would, classifying it only once.
+
+    args:
+        turnover_string: A string about the turnover, as returned by
+            split_turnovers.
+
+    returns:
+        A dictionary with the following fields:
+            "type": As returned by get_turnover_type().
+            "committer": As returned by get_turnover_committer().
+            "recoverer": As returned by get_turnover_recoverer().
+
+    raises:
+        IndexError if the players can't be split out of the string.
+    """
+    to_type = get_turnover_type(turnover_string)
+    return {
+            "type": to_type,
+            "committer": _find_committer(turnover_string, to_type),
+            "recoverer": _find_recoverer(turnover_string, to_type),
+            }
+
+
 def get_turnover_teams(turnover_string, home_players, away_players):
     """Takes a string describing the play, and returns the teams that lost and
     recovered the turnover.
@@ -196,3 +373,54 @@ def get_turnover_teams(turnover_string, home_players, away_players):
             print(error_text)
 
         return (com_team, rec_team)
+
+
+def get_parsed_turnover_teams(turnover, team_index):
+    """Takes a turnover as returned by parse_turnover() and returns the teams
+    that lost and recovered it, as get_turnover_teams() does, except that a
+    player on both teams is only reported the first time.
+
+    args:
+        turnover: A dictionary as returned by parse_turnover().
+        team_index: A TeamIndex for the game.
+
+    returns:
+        A tuple of (committing_team, recovering_team) with values "home",
+            "away". False is used for the recovering team if there is no
+            recovering team.
+    """
+    com = turnover["committer"]
+    rec = turnover["recoverer"]
+    com_team = team_index.team(com)
+    rec_team = team_index.team(rec)
+    # With an interception, we only need to get one team, because we know the
+    # other by the fact that an interception only happens when possession
+    # changes.
+    if turnover["type"] == "interception":
+        if com_team == "home" or rec_team == "away":
+            return ("home", "away")
+        elif com_team == "away" or rec_team == "home":
+            return ("away", "home")
+    # Fumbles can be recovered by the same team, so we need both
+    else:
+        error_text = ""
+
+        if com_team is None:
+            error_text += "\tTurnover committing player '"
+            error_text += str(com) + "' not recognized!"
+        elif com_team == "ambiguous":
+            com_team = None
+
+        # False is used to indicate that there is no recovering player
+        if rec is False:
+            rec_team = False
+        elif rec_team is None:
+            error_text += "\tTurnover recovering player '"
+            error_text += str(rec) + "' not recognized!"
+        elif rec_team == "ambiguous":
+            rec_team = None
+
+        if error_text:
+            print(error_text)
+
+        return (com_team, rec_team)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+from data_helpers.team_list import names_to_code, team_names
+
+
+def _has_blank_class(row):
+    """Returns True if a row's class is blank, which marks the rows of
+    players. Older versions of BeautifulSoup give [''] for a blank class,
+    while newer ones give []."""
+    return not any(row["class"])
+
+
+def iter_starters(soup):
+    """Takes a soup containing the starters tables, and yields each starter.
+
+    args:
+        soup: A soup, or section, containing the tables of starters.
+
+    returns:
+        A generator of (team_code, position, player) tuples.
+
+    raises:
+        KeyError if a team name is not recognized.
+    """
+    # We get all the elements the match data-stat="pos", which is the table
+    # element that has the words "Pos", which is unique to these tables.
+    # Once we have these elements, we find their parents to get the whole
+    # table.
+    ths = soup.find_all("th", attrs={"data-stat": "pos"})
+    for th in ths:
+        table = th.parent.parent  # th.parent == row, row.parent == table
+        for row in table.find_all("tr"):
+            # We read through the rows in order. Since the header with the
+            # name always comes before the players for a team, we can set
+            # the team at the first time we hit it and it will be good for
+            # the rest of the table.
+
+            # Header row with team name
+            if "stat_total" in row["class"]:
+                team_name = row.get_text(' ', strip=True)
+                team_code = names_to_code[team_name]
+            # Normal rows have blank classes
+            elif _has_blank_class(row):
+                cols = row.find_all("td")
+                player = cols[0].get_text(' ', strip=True).replace('\n', ' ')
+                position = cols[1].get_text(' ', strip=True).replace('\n', ' ')
+                yield (team_code, position, player)
+
+
+def iter_stats_players(soup):
+    """Takes a soup containing one of the defense, skill position, or kicking
+    stats tables, and yields each player in it.
+
+    args:
+        soup: A soup, or section, containing the table.
+
+    returns:
+        A generator of (team_code, player) tuples.
+    """
+    # Each table is essentially the same, and we only care about the first
+    # two columns
+    body = soup.find_all("tbody")
+    for row in body[0].find_all("tr"):
+        # The rows with players have blank classes
+        if _has_blank_class(row):
+            cols = row.find_all("td")
+            player = cols[0].get_text(' ', strip=True).replace('\n', ' ')
+            team_code = cols[1].get_text(' ', strip=True).replace('\n', ' ')
+            yield (team_code, player)
+
+
+def iter_general_players(soup):
+    """Takes a soup containing the general stats tables, and yields each
+    player in them.
+
+    args:
+        soup: A soup, or section, containing all the tables of the page.
+
+    returns:
+        A generator of (team_code, player) tuples. The team code is None for
+            players listed before any team.
+    """
+    # The tables we are interested in have no id set, and have class =
+    # ['stats_table', 'no_highlight'].
+    team_code = None
+    for table in soup.find_all("table"):
+        if table.has_attr("class") and not table.has_attr("id") \
+        and table["class"] == ['stats_table', 'no_highlight']:
+            for metarow in table.find_all("tr"):
+                # If it is a row with a team name, use that to set the team
+                team_name = metarow.get_text(' ', strip=True).replace('\n', ' ')
+                if team_name in team_names:
+                    team_code = names_to_code[team_name]
+                # Otherwise we find the rows of player stats and pull out
+                # their names.
+                else:
+                    for body in metarow.find_all("tbody"):
+                        for row in body.find_all("tr"):
+                            cols = row.find_all("td")
+                            player = cols[0].get_text(' ', strip=True).replace('\n', ' ')
+                            yield (team_code, player)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+from os.path import dirname, join, realpath
+import tarfile
+import zipfile
+
+from raw_data_readers.compressed import is_compressed, open_raw_file, openers
+
+
+def is_archive(file_name):
+    """Returns True if a file name ends in the extension of an archive we can
+    read: a zip file, or a tar file that is optionally compressed."""
+    if file_name.endswith((".zip", ".tgz", ".tbz2", ".txz")):
+        return True
+    for extension in openers:
+        if file_name.endswith(extension):
+            file_name = file_name[:-len(extension)]
+            break
+    return file_name.endswith(".tar")
+
+
+def iter_archive(file_name):
+    """Takes the name of an archive, and yields each file in it in turn,
+    without extracting anything to disk. Each file must be read before asking
+    for the next one, as tar files are read as a stream.
+
+    args:
+        file_name: A string containing the name of a zip or tar file.
+
+    returns:
+        A generator of tuples of (member name, binary file object).
+
+    raises:
+        OSError if the archive can't be opened.
+        tarfile.TarError or zipfile.BadZipFile if the archive is corrupt.
+    """
+    if file_name.endswith(".zip"):
+        with zipfile.ZipFile(file_name) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                with archive.open(info) as member:
+                    yield (info.filename, member)
+    else:
+        # tarfile only knows some kinds of compression, so we undo ours first
+        if is_compressed(file_name):
+            stream = open_raw_file(file_name)
+        else:
+            stream = open(file_name, "rb")
+        with stream, tarfile.open(fileobj=stream, mode="r|*") as archive:
+            for member in archive:
+                if not member.isfile():
+                    continue
+                yield (member.name, archive.extractfile(member))
+
+
+def iter_raw_files(file_names):
+    """Takes a list of raw data files and archives of them, and yields each
+    raw data file in turn.
+
+    args:
+        file_names: A list of strings containing file names.
+
+    returns:
+        A generator of tuples of (file name, file object, raw directory). For
+            plain files the file object and raw directory are None. For
+            members of an archive the file name is the member's path inside
+            the archive, the file object reads the member, and the raw
+            directory is the directory holding the archive.
+    """
+    for file_name in file_names:
+        if not is_archive(file_name):
+            yield (file_name, None, None)
+            continue
+        raw_dir = dirname(realpath(file_name))
+        for (member_name, member) in iter_archive(file_name):
+            yield (join(file_name, member_name), member, raw_dir)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+from importlib import import_module
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from raw_data_readers.sections import Section
+from raw_data_readers.table_scanner import scan_tables
+
+# The HTML parsers we can use to build trees. The first three are handed to
+# BeautifulSoup, while "scanner" is our own minimal tree builder.
+backends = ("html.parser", "lxml", "html5lib", "scanner")
+
+# The python modules that each backend needs
+backend_modules = {
+        "html.parser": "html.parser",
+        "lxml": "lxml",
+        "html5lib": "html5lib",
+        "scanner": "html.parser"
+        }
+
+
+def backend_available(backend):
+    """Returns True if the modules needed by a backend can be imported.
+
+    raises:
+        KeyError if the backend is unknown.
+    """
+    try:
+        import_module(backend_modules[backend])
+    except ImportError:
+        return False
+    else:
+        return True
+
+
+def make_tree(markup, backend="html.parser", skip_ids=()):
+    """Takes a string of HTML, and returns a tree of the title and all the
+    tables in it. Every section the converter uses is one of these, or is
+    inside one. html5lib can't build a partial tree, so with it the whole page
+    is kept, apart from the elements in skip_ids, which are removed after it
+    is parsed.
+
+    args:
+        markup: A string of HTML.
+        backend: One of the backends.
+        skip_ids: Elements with these ids are left out of the tree.
+
+    returns:
+        A BeautifulSoup, or for the scanner an Element, supporting find() and
+            find_all().
+
+    raises:
+        bs4.FeatureNotFound if the backend's parser is not installed.
+    """
+    if backend == "scanner":
+        return scan_tables(markup, skip_ids=skip_ids)
+    if backend == "html5lib":
+        tree = BeautifulSoup(markup, backend)
+        for tag in tree.find_all(id=lambda value: value in skip_ids):
+            tag.decompose()
+        return tree
+    if skip_ids:
+        strainer = SoupStrainer(
+                ["title", "table"],
+                id=lambda value: value not in skip_ids
+                )
+    else:
+        strainer = SoupStrainer(["title", "table"])
+    return BeautifulSoup(markup, backend, parse_only=strainer)
+
+
+def make_soup(markup, spec, backend="html.parser"):
+    """Takes a string of HTML and returns a soup of just one section of it.
+
+    args:
+        markup: A string of HTML.
+        spec: A dictionary of keyword arguments for SoupStrainer describing
+            the section, for example {"name": "table", "id": "def_stats"}.
+        backend: One of the backends.
+
+    returns:
+        A BeautifulSoup, or for the scanner and html5lib a Section, supporting
+            find() and find_all().
+
+    raises:
+        bs4.FeatureNotFound if the backend's parser is not installed.
+    """
+    if backend == "scanner":
+        return Section(scan_tables(markup), spec)
+    # html5lib ignores parse_only, so the section is found in the whole page
+    if backend == "html5lib":
+        return Section(BeautifulSoup(markup, backend), spec)
+    return BeautifulSoup(markup, backend, parse_only=SoupStrainer(**spec))
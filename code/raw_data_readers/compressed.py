@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+import bz2
+import gzip
+import lzma
+try:
+    import zstandard
+except ImportError:  # Only needed for .zst files
+    zstandard = None
+
+
+def _open_zstd(file_name):
+    """Opens a zstandard compressed file, given its name or a file object, as
+    a stream of decompressed bytes."""
+    if zstandard is None:
+        raise ImportError(
+                "reading '" + str(file_name) + "' requires the zstandard package"
+                )
+    if isinstance(file_name, str):
+        file_handle = open(file_name, "rb")
+    else:
+        file_handle = file_name
+    return zstandard.ZstdDecompressor().stream_reader(
+            file_handle,
+            closefd=True
+            )
+
+
+# Functions to open each kind of compressed file, by file extension. Each
+# takes either a file name or a file object.
+openers = {
+        ".gz": gzip.open,
+        ".bz2": bz2.open,
+        ".xz": lzma.open,
+        ".zst": _open_zstd,
+        }
+
+
+def is_compressed(file_name):
+    """Returns True if a file name ends in the extension of a compressed file
+    we can read."""
+    return file_name.endswith(tuple(openers))
+
+
+def open_raw_file(file_name, file_obj=None):
+    """Opens a raw data file for reading as bytes, decompressing it on the fly
+    if its name ends in .gz, .bz2, .xz, or .zst.
+
+    args:
+        file_name: A string containing the name of a file to open.
+        file_obj: A binary file object to read instead of opening file_name,
+            for example a member of an archive. The name is still used to
+            decide how to decompress it.
+
+    returns:
+        A binary file object.
+
+    raises:
+        OSError if the file can't be opened.
+        ImportError if the file is zstandard compressed and the zstandard
+            package isn't installed.
+    """
+    if file_obj is None:
+        source = file_name
+    else:
+        source = file_obj
+    for extension, opener in openers.items():
+        if file_name.endswith(extension):
+            return opener(source)
+    if file_obj is None:
+        return open(file_name, "rb")
+    return file_obj
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+
+from locale import getpreferredencoding
+import mmap
+import re
+
+from raw_data_readers.compressed import is_compressed, open_raw_file
+
+# The markup the locator cares about. Comments, scripts and styles are found
+# so that they can be skipped, as tables inside them are not part of the page.
+_token_regex = re.compile(
+        rb"<!--|<(script|style)\b|<title\b|<table\b|</table\s*>",
+        re.IGNORECASE
+        )
+_end_regexes = {
+        b"script": re.compile(rb"</script\s*>", re.IGNORECASE),
+        b"style": re.compile(rb"</style\s*>", re.IGNORECASE),
+        b"title": re.compile(rb"</title\s*>", re.IGNORECASE),
+        }
+
+
+def _scan_sections(buf, pos=0, depth=0, start=None, final=True):
+    """Scans raw bytes for the byte ranges of the title and of every outermost
+    table, starting from a saved state.
+
+    args:
+        buf: A bytes-like object.
+        pos: The offset to start scanning from.
+        depth: How deeply nested in tables pos is.
+        start: The offset of the outermost open table, if depth is not 0.
+        final: If true, buf holds the rest of the page. Otherwise more bytes
+            may follow, and scanning stops before anything that might be cut
+            off.
+
+    returns:
+        A tuple of (spans, pos, depth, start), with the (start, end) tuples of
+            the finished ranges, and the state to resume scanning from.
+    """
+    spans = []
+    while True:
+        match = _token_regex.search(buf, pos)
+        if match is None:
+            break
+        # A word boundary matches at the end of the buffer, so the tag name
+        # might carry on in the next chunk
+        if not final and match.end() == len(buf):
+            break
+        token = match.group(0).lower()
+        if token == b"<!--":
+            end = buf.find(b"-->", match.end())
+            if end == -1:
+                break
+            pos = end + 3
+        elif match.group(1):
+            end_match = _end_regexes[match.group(1).lower()].search(buf, match.end())
+            if end_match is None:
+                break
+            pos = end_match.end()
+        elif token == b"<title":
+            end_match = _end_regexes[b"title"].search(buf, match.end())
+            if end_match is None:
+                break
+            if not depth:
+                spans.append((match.start(), end_match.end()))
+            pos = end_match.end()
+        elif token == b"<table":
+            if not depth:
+                start = match.start()
+            depth += 1
+            pos = match.end()
+        else:  # A closing table tag
+            if depth:
+                depth -= 1
+                if not depth:
+                    spans.append((start, match.end()))
+            pos = match.end()
+
+    if match is not None:
+        # Anything we stopped on is scanned again once there is more to see
+        pos = match.start()
+    elif not final:
+        # Only the last tag can have been cut off, so we can skip to it
+        last = buf.rfind(b"<", pos)
+        if last == -1:
+            pos = len(buf)
+        else:
+            pos = last
+
+    return (spans, pos, depth, start)
+
+
+def locate_sections(buf):
+    """Takes the raw bytes of a page and finds the byte ranges of the title
+    and of every outermost table, which hold all the sections the converter
+    uses.
+
+    args:
+        buf: A bytes-like object, for example an mmap.
+
+    returns:
+        A list of (start, end) tuples in document order. A table that is never
+            closed runs to the end of the buffer.
+    """
+    (spans, _, depth, start) = _scan_sections(buf)
+    if depth:
+        spans.append((start, len(buf)))
+
+    return spans
+
+
+class SectionLocator:
+
+    def __init__(self):
+        """Finds the title and the outermost tables in a page that arrives in
+        chunks, as from a decompressor, keeping only the bytes that might
+        belong to them. Feed it bytes with feed(), then call close() and take
+        the sections from self.sections.
+        """
+        self.buffer = bytearray()
+        self.pos = 0
+        self.depth = 0
+        self.start = None
+        # The bytes of each finished section
+        self.sections = []
+
+    def feed(self, data):
+        """Adds the next chunk of the page."""
+        self.buffer += data
+        self.__scan(final=False)
+        # Throw away what we are done with
+        if self.depth:
+            cut = self.start
+        else:
+            cut = self.pos
+        if cut > 0:
+            del self.buffer[:cut]
+            self.pos -= cut
+            if self.depth:
+                self.start -= cut
+
+    def close(self):
+        """Finishes the page. A table that is never closed runs to the end."""
+        self.__scan(final=True)
+        if self.depth:
+            self.sections.append(bytes(self.buffer[self.start:]))
+            self.depth = 0
+        self.buffer = bytearray()
+        self.pos = 0
+
+    def __scan(self, final):
+        (spans, self.pos, self.depth, self.start) = _scan_sections(
+                self.buffer, self.pos, self.depth, self.start, final
+                )
+        for (start, end) in spans:
+            self.sections.append(bytes(self.buffer[start:end]))
+
+
+def _decode(data, encoding=None):
+    """Decodes bytes as reading a file opened in text mode would."""
+    if encoding is None:
+        encoding = getpreferredencoding(False)
+    text = data.decode(encoding)
+    # Match the newline translation of files opened in text mode
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def decode_sections(buf, spans, encoding=None):
+    """Takes the raw bytes of a page and a list of byte ranges, and returns the
+    text of those ranges joined together, decoded as open() would.
+
+    args:
+        buf: A bytes-like object.
+        spans: A list of (start, end) tuples.
+        encoding: The encoding of the page. Defaults to the one open() uses.
+
+    returns:
+        A string.
+
+    raises:
+        UnicodeDecodeError if the page can't be decoded.
+    """
+    return _decode(b"\n".join(buf[start:end] for (start, end) in spans), encoding)
+
+
+def read_sections(file_name, encoding=None, chunk_size=65536, file_obj=None):
+    """Returns the text of just the title and the tables of a raw data file,
+    without reading the rest of the file into memory. Plain files are memory
+    mapped, and compressed files and file objects are read a chunk at a time.
+
+    args:
+        file_name: A string containing the name of a file to open.
+        encoding: The encoding of the page. Defaults to the one open() uses.
+        chunk_size: The number of bytes to decompress at a time.
+        file_obj: A binary file object to read instead of opening file_name,
+            for example a member of an archive.
+
+    returns:
+        A string of HTML.
+
+    raises:
+        OSError if the file can't be read.
+        ImportError if the file is zstandard compressed and the zstandard
+            package isn't installed.
+    """
+    if file_obj is not None or is_compressed(file_name):
+        locator = SectionLocator()
+        with open_raw_file(file_name, file_obj) as file_handle:
+            for chunk in iter(lambda: file_handle.read(chunk_size), b''):
+                locator.feed(chunk)
+        locator.close()
+        return _decode(b"\n".join(locator.sections), encoding)
+
+    with open(file_name, "rb") as file_handle:
+        try:
+            buf = mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty files can't be mapped
+            return ''
+        with buf:
+            return decode_sections(buf, locate_sections(buf), encoding)
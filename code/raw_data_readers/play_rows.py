@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+
+from collections import namedtuple
+from html.parser import HTMLParser
+
+
+class PlayRow(namedtuple("PlayRow", ["classes", "headers", "cells"])):
+    """A lightweight record of one row of the play-by-play table.
+
+    fields:
+        classes: The list of classes set on the row, or None if the row has no
+            class attribute.
+        headers: A list of the text of each <th> in the row.
+        cells: A list of the text of each <td> in the row.
+
+    The text of a cell is the stripped strings inside it joined with a space,
+    as returned by BeautifulSoup's get_text(' ', strip=True).
+    """
+    __slots__ = ()
+
+    @property
+    def text(self):
+        """The text of the whole row, as returned by get_text(' ',
+        strip=True) on the row. """
+        return ' '.join(text for text in self.headers + self.cells if text)
+
+
+def soup_play_rows(soup):
+    """Takes a soup containing the play-by-play table, and yields a PlayRow
+    for each row in it.
+
+    args:
+        soup: A BeautifulSoup, or anything else that supports find_all(),
+            containing the table.
+
+    returns:
+        A generator of PlayRows.
+    """
+    for row in soup.find_all("tr"):
+        headers = [th.get_text(' ', strip=True) for th in row.find_all("th")]
+        cells = [td.get_text(' ', strip=True) for td in row.find_all("td")]
+        yield PlayRow(row.get("class"), headers, cells)
+
+
+class PlayRowParser(HTMLParser):
+
+    def __init__(self, table_id="pbp_data"):
+        """An event driven parser that picks the rows out of a single table
+        without building a tree. Feed it HTML with feed(), and collect the
+        finished rows with pop_rows().
+
+        args:
+            table_id: The id of the element containing the table.
+        """
+        HTMLParser.__init__(self, convert_charrefs=True)
+        self.table_id = table_id
+        # The name of the element with our id, and how deeply nested we are in
+        # elements with that name. A depth of 0 means we are outside.
+        self.table_tag = None
+        self.depth = 0
+        self.done = False
+        # The row and cell being built, and the finished rows
+        self.row = None
+        self.cell = None
+        self.cell_list = None
+        self.rows = []
+        # A text node may be handed to us in several pieces, so we collect
+        # them until the next tag
+        self.data = []
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        self.__end_data()
+        if not self.depth:
+            if self.table_tag is None and dict(attrs).get("id") == self.table_id:
+                self.table_tag = tag
+                self.depth = 1
+            return
+        if tag == self.table_tag:
+            self.depth += 1
+        if tag == "tr":
+            self.__end_row()
+            class_string = dict(attrs).get("class")
+            if class_string is None:
+                classes = None
+            else:
+                classes = class_string.split()
+            self.row = PlayRow(classes, [], [])
+        elif tag in ("td", "th") and self.row is not None:
+            self.__end_cell()
+            self.cell = []
+            if tag == "td":
+                self.cell_list = self.row.cells
+            else:
+                self.cell_list = self.row.headers
+
+    def handle_endtag(self, tag):
+        if not self.depth:
+            return
+        self.__end_data()
+        if tag in ("td", "th"):
+            self.__end_cell()
+        elif tag == "tr":
+            self.__end_row()
+        if tag == self.table_tag:
+            self.depth -= 1
+            if not self.depth:
+                self.__end_row()
+                self.done = True
+
+    def handle_data(self, data):
+        if self.cell is not None:
+            self.data.append(data)
+
+    def handle_comment(self, data):
+        self.__end_data()
+
+    def __end_data(self):
+        """Finish the current text node, and add it to the cell if it isn't
+        blank."""
+        if self.data:
+            text = ''.join(self.data).strip()
+            if text:
+                self.cell.append(text)
+            self.data = []
+
+    def __end_cell(self):
+        """Finish the current cell, if there is one, and add its text to the
+        row."""
+        self.__end_data()
+        if self.cell is not None:
+            self.cell_list.append(' '.join(self.cell))
+            self.cell = None
+            self.cell_list = None
+
+    def __end_row(self):
+        """Finish the current row, if there is one, and add it to the list of
+        finished rows."""
+        self.__end_cell()
+        if self.row is not None:
+            self.rows.append(self.row)
+            self.row = None
+
+    def pop_rows(self):
+        """Returns the rows finished since the last call, and forgets them."""
+        rows = self.rows
+        self.rows = []
+        return rows
+
+
+def iter_play_rows(source, table_id="pbp_data", chunk_size=65536):
+    """Takes raw HTML and yields a PlayRow for each row of the play-by-play
+    table as soon as it is read. No tree is built, and reading stops as soon as
+    the table ends.
+
+    args:
+        source: A string of HTML, or a file object to read it from in chunks.
+        table_id: The id of the element containing the table.
+        chunk_size: The number of characters to read from a file at a time.
+
+    returns:
+        A generator of PlayRows.
+    """
+    parser = PlayRowParser(table_id)
+    if isinstance(source, str):
+        # We feed strings in pieces too, so that we can stop early
+        chunks = (
+                source[start:start + chunk_size]
+                for start in range(0, len(source), chunk_size)
+                )
+    else:
+        chunks = iter(lambda: source.read(chunk_size), '')
+    for chunk in chunks:
+        parser.feed(chunk)
+        for row in parser.pop_rows():
+            yield row
+        if parser.done:
+            return
+    parser.close()
+    for row in parser.pop_rows():
+        yield row
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+
+class Section:
+
+    def __init__(self, tree, spec):
+        """A view of the part of a shared BeautifulSoup tree that a
+        SoupStrainer built from spec would have kept. It supports the parts of
+        the BeautifulSoup search API that the converter uses, so it can stand
+        in for a soup made with parse_only.
+
+        args:
+            tree: A BeautifulSoup (or Tag) to search.
+            spec: A dictionary of keyword arguments for find_all() describing
+                the section, for example {"name": "table", "id": "def_stats"}.
+        """
+        self.spec = spec
+        # A strained soup contains only the outermost matching elements (along
+        # with everything inside them), so we drop matches that are nested
+        # inside an earlier match.
+        self.roots = []
+        seen = set()
+        for tag in tree.find_all(**spec):
+            if not any(id(parent) in seen for parent in tag.parents):
+                self.roots.append(tag)
+            seen.add(id(tag))
+
+    def find_all(self, name=None, attrs={}, recursive=True, **kwargs):
+        """Returns a list of all the elements in the section that match the
+        arguments, in document order, as BeautifulSoup.find_all() would.
+        """
+        found = []
+        for root in self.roots:
+            # The roots themselves are part of the section, so they can match
+            # as well. We check them by searching their parent without
+            # recursion.
+            if root.parent is not None:
+                siblings = root.parent.find_all(
+                        name, attrs, recursive=False, **kwargs
+                        )
+                if any(sibling is root for sibling in siblings):
+                    found.append(root)
+            if recursive:
+                found += root.find_all(name, attrs, **kwargs)
+        return found
+
+    def find(self, name=None, attrs={}, recursive=True, **kwargs):
+        """Returns the first element in the section that matches the
+        arguments, or None.
+        """
+        found = self.find_all(name, attrs, recursive, **kwargs)
+        if found:
+            return found[0]
+        else:
+            return None
+
+    def prettify(self):
+        """Returns the section as a pretty printed string."""
+        return "".join(root.prettify() for root in self.roots)
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+
+from html.parser import HTMLParser
+
+# Elements that never have an end tag, and so never have children
+void_elements = frozenset([
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "keygen",
+    "link", "meta", "param", "source", "track", "wbr"
+])
+
+
+def _match_value(value, match_against):
+    """Returns True if an attribute value (None if it is missing) matches a
+    value as given to find_all(). Lists are used for attributes like "class"
+    that can hold several values."""
+    if match_against is True:
+        return value is not None
+    elif match_against is None:
+        return value is None
+    elif callable(match_against):
+        return match_against(value)
+    elif isinstance(match_against, (list, tuple, set, frozenset)):
+        return any(_match_value(value, item) for item in match_against)
+    elif value is None:
+        return False
+    elif isinstance(value, list):
+        return match_against in value or match_against == ' '.join(value)
+    else:
+        return value == match_against
+
+
+class Element:
+
+    def __init__(self, name, attrs, parent=None):
+        """A minimal HTML element, supporting the parts of the BeautifulSoup
+        Tag API that the converter uses.
+
+        args:
+            name: The name of the tag, for example "table".
+            attrs: A dictionary of attributes. The "class" attribute is stored
+                as a list.
+            parent: The Element containing this one, or None.
+        """
+        self.name = name
+        self.attrs = attrs
+        self.parent = parent
+        self.contents = []
+
+    @property
+    def parents(self):
+        """A generator of the Elements containing this one, innermost
+        first."""
+        parent = self.parent
+        while parent is not None:
+            yield parent
+            parent = parent.parent
+
+    @property
+    def descendants(self):
+        """A generator of every Element and string inside this one, in
+        document order."""
+        stack = list(reversed(self.contents))
+        while stack:
+            item = stack.pop()
+            yield item
+            if isinstance(item, Element):
+                stack.extend(reversed(item.contents))
+
+    @property
+    def strings(self):
+        """A generator of every string inside this Element."""
+        for item in self.descendants:
+            if isinstance(item, str):
+                yield item
+
+    def __getitem__(self, key):
+        return self.attrs[key]
+
+    def get(self, key, default=None):
+        return self.attrs.get(key, default)
+
+    def has_attr(self, key):
+        return key in self.attrs
+
+    def get_text(self, separator="", strip=False):
+        """Returns all the text inside the Element, as Tag.get_text() does."""
+        if strip:
+            return separator.join(
+                    text for text in (s.strip() for s in self.strings) if text
+                    )
+        else:
+            return separator.join(self.strings)
+
+    def __matches(self, name, attrs):
+        """Returns True if the Element matches a name and attributes as given
+        to find_all()."""
+        if name is not None and not _match_value(self.name, name):
+            return False
+        for key, match_against in attrs.items():
+            if not _match_value(self.attrs.get(key), match_against):
+                return False
+        return True
+
+    def find_all(self, name=None, attrs={}, recursive=True, **kwargs):
+        """Returns a list of the Elements inside this one that match the
+        arguments, as Tag.find_all() does."""
+        if kwargs:
+            attrs = dict(attrs)
+            attrs.update(kwargs)
+        if recursive:
+            items = self.descendants
+        else:
+            items = self.contents
+        return [
+                item for item in items
+                if isinstance(item, Element) and item.__matches(name, attrs)
+                ]
+
+    def find(self, name=None, attrs={}, recursive=True, **kwargs):
+        """Returns the first Element inside this one that matches the
+        arguments, or None."""
+        found = self.find_all(name, attrs, recursive, **kwargs)
+        if found:
+            return found[0]
+        else:
+            return None
+
+    def __str__(self):
+        if self.name is None:
+            return ''.join(str(item) for item in self.contents)
+        attrs = ''
+        for key, value in self.attrs.items():
+            if isinstance(value, list):
+                value = ' '.join(value)
+            attrs += ' {key}="{value}"'.format(key=key, value=value)
+        inner = ''.join(str(item) for item in self.contents)
+        return "<{name}{attrs}>{inner}</{name}>".format(
+                name=self.name, attrs=attrs, inner=inner
+                )
+
+    def prettify(self):
+        """Returns the Element as a string of HTML."""
+        return str(self) + "\n"
+
+
+class TableScanner(HTMLParser):
+
+    def __init__(self, names=("title", "table"), skip_ids=()):
+        """A hand written tree builder that only keeps a few kinds of element
+        (and everything inside them), and ignores the rest of the page. Feed it
+        HTML with feed(), then use the tree in self.document.
+
+        args:
+            names: The names of the elements to keep.
+            skip_ids: Elements with these ids are not kept.
+        """
+        HTMLParser.__init__(self, convert_charrefs=True)
+        self.names = frozenset(names)
+        self.skip_ids = frozenset(skip_ids)
+        self.document = Element(None, {})
+        # The stack of open elements we are keeping, empty when we are
+        # outside them
+        self.stack = []
+        # A text node may be handed to us in several pieces, so we collect
+        # them until the next tag
+        self.data = []
+
+    def handle_starttag(self, tag, attrs):
+        if not self.stack:
+            if tag not in self.names:
+                return
+            attrs = dict(attrs)
+            if attrs.get("id") in self.skip_ids:
+                return
+            parent = self.document
+        else:
+            self.__end_data()
+            attrs = dict(attrs)
+            parent = self.stack[-1]
+        if "class" in attrs:
+            attrs["class"] = (attrs["class"] or '').split()
+        element = Element(tag, attrs, parent)
+        parent.contents.append(element)
+        if tag not in void_elements:
+            self.stack.append(element)
+
+    def handle_endtag(self, tag):
+        if not self.stack:
+            return
+        self.__end_data()
+        # Close everything up to the most recent open element with this name;
+        # an end tag that matches nothing is ignored.
+        for i in range(len(self.stack) - 1, -1, -1):
+            if self.stack[i].name == tag:
+                del self.stack[i:]
+                break
+
+    def handle_data(self, data):
+        if self.stack:
+            self.data.append(data)
+
+    def handle_comment(self, data):
+        if self.stack:
+            self.__end_data()
+
+    def __end_data(self):
+        """Finish the current text node, and add it to the open element."""
+        if self.data:
+            self.stack[-1].contents.append(''.join(self.data))
+            self.data = []
+
+    def close(self):
+        HTMLParser.close(self)
+        if self.stack:
+            self.__end_data()
+
+
+def scan_tables(markup, names=("title", "table"), skip_ids=()):
+    """Takes a string of HTML and returns a tree of the elements we keep.
+
+    args:
+        markup: A string of HTML.
+        names: The names of the elements to keep.
+        skip_ids: Elements with these ids are not kept.
+
+    returns:
+        An Element containing the kept elements in document order.
+    """
+    scanner = TableScanner(names, skip_ids)
+    scanner.feed(markup)
+    scanner.close()
+    return scanner.document
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+import json
+from os import cpu_count
+
+from converter import strainers
+from data_helpers.aliases import name_key
+from raw_data_parsers.players import iter_starters, iter_stats_players, iter_general_players
+from raw_data_parsers.title_info import convert_title_teams, get_season
+from raw_data_readers.archives import iter_raw_files
+from raw_data_readers.backends import backends, backend_available, make_tree
+from raw_data_readers.locator import read_sections
+from raw_data_readers.sections import Section
+
+# The note at the top of rosters.py
+roster_note = """\
+# PLEASE NOTE: This object is primarily designed to allows the assignment of
+# penalties and turnovers to a team based on the player that committed them.
+# Therefore, a single person may have multiple entries depending on how their
+# name is abbreviated, misspelled, or otherwise mutilated in the raw data.
+"""
+
+
+def page_players(file_name, data=None, backend="html.parser"):
+    """Finds every player listed for each team in a raw data file, in the
+    same tables the converter takes them from.
+
+    args:
+        file_name: A string containing the name of a file to open.
+        data: The bytes of the file, to read instead of opening file_name,
+            for example a member of an archive.
+        backend: The HTML parser used to build the tree.
+
+    returns:
+        A tuple of (season, players), where players is a dictionary mapping
+            each team code to a set of player names.
+    """
+    if data is None:
+        file_obj = None
+    else:
+        file_obj = BytesIO(data)
+    cont = read_sections(file_name, file_obj=file_obj)
+    tree = make_tree(cont, backend, ("pbp_data",))
+
+    # The teams and season are in the title
+    text = Section(tree, strainers["title"]).find("title").get_text(strip=True)
+    teams = convert_title_teams(text.split('-')[0])
+    season = get_season(text.split('-')[1])
+
+    players = {team: set() for team in teams}
+    for (team_code, _, player) in iter_starters(Section(tree, strainers["starters"])):
+        players.setdefault(team_code, set()).add(player)
+    for key in ("def_stats", "off_stats", "kick_stats"):
+        for (team_code, player) in iter_stats_players(Section(tree, strainers[key])):
+            players.setdefault(team_code, set()).add(player)
+    for (team_code, player) in iter_general_players(Section(tree, strainers["all_tables"])):
+        if team_code is not None:
+            players.setdefault(team_code, set()).add(player)
+
+    return (season, players)
+
+
+def _page_players_or_error(args):
+    """Calls page_players(*args) in a worker process, and returns a tuple of
+    (file_name, result, error) instead of raising if the page can't be
+    read."""
+    try:
+        return (args[0], page_players(*args), None)
+    except Exception as err:
+        return (args[0], None, repr(err))
+
+
+def iter_page_args(file_names, backend):
+    """Yields the arguments of page_players() for each raw data file, reading
+    the members of archives, which can't be passed to another process."""
+    for (raw_file, file_obj, _) in iter_raw_files(file_names):
+        if file_obj is None:
+            yield (raw_file, None, backend)
+        else:
+            yield (raw_file, file_obj.read(), backend)
+
+
+def build_rosters(file_names, jobs=None, backend="html.parser"):
+    """Scans raw data files with a pool of processes and merges the players
+    found in them into per team, per season rosters.
+
+    args:
+        file_names: A list of raw data files or archives of them.
+        jobs: The number of processes to use. Defaults to the number of CPUs.
+        backend: The HTML parser used to build the trees.
+
+    returns:
+        A tuple of (rosters, failed), where rosters is a dictionary mapping
+            team codes to dictionaries mapping seasons to sets of player names,
+            as in rosters.py, and failed is a list of (file_name, error)
+            tuples for the files that could not be read.
+    """
+    rosters = {}
+    failed = []
+
+    def merge(result):
+        (file_name, players, error) = result
+        if error is not None:
+            failed.append((file_name, error))
+            return
+        (season, players) = players
+        for (team, names) in players.items():
+            rosters.setdefault(team, {}).setdefault(season, set()).update(names)
+
+    # Only a few files per process are read ahead, so a corpus of archives is
+    # never held in memory
+    window = 4 * (jobs or cpu_count() or 1)
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for args in iter_page_args(file_names, backend):
+            pending.append(executor.submit(_page_players_or_error, args))
+            while len(pending) >= window:
+                merge(pending.popleft().result())
+        while pending:
+            merge(pending.popleft().result())
+
+    return (rosters, failed)
+
+
+def merge_rosters(rosters, other):
+    """Adds the players of one set of rosters to another.
+
+    args:
+        rosters: A dictionary of rosters, as in rosters.py, which is changed.
+        other: A dictionary of rosters to add.
+    """
+    for (team, seasons) in other.items():
+        for (season, players) in seasons.items():
+            rosters.setdefault(team, {}).setdefault(season, set()).update(players)
+
+
+def shared_players(rosters):
+    """Finds the players listed for more than one team in a season, which the
+    converter can't assign to a team if those teams play each other.
+
+    Names are compared by name_key(), so different spellings of the same
+    player count as the same name.
+
+    args:
+        rosters: A dictionary of rosters, as in rosters.py.
+
+    returns:
+        A dictionary mapping each season to a dictionary that maps the names,
+            as one of the spellings used, to a sorted list of the teams they
+            are listed for.
+    """
+    # The teams and a spelling of each name key, by season
+    seen = {}
+    for (team, seasons) in rosters.items():
+        for (season, players) in seasons.items():
+            season_seen = seen.setdefault(season, {})
+            for player in players:
+                (_, teams) = season_seen.setdefault(name_key(player), (player, set()))
+                teams.add(team)
+
+    shared = {}
+    for (season, season_seen) in seen.items():
+        for (player, teams) in season_seen.values():
+            if len(teams) > 1:
+                shared.setdefault(season, {})[player] = sorted(teams)
+    return shared
+
+
+def _roster_sort_key(player):
+    """Sorts players by last name, as rosters.py does."""
+    return (player.split()[-1] if player.split() else '', player)
+
+
+def format_rosters(rosters):
+    """Returns the source of a Python module that defines rosters, in the
+    format of rosters.py.
+
+    args:
+        rosters: A dictionary of rosters, as in rosters.py.
+
+    returns:
+        A string.
+    """
+    lines = ["#!/usr/bin/env python3", "", roster_note, "rosters = {"]
+    teams = sorted(rosters)
+    for (i, team) in enumerate(teams):
+        lines.append("    " + json.dumps(team) + ": {")
+        seasons = sorted(rosters[team])
+        for (j, season) in enumerate(seasons):
+            lines.append("        " + str(season) + ": set([")
+            players = sorted(rosters[team][season], key=_roster_sort_key)
+            for (k, player) in enumerate(players):
+                comma = "," if k < len(players) - 1 else ""
+                lines.append("            " + json.dumps(player, ensure_ascii=False) + comma)
+            lines.append("        ])" + ("," if j < len(seasons) - 1 else ""))
+        lines.append("    }" + ("," if i < len(teams) - 1 else ""))
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == '__main__':
+    # We only need to parse command line flags if running as the main script
+    import argparse
+    import sys
+
+    argparser = argparse.ArgumentParser(
+            description="Build the rosters from the players listed in a set of raw data files. Compile the result with 'python3 -m data_helpers.roster_store' once it is saved as data_helpers/rosters.py."
+            )
+    argparser.add_argument(
+            "file",
+            type=str,
+            nargs="+",
+            help="a raw data file (or files) to scan, optionally compressed with gzip, bzip2, xz, or zstd, or a tar (optionally compressed the same way) or zip archive of them"
+            )
+    argparser.add_argument(
+            "-o",
+            "--output",
+            help="file to write the rosters to (default: standard output)"
+            )
+    argparser.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            default=None,
+            help="number of processes to use (default: the number of CPUs)"
+            )
+    argparser.add_argument(
+            "--merge",
+            help="add the players already in data_helpers/rosters.py",
+            action="store_true"
+            )
+    argparser.add_argument(
+            "--parser",
+            help="the HTML parser to use (default: html.parser)",
+            choices=backends,
+            default="html.parser"
+            )
+
+    args = argparser.parse_args()
+
+    if not backend_available(args.parser):
+        argparser.error("the '" + args.parser + "' parser is not installed")
+    if args.jobs is not None and args.jobs < 1:
+        argparser.error("--jobs must be at least 1")
+
+    (rosters, failed) = build_rosters(args.file, args.jobs, args.parser)
+    if args.merge:
+        from data_helpers.rosters import rosters as old_rosters
+        merge_rosters(rosters, old_rosters)
+
+    # The report goes to standard error, so the rosters can be piped
+    for (file_name, error) in failed:
+        print("Failed to read '" + file_name + "': " + error, file=sys.stderr)
+    shared = shared_players(rosters)
+    for season in sorted(shared):
+        for (player, teams) in sorted(shared[season].items()):
+            print(
+                    "\tListed for more than one team in " + str(season) + ":",
+                    player,
+                    " ".join(teams),
+                    file=sys.stderr
+                    )
+
+    source = format_rosters(rosters)
+    if args.output is None:
+        sys.stdout.write(source)
+    else:
+        with open(args.output, "w") as out_file:
+            out_file.write(source)
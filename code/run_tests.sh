@@ -12,6 +12,38 @@ printf '%b' '\n++++ Testing test_title_info.py ++++\n'
 python3 -m tests.test_title_info
 printf '%b' '\n++++ End ++++\n'
 
+printf '%b' '\n++++ Testing test_play_by_play.py ++++\n'
+python3 -m tests.test_play_by_play
+printf '%b' '\n++++ End ++++\n'
+
+printf '%b' '\n++++ Testing test_converter.py ++++\n'
+python3 -m tests.test_converter
+printf '%b' '\n++++ End ++++\n'
+
+printf '%b' '\n++++ Testing test_game_writer.py ++++\n'
+python3 -m tests.test_game_writer
+printf '%b' '\n++++ End ++++\n'
+
+printf '%b' '\n++++ Testing test_manifest.py ++++\n'
+python3 -m tests.test_manifest
+printf '%b' '\n++++ End ++++\n'
+
+printf '%b' '\n++++ Testing test_git_version.py ++++\n'
+python3 -m tests.test_git_version
+printf '%b' '\n++++ End ++++\n'
+
+printf '%b' '\n++++ Testing test_roster_builder.py ++++\n'
+python3 -m tests.test_roster_builder
+printf '%b' '\n++++ End ++++\n'
+
+printf '%b' '\n++++ Testing data_helpers/test_aliases.py ++++\n'
+python3 -m tests.data_helpers.test_aliases
+printf '%b' '\n++++ End ++++\n'
+
+printf '%b' '\n++++ Testing data_helpers/test_roster_store.py ++++\n'
+python3 -m tests.data_helpers.test_roster_store
+printf '%b' '\n++++ End ++++\n'
+
 printf '%b' '\n++++ Testing play_by_play/test_general.py ++++\n'
 python3 -m tests.play_by_play.test_general
 printf '%b' '\n++++ End ++++\n'
@@ -35,3 +67,39 @@ printf '%b' '\n++++ End ++++\n'
 printf '%b' '\n++++ Testing play_by_play/test_sanitizer.py ++++\n'
 python3 -m tests.play_by_play.test_sanitizer
 printf '%b' '\n++++ End ++++\n'
+
+printf '%b' '\n++++ Testing play_by_play/test_classifier.py ++++\n'
+python3 -m tests.play_by_play.test_classifier
+printf '%b' '\n++++ End ++++\n'
+
+printf '%b' '\n++++ Testing play_by_play/test_attribution.py ++++\n'
+python3 -m tests.play_by_play.test_attribution
+printf '%b' '\n++++ End ++++\n'
+
+printf '%b' '\n++++ Testing raw_data_readers/test_sections.py ++++\n'
+python3 -m tests.raw_data_readers.test_sections
+printf '%b' '\n++++ End ++++\n'
+
+printf '%b' '\n++++ Testing raw_data_readers/test_play_rows.py ++++\n'
+python3 -m tests.raw_data_readers.test_play_rows
+printf '%b' '\n++++ End ++++\n'
+
+printf '%b' '\n++++ Testing raw_data_readers/test_table_scanner.py ++++\n'
+python3 -m tests.raw_data_readers.test_table_scanner
+printf '%b' '\n++++ End ++++\n'
+
+printf '%b' '\n++++ Testing raw_data_readers/test_backends.py ++++\n'
+python3 -m tests.raw_data_readers.test_backends
+printf '%b' '\n++++ End ++++\n'
+
+printf '%b' '\n++++ Testing raw_data_readers/test_locator.py ++++\n'
+python3 -m tests.raw_data_readers.test_locator
+printf '%b' '\n++++ End ++++\n'
+
+printf '%b' '\n++++ Testing raw_data_readers/test_compressed.py ++++\n'
+python3 -m tests.raw_data_readers.test_compressed
+printf '%b' '\n++++ End ++++\n'
+
+printf '%b' '\n++++ Testing raw_data_readers/test_archives.py ++++\n'
+python3 -m tests.raw_data_readers.test_archives
+printf '%b' '\n++++ End ++++\n'
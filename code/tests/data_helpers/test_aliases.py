@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from data_helpers.aliases import aliases, normalize_name, name_key
+
+
+class TestAliases(unittest.TestCase):
+
+    def test_normalize_name(self):
+        # Successful
+        self.assertEqual(normalize_name("J.J. McCleskey"), "jj mccleskey")
+        self.assertEqual(normalize_name("J. J. McCleskey"), "jj mccleskey")
+        self.assertEqual(normalize_name("JJ McCleskey"), "jj mccleskey")
+        self.assertEqual(normalize_name(" Jerome  Bettis "), "jerome bettis")
+        self.assertEqual(normalize_name("J. R. R. Tolkien"), "jrr tolkien")
+        self.assertEqual(normalize_name("Irène Joliot-Curie"), "irène joliot-curie")
+        self.assertEqual(normalize_name("D'Angelo Barksdale"), "d'angelo barksdale")
+        # A lone initial is not joined to a whole word
+        self.assertEqual(normalize_name("Steve J. Smith"), "steve j smith")
+        self.assertEqual(normalize_name(""), "")
+
+    def test_name_key(self):
+        # Successful
+        self.assertEqual(name_key("Trent Robinson"), "trenton robinson")
+        self.assertEqual(name_key("Trenton Robinson"), "trenton robinson")
+        self.assertEqual(name_key("TRENT  ROBINSON"), "trenton robinson")
+        self.assertEqual(name_key("J.J. McCleskey"), "jj mccleskey")
+        # Every variant has the same key as its canonical name
+        for (variant, canonical) in aliases.items():
+            self.assertEqual(name_key(variant), name_key(canonical))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+import tempfile
+import unittest
+
+from data_helpers.aliases import name_key
+from data_helpers.roster_store import write_store, RosterStore, PlayerSet, get_roster
+
+
+class TestRosterStore(unittest.TestCase):
+
+    def __set_roster_consts(self):
+        """Set rosters to be used by the roster store tests."""
+        self.rosters = {
+            "PIT": {
+                2005: set(["Jerome Bettis", "Ben Roethlisberger", "Hines Ward"]),
+                2006: set(["Willie Parker", "Hines Ward"]),
+            },
+            "SEA": {
+                2005: set(["Shaun Alexander", "Matt Hasselbeck", "Jérôme Léger", "J.J. Jones", "J. J. Jones"]),
+                2006: set(),
+            },
+        }
+
+    def test_write_store(self):
+        self.__set_roster_consts()
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "rosters.dat")
+            write_store(self.rosters, file_name)
+            store = RosterStore(file_name)
+            # Successful
+            for (team, seasons) in self.rosters.items():
+                for (season, players) in seasons.items():
+                    roster = store.roster(team, season)
+                    keys = set(name_key(player) for player in players)
+                    self.assertEqual(set(roster), keys)
+                    self.assertEqual(len(roster), len(keys))
+            self.assertEqual(len(store.roster("SEA", 2005)), 4)
+            self.assertIn("Jérôme Léger", store.roster("SEA", 2005))
+            self.assertIn("JJ Jones", store.roster("SEA", 2005))
+            self.assertIn("matt hasselbeck", store.roster("SEA", 2005))
+            self.assertNotIn("Jérôme Léger", store.roster("PIT", 2005))
+            self.assertNotIn("Tom Brady", store.roster("PIT", 2005))
+            self.assertNotIn(None, store.roster("PIT", 2005))
+            # Every player is stored once
+            self.assertEqual(len(store.names), 8)
+            self.assertEqual(store.teams(), {"PIT": [2005, 2006], "SEA": [2005, 2006]})
+            # Rosters are only loaded once
+            self.assertIs(store.roster("PIT", 2005), store.roster("PIT", 2005))
+            # Failure
+            self.assertRaises(KeyError, store.roster, "PIT", 2007)
+            self.assertRaises(KeyError, store.roster, "DEN", 2005)
+
+    def test_threads(self):
+        self.__set_roster_consts()
+        team_seasons = [
+                (team, season)
+                for (team, seasons) in self.rosters.items()
+                for season in seasons
+                ] * 50
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "rosters.dat")
+            write_store(self.rosters, file_name)
+            store = RosterStore(file_name)
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                rosters = list(executor.map(lambda args: store.roster(*args), team_seasons))
+            # Every thread gets the same, fully loaded, roster
+            for (team_season, roster) in zip(team_seasons, rosters):
+                self.assertIs(roster, store.roster(*team_season))
+            self.assertIn("Hines Ward", store.roster("PIT", 2006))
+
+    def test_not_a_store(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "rosters.dat")
+            with open(file_name, "wb") as file_handle:
+                file_handle.write(b"rosters = {}\n")
+            self.assertRaises(ValueError, RosterStore(file_name).roster, "PIT", 2005)
+
+    def test_get_roster(self):
+        self.assertIn("Jerome Bettis", get_roster("PIT", 2005))
+        self.assertRaises(KeyError, get_roster, "PIT", 1066)
+
+    def test_store_is_current(self):
+        # The store must be rebuilt with "python3 -m data_helpers.roster_store"
+        # whenever rosters.py is edited
+        from data_helpers.rosters import rosters
+        store = RosterStore()
+        self.assertEqual(
+                store.teams(),
+                {team: sorted(seasons) for (team, seasons) in rosters.items()}
+                )
+        for (team, seasons) in rosters.items():
+            for (season, players) in seasons.items():
+                self.assertEqual(
+                        set(store.roster(team, season)),
+                        set(name_key(player) for player in players)
+                        )
+
+    def test_player_set(self):
+        self.__set_roster_consts()
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "rosters.dat")
+            write_store(self.rosters, file_name)
+            roster = RosterStore(file_name).roster("PIT", 2005)
+        players = PlayerSet(roster)
+        players.add("Hines Ward")
+        players.add("HINES WARD")
+        players.add("H. Ward")
+        players.add("Troy Polamalu")
+        players.add("Troy  Polamalu")
+        # Only the new players are kept
+        self.assertEqual(players.extra, set(["h ward", "troy polamalu"]))
+        self.assertIn("Troy Polamalu", players)
+        self.assertIn("Jerome Bettis", players)
+        self.assertIn("H Ward", players)
+        self.assertNotIn("Tom Brady", players)
+        self.assertNotIn(None, players)
+        self.assertEqual(len(players), 5)
+        self.assertEqual(
+                set(players),
+                set(["jerome bettis", "ben roethlisberger", "hines ward", "h ward", "troy polamalu"])
+                )
+        # The roster is shared, not copied
+        self.assertIs(players.roster, roster)
+        self.assertNotIn("Troy Polamalu", roster)
+        # Empty
+        players = PlayerSet()
+        players.add("Troy Polamalu")
+        self.assertEqual(set(players), set(["troy polamalu"]))
+        self.assertIn("TROY POLAMALU", players)
+
+
+if __name__ == '__main__':
+    unittest.main()
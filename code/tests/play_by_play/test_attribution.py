@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+from contextlib import redirect_stdout
+from io import StringIO
+import unittest
+
+from data_helpers.roster_store import PlayerSet
+from raw_data_parsers.play_by_play.attribution import TeamIndex
+
+
+class TestTeamIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = TeamIndex(
+                "PIT",
+                "BAL",
+                ("Ben Roethlisberger", "Jerome Bettis", "Smith"),
+                ("Ray Lewis", "Ed Reed", "Smith")
+                )
+
+    def test_team(self):
+        # Players
+        self.assertEqual(self.index.team("Jerome Bettis"), "home")
+        self.assertEqual(self.index.team("Ray Lewis"), "away")
+        # Team codes and PFR codes
+        self.assertEqual(self.index.team("PIT"), "home")
+        self.assertEqual(self.index.team("BAL"), "away")
+        self.assertEqual(self.index.team("RAV"), "away")
+        # Unknown names
+        self.assertEqual(self.index.team("Tom Brady"), None)
+        self.assertEqual(self.index.team("NWE"), None)
+        self.assertEqual(self.index.team(None), None)
+        self.assertEqual(self.index.team(False), None)
+
+    def test_team_ambiguous(self):
+        out = StringIO()
+        with redirect_stdout(out):
+            self.assertEqual(self.index.team("Smith"), "ambiguous")
+            self.assertEqual(self.index.team("Smith"), "ambiguous")
+        # Only reported the first time
+        self.assertEqual(out.getvalue(), "\tDEGENERATE PLAYER! Smith BAL at PIT\n")
+
+    def test_team_codes_win(self):
+        index = TeamIndex("PIT", "BAL", ("BAL", "RAV"), ())
+        self.assertEqual(index.team("BAL"), "away")
+        self.assertEqual(index.team("RAV"), "home")
+
+    def test_team_spellings(self):
+        home_players = PlayerSet()
+        home_players.add("J.J. McCleskey")
+        away_players = PlayerSet()
+        away_players.add("Trenton Robinson")
+        index = TeamIndex("PIT", "BAL", home_players, away_players)
+        self.assertEqual(index.team("J. J. McCleskey"), "home")
+        self.assertEqual(index.team("Trent Robinson"), "away")
+
+
+if __name__ == '__main__':
+    unittest.main()
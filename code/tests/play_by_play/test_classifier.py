@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+from contextlib import redirect_stdout
+import io
+import unittest
+
+from raw_data_parsers.play_by_play.classifier import classify_play, get_penalty_spans, get_turnover_spans
+from raw_data_parsers.play_by_play.penalty import split_penalties
+from raw_data_parsers.play_by_play.play import get_play_type, get_scoring_type
+from raw_data_parsers.play_by_play.sanitizer import get_challenge_type, remove_challenge
+from raw_data_parsers.play_by_play.turnover import split_turnovers
+
+
+class TestPlayByPlayClassifier(unittest.TestCase):
+
+    def __set_classifier_consts(self):
+        """Set descriptions to be used by the classifier tests."""
+        self.descriptions = (
+            "--",
+            "",
+            "Isaac Newton punts 52 yards, returned by Gottfried Wilhelm von Leibniz for -7 yards (tackle by Royal Society)",
+            "Two Point Attempt: Saul Perlmutter pass incomplete, conversion fails. Penalty on SFO : Illegal Touch Pass (Declined)",
+            "Two Point Attempt: Pheidippides up the middle, conversion succeeds",
+            "Julius Caesar kicks off 70 yards, muffed catch by Mark Antony, recovered by Gaius Octavius and returned for no gain",
+            "Jean-Luc Picard kicks onside 13 yards, recovered by Lore . G. La Forge fumbles, recovered by Data at CHI-41",
+            "Penalty on Major Strasser : Being a Fascist, 5 yards, Penalty on Captain Louis Renault : Taking Bribes (Declined)",
+            "Ugarte killed by Captain Louis Renault for no gain. Ugarte fumbles the letters of transit (forced by Captain Louis Renault), recovered by Rick Blaine at RCA (tackle by Illsa Lund). Penalty on Major Strasser : Being a Fascist, 5 yards",
+            "C. J. Browne pass incomplete short right intended for D. P. Lindley . C. J. Browne fumbles, recovered by C. J. Browne at SEA -14",
+            "J. McNulty pass incomplete intended for B. Russell is intercepted by D'Angelo Barksdale at LOC -24. J. McNulty fumbles, recovered by J. McNulty at LOC -20",
+            "Robert De Niro pass incomplete short middle intended for Jean Reno is intercepted by Stellan Skarsgård at PLC -9 and returned for 31 yards (tackle by Jean Reno). Stellan Skarsgård fumbles (forced by Jean Reno ), recovered by Sean Bean at PLC -44",
+            "G. W. Bush up the middle for -2 yards (tackle by A. Gore ). G. W. Bush fumbles (forced by A. Gore ), recovered by W. Rehnquist at LOC -26 and returned for 74 yards, touchdown. Replay Assistant challenged the fumble ruling, and the play was upheld.",
+            "John Adams pass incomplete short middle intended for William Marbury is intercepted by John Marshall at LOC -17 and returned for 12 yards (tackle by John Adams ). Replay Assistant challenged the pass completion ruling, and the play was overturned. John Adams pass incomplete short middle intended for William Marbury (defended by John Marshall )",
+            "PIT challenged the runner was down by contact ruling, and the play was REVERSED.",
+            "Shaun Suisham 31 yard field goal good",
+            "Shaun Suisham kicks extra point good",
+            "Ben Roethlisberger kneels for -1 yards",
+            "Ben Roethlisberger spiked the ball",
+            "Timeout #1 by Pittsburgh Steelers",
+            "Aborted snap. Ben Roethlisberger recovers at PIT-30",
+            "Jerome Bettis up the middle for 4 yards, touchdown",
+            "Ben Roethlisberger sacked by Ray Lewis for -8 yards. Ben Roethlisberger fumbles, safety",
+            "Ben Roethlisberger pass complete deep left to Hines Ward for 45 yards, touchdown",
+            "Hines Ward fumbled intended for Santonio Holmes fumbles .",
+        )
+
+    def test_classify_play(self):
+        self.__set_classifier_consts()
+        for description in self.descriptions:
+            # The original functions print warnings we don't need
+            with redirect_stdout(io.StringIO()):
+                challenge = get_challenge_type(description)
+                sanitized = remove_challenge(description)
+                play_type = get_play_type(sanitized)
+                scoring_type = get_scoring_type(sanitized)
+            result = classify_play(description)
+            self.assertEqual(result["challenge"], challenge)
+            self.assertEqual(result["description"], sanitized)
+            self.assertEqual(result["type"], play_type)
+            self.assertEqual(result["scoring"], scoring_type)
+            self.assertEqual(
+                    [sanitized[start:end] for (start, end) in result["penalties"]],
+                    split_penalties(sanitized)
+                    )
+            self.assertEqual(
+                    [sanitized[start:end] for (start, end) in result["turnovers"]],
+                    split_turnovers(sanitized)
+                    )
+        # Failure
+        self.assertRaises(
+                IndexError,
+                classify_play,
+                "PIT challenged the ruling, and the play was overturned"
+                )
+
+    def test_get_penalty_spans(self):
+        self.assertEqual(get_penalty_spans("No penalty"), [])
+        self.assertEqual(
+                get_penalty_spans("Run. Penalty on A : B, Penalty on C : D"),
+                [(5, 23), (23, 39)]
+                )
+
+    def test_get_turnover_spans(self):
+        self.assertEqual(get_turnover_spans("Sisyphus up the middle for no gain."), [])
+        self.assertEqual(
+                get_turnover_spans("A for no gain. A fumbles, recovered by B at C"),
+                [(15, 45)]
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 
+from contextlib import redirect_stdout
 import unittest
 import sys
 import os
 
-from raw_data_parsers.play_by_play.general import row_type, get_kicking_offense
+from raw_data_parsers.play_by_play.attribution import TeamIndex
+from raw_data_parsers.play_by_play.general import row_type, play_row_type, get_kicking_offense, get_indexed_kicking_offense
+from raw_data_readers.play_rows import PlayRow
 
 
 class TestPlayByPlay(unittest.TestCase):
@@ -38,6 +41,43 @@ class TestPlayByPlay(unittest.TestCase):
         self.assertEqual(row_type("3rd Quarter"), 3)
         self.assertEqual(row_type("4th Quarter"), 4)
 
+    def test_play_row_type(self):
+        # Plays are found from the cells alone, even if they mention "End"
+        self.assertEqual(
+                play_row_type(PlayRow(
+                    [],
+                    [],
+                    ["2", "4:33", "1", "10", "DEN 34", "Joe left end for 5 yards. End Around", "7", "3", "0.1", "0.2"]
+                    )),
+                0
+                )
+        # Other rows are looked at as text
+        self.assertEqual(
+                play_row_type(PlayRow(
+                    ["thead"],
+                    ["Quarter", "Time", "Down", "ToGo", "Location", "Detail", "RAV", "DEN", "EPB", "EPA"],
+                    []
+                    )),
+                -1
+                )
+        self.assertEqual(
+                play_row_type(PlayRow(
+                    ["thead"],
+                    [],
+                    ["Quarter", "Time", "Down", "ToGo", "Location", "Detail", "RAV", "DEN", "EPB", "EPA"]
+                    )),
+                -1
+                )
+        self.assertEqual(
+                play_row_type(PlayRow(["thead", "onecell"], [], ["2nd Quarter"])),
+                2
+                )
+        self.assertEqual(
+                play_row_type(PlayRow(None, [], ["End of Overtime", "38", "35", "0", "0"])),
+                6
+                )
+        self.assertEqual(play_row_type(PlayRow(None, [], ["Overtime"])), 5)
+
     def test_get_kicking_offense(self):
         self.__set_kicking_consts()
         # Successful
@@ -120,6 +160,39 @@ class TestPlayByPlay(unittest.TestCase):
             sys.stdout = oldstdout
             f.close()
 
+    def test_get_indexed_kicking_offense(self):
+        self.__set_kicking_consts()
+        index = TeamIndex(
+                "DEN",
+                "SEA",
+                ("B. Simpson", "L. Simpson", "Moe Howard"),
+                ("M. Simpson", "Moe Howard")
+                )
+        # Successful
+        self.assertEqual(get_indexed_kicking_offense("DEN 35", "", index), "away")
+        self.assertEqual(get_indexed_kicking_offense("SEA 35", "", index), "home")
+        self.assertEqual(
+                get_indexed_kicking_offense("", self.kicks[0], index),
+                "away"
+                )
+        # Failure
+        self.assertRaises(
+                KeyError,
+                get_indexed_kicking_offense, "PTC 35", "", index
+                )
+        # We squelch the warning from this test
+        with open(os.devnull, 'w') as f, redirect_stdout(f):
+            # Degenerate kicker
+            self.assertEqual(
+                    get_indexed_kicking_offense("", self.kicks[1], index),
+                    None
+                    )
+            # Unknown kicker
+            self.assertEqual(
+                    get_indexed_kicking_offense("", self.kicks[2], index),
+                    None
+                    )
+
 
 if __name__ == '__main__':
     unittest.main()
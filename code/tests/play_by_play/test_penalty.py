@@ -2,7 +2,8 @@
 
 import unittest
 
-from raw_data_parsers.play_by_play.penalty import split_penalties, get_penalty_team, get_penalty_player, get_penalty_yards, get_penalty_type, get_penalty_name
+from raw_data_parsers.play_by_play.attribution import TeamIndex
+from raw_data_parsers.play_by_play.penalty import split_penalties, get_penalty_team, get_penalty_player, get_penalty_yards, get_penalty_type, get_penalty_name, parse_penalty, get_parsed_penalty_team, get_parsed_penalty_player
 
 
 class TestPlayByPlay(unittest.TestCase):
@@ -225,6 +226,53 @@ class TestPlayByPlay(unittest.TestCase):
                 "Illegal Fog"
                 )
 
+    def test_parse_penalty(self):
+        self.__set_penalty_consts()
+        # Successful
+        self.assertEqual(
+                parse_penalty(self.penalty_splits[1][0]),
+                {
+                    "name": "Too many ghosts on the field",
+                    "infractor": "XMAS",
+                    "yards": 5,
+                    "type": "no play",
+                    "side": None,
+                    }
+                )
+        self.assertEqual(
+                parse_penalty(self.penalty_splits[2][1]),
+                {
+                    "name": "Taking Bribes",
+                    "infractor": "Captain Louis Renault",
+                    "yards": None,
+                    "type": "declined",
+                    "side": None,
+                    }
+                )
+        self.assertEqual(parse_penalty(self.penalty_splits[4][0])["side"], "offense")
+        self.assertEqual(parse_penalty(self.penalty_splits[5][0])["side"], "defense")
+        # Matches the separate functions
+        teams = ('', 'SF', 'XMAS', ("Captain Louis Renault", "Romeo"), ("Major Strasser",))
+        for splits in self.penalty_splits:
+            for split in splits:
+                penalty = parse_penalty(split)
+                self.assertEqual(penalty["name"], get_penalty_name(split))
+                self.assertEqual(penalty["yards"], get_penalty_yards(split))
+                self.assertEqual(penalty["type"], get_penalty_type(split))
+                self.assertEqual(
+                        get_parsed_penalty_player(penalty, teams[1], teams[2]),
+                        get_penalty_player(split, teams[1], teams[2])
+                        )
+                for off_team in ("home", "away"):
+                    self.assertEqual(
+                            get_parsed_penalty_team(penalty, off_team, TeamIndex(*teams[1:])),
+                            get_penalty_team(split, off_team, *teams[1:])
+                            )
+        # Failure
+        self.assertRaises(ValueError, parse_penalty, "Penalty on X : Holding, Ten yards")
+        self.assertRaises(IndexError, parse_penalty, "Penalty on X, 5 yards")
+        self.assertRaises(IndexError, parse_penalty, "Holding : 5 yards")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 
+import random
+import re
+from time import perf_counter
 import unittest
 
-from raw_data_parsers.play_by_play.turnover import split_turnovers, get_turnover_type, get_turnover_recoverer, get_turnover_committer, get_turnover_teams
+from raw_data_parsers.play_by_play.attribution import TeamIndex
+from raw_data_parsers.play_by_play.turnover import split_turnovers, split_regex, iter_turnover_delimiters, get_turnover_type, get_turnover_recoverer, get_turnover_committer, get_turnover_teams, parse_turnover, get_parsed_turnover_teams
 
 
 class TestPlayByPlayTurnover(unittest.TestCase):
@@ -126,6 +130,51 @@ class TestPlayByPlayTurnover(unittest.TestCase):
                 self.turnover_splits[13]
                 )
 
+    def test_iter_turnover_delimiters(self):
+        # Random strings made of the pieces the delimiters are made of must be
+        # split exactly as the regex would split them
+        pieces = (
+            "intended for", "recovered by", "intended fore", " ", ".", " .",
+            "Bob", "O'Neil", "-", "J.", " yards.", " yard.", "3.", ").",
+            " gain.", " safety.", " incomplete.", " snap.", "fumbles", "é",
+        )
+        regex = re.compile(split_regex)
+        rand = random.Random(2012)
+        for _ in range(20000):
+            col = ''.join(
+                    rand.choice(pieces) for _ in range(rand.randint(0, 16))
+                    )
+            expected = [
+                    (
+                        match.start(),
+                        match.end(),
+                        [
+                            match.span(i) if match.start(i) != -1 else None
+                            for i in range(1, regex.groups + 1)
+                        ]
+                    )
+                    for match in regex.finditer(col)
+                    ]
+            self.assertEqual(list(iter_turnover_delimiters(col)), expected)
+
+    def test_split_turnovers_time(self):
+        # Descriptions that make a backtracking regex take time quadratic in
+        # their length, none of which should take long
+        ceiling = 0.25  # Seconds per call
+        adversarial = (
+            "intended for a b c " * 2000 + "fumbles",
+            "recovered by Joe " * 2000 + "fumble",
+            "intended for recovered by " * 2000 + "muffed",
+            "intended for " + "a " * 20000 + "fumbles",
+            "intended for" + " ." * 5000 + "x fumble",
+            "intended for" + " a.b-c'd" * 5000 + "!fumble",
+            "Bob fumbles 3" * 5000,
+        )
+        for col in adversarial:
+            start = perf_counter()
+            split_turnovers(col)
+            self.assertLess(perf_counter() - start, ceiling)
+
     def test_get_turnover_type(self):
         self.__set_turnover_consts()
         # Successful
@@ -442,6 +491,41 @@ class TestPlayByPlayTurnover(unittest.TestCase):
                 ("away", False)
                 )
 
+    def test_parse_turnover(self):
+        self.__set_turnover_consts()
+        # Successful
+        self.assertEqual(
+                parse_turnover(self.turnover_splits[0][0]),
+                {
+                    "type": "fumble",
+                    "committer": "Josiah Barlet",
+                    "recoverer": "Matt Santos",
+                    }
+                )
+        self.assertEqual(
+                parse_turnover(self.turnover_splits[7][0]),
+                {
+                    "type": "fumble",
+                    "committer": "Men Without Hats",
+                    "recoverer": False,
+                    }
+                )
+        # Matches the separate functions
+        home_players = ("Josiah Barlet", "Tom Petty", "Ugarte", "Rick Blaine", "J. McNulty", "Data")
+        away_players = ("Matt Santos", "Bob Dylan", "Sherlock Holmes", "Sean Bean", "Lore")
+        for splits in self.turnover_splits:
+            for split in splits:
+                turnover = parse_turnover(split)
+                self.assertEqual(turnover["type"], get_turnover_type(split))
+                self.assertEqual(turnover["committer"], get_turnover_committer(split))
+                self.assertEqual(turnover["recoverer"], get_turnover_recoverer(split))
+                self.assertEqual(
+                        get_parsed_turnover_teams(turnover, TeamIndex("", "", home_players, away_players)),
+                        get_turnover_teams(split, home_players, away_players)
+                        )
+        # Failure
+        self.assertRaises(IndexError, parse_turnover, "muffed, recovered")
+
 
 if __name__ == '__main__':
     unittest.main()
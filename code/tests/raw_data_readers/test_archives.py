@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+import gzip
+import io
+import os
+import shutil
+import tarfile
+import tempfile
+import unittest
+import zipfile
+
+from raw_data_readers.archives import is_archive, iter_archive, iter_raw_files
+from raw_data_readers.locator import read_sections
+
+
+class TestArchives(unittest.TestCase):
+
+    def __set_archive_consts(self):
+        """Set the pages to be stored in the test archives."""
+        self.pages = {
+            "season/game1.htm": b"<title>Game 1</title><p>1</p>",
+            "season/game2.htm.gz": gzip.compress(b"<title>Game 2</title><p>2</p>"),
+        }
+        self.titles = {
+            "season/game1.htm": "<title>Game 1</title>",
+            "season/game2.htm.gz": "<title>Game 2</title>",
+        }
+        self.directory = tempfile.mkdtemp()
+
+    def __make_tar(self, file_name, mode):
+        with tarfile.open(file_name, mode) as archive:
+            directory = tarfile.TarInfo("season")
+            directory.type = tarfile.DIRTYPE
+            archive.addfile(directory)
+            for name, data in self.pages.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                archive.addfile(info, io.BytesIO(data))
+
+    def __make_zip(self, file_name):
+        with zipfile.ZipFile(file_name, "w") as archive:
+            archive.writestr("season/", b"")
+            for name, data in self.pages.items():
+                archive.writestr(name, data)
+
+    def test_is_archive(self):
+        self.assertTrue(is_archive("2012.tar"))
+        self.assertTrue(is_archive("2012.tar.gz"))
+        self.assertTrue(is_archive("2012.tgz"))
+        self.assertTrue(is_archive("2012.tar.bz2"))
+        self.assertTrue(is_archive("2012.tbz2"))
+        self.assertTrue(is_archive("2012.txz"))
+        self.assertTrue(is_archive("2012.tar.xz"))
+        self.assertTrue(is_archive("2012.tar.zst"))
+        self.assertTrue(is_archive("2012.zip"))
+        self.assertFalse(is_archive("game.htm"))
+        self.assertFalse(is_archive("game.htm.gz"))
+        self.assertFalse(is_archive("game.htm.bz2"))
+
+    def test_iter_archive(self):
+        self.__set_archive_consts()
+        try:
+            archives = {
+                "season.tar": lambda name: self.__make_tar(name, "w"),
+                "season.tar.gz": lambda name: self.__make_tar(name, "w:gz"),
+                "season.tgz": lambda name: self.__make_tar(name, "w:gz"),
+                "season.tar.bz2": lambda name: self.__make_tar(name, "w:bz2"),
+                "season.tbz2": lambda name: self.__make_tar(name, "w:bz2"),
+                "season.tar.xz": lambda name: self.__make_tar(name, "w:xz"),
+                "season.txz": lambda name: self.__make_tar(name, "w:xz"),
+                "season.zip": self.__make_zip,
+            }
+            for archive_name, make in archives.items():
+                file_name = os.path.join(self.directory, archive_name)
+                make(file_name)
+                members = {}
+                for (name, member) in iter_archive(file_name):
+                    members[name] = member.read()
+                self.assertEqual(members, self.pages)
+        finally:
+            shutil.rmtree(self.directory)
+
+    def test_iter_raw_files(self):
+        self.__set_archive_consts()
+        try:
+            file_name = os.path.join(self.directory, "season.tar")
+            self.__make_tar(file_name, "w")
+            titles = {}
+            for (name, member, raw_dir) in iter_raw_files(["game.htm", file_name]):
+                if member is None:
+                    self.assertEqual(name, "game.htm")
+                    self.assertEqual(raw_dir, None)
+                    continue
+                self.assertEqual(raw_dir, os.path.realpath(self.directory))
+                # Compressed members are decompressed as they are read
+                titles[os.path.relpath(name, file_name)] = read_sections(
+                        name, "utf-8", file_obj=member
+                        )
+            self.assertEqual(titles, self.titles)
+        finally:
+            shutil.rmtree(self.directory)
+
+
+if __name__ == '__main__':
+    unittest.main()
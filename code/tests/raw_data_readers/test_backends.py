@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from raw_data_readers.backends import backends, backend_available, make_tree, make_soup
+
+
+class TestBackends(unittest.TestCase):
+
+    def __set_backend_consts(self):
+        """Set a page to be used by the backend tests."""
+        self.page = (
+            "<html><head><title>Rams at Seahawks - January 2nd, 2012</title></head><body>"
+            "<p>Not a table</p>"
+            "<table id='ref_info'><tr><td>Referee</td><td>Ed Hochuli</td></tr></table>"
+            "<table id='pbp_data'><tr><td>1</td></tr></table>"
+            "</body></html>"
+        )
+
+    def test_backend_available(self):
+        # The standard library is always there
+        self.assertTrue(backend_available("html.parser"))
+        self.assertTrue(backend_available("scanner"))
+        # Failure
+        self.assertRaises(KeyError, backend_available, "not a parser")
+
+    def test_make_tree(self):
+        self.__set_backend_consts()
+        for backend in backends:
+            if not backend_available(backend):
+                continue
+            tree = make_tree(self.page, backend)
+            self.assertEqual(
+                    [td.get_text() for td in tree.find(id="ref_info").find_all("td")],
+                    ["Referee", "Ed Hochuli"]
+                    )
+            # html5lib can't skip parts of the page, so it keeps everything
+            if backend != "html5lib":
+                self.assertEqual(tree.find("p"), None)
+            tree = make_tree(self.page, backend, skip_ids=("pbp_data",))
+            self.assertEqual(tree.find(id="pbp_data"), None)
+            self.assertNotEqual(tree.find(id="ref_info"), None)
+
+    def test_make_soup(self):
+        self.__set_backend_consts()
+        for backend in backends:
+            if not backend_available(backend):
+                continue
+            soup = make_soup(self.page, {"name": "title"}, backend)
+            self.assertEqual(
+                    soup.find("title").get_text(),
+                    "Rams at Seahawks - January 2nd, 2012"
+                    )
+            self.assertEqual(soup.find("td"), None)
+
+
+if __name__ == '__main__':
+    unittest.main()
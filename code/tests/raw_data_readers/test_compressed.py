@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+import bz2
+import gzip
+import lzma
+import os
+import tempfile
+import unittest
+
+from raw_data_readers.compressed import is_compressed, open_raw_file, zstandard
+from raw_data_readers.locator import read_sections
+
+
+class TestCompressed(unittest.TestCase):
+
+    def __set_compressed_consts(self):
+        """Set a page to be used by the compression tests."""
+        self.page = (
+            b"<html><head><title>Rams at Seahawks</title></head><body>"
+            b"<p>Not a table</p>"
+            b"<table id='pbp_data'><tr><td>1</td></tr></table>"
+            b"</body></html>"
+        )
+        self.sections = (
+            "<title>Rams at Seahawks</title>\n"
+            "<table id='pbp_data'><tr><td>1</td></tr></table>"
+        )
+        self.compressors = {
+            ".htm": lambda data: data,
+            ".htm.gz": gzip.compress,
+            ".htm.bz2": bz2.compress,
+            ".htm.xz": lzma.compress,
+        }
+        if zstandard is not None:
+            self.compressors[".htm.zst"] = zstandard.ZstdCompressor().compress
+
+    def test_is_compressed(self):
+        self.assertTrue(is_compressed("game.htm.gz"))
+        self.assertTrue(is_compressed("game.htm.bz2"))
+        self.assertTrue(is_compressed("game.htm.xz"))
+        self.assertTrue(is_compressed("game.htm.zst"))
+        self.assertFalse(is_compressed("game.htm"))
+        self.assertFalse(is_compressed("game.gz.htm"))
+
+    def test_open_raw_file(self):
+        self.__set_compressed_consts()
+        for suffix, compress in self.compressors.items():
+            (handle, file_name) = tempfile.mkstemp(suffix=suffix)
+            try:
+                with os.fdopen(handle, "wb") as file_handle:
+                    file_handle.write(compress(self.page))
+                with open_raw_file(file_name) as file_handle:
+                    self.assertEqual(file_handle.read(), self.page)
+                # Small chunks make the locator work across chunk boundaries
+                self.assertEqual(
+                        read_sections(file_name, "utf-8", chunk_size=7),
+                        self.sections
+                        )
+            finally:
+                os.remove(file_name)
+
+
+if __name__ == '__main__':
+    unittest.main()
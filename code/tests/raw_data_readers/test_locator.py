@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+import os
+import tempfile
+import unittest
+
+from raw_data_readers.locator import locate_sections, decode_sections, read_sections, SectionLocator
+
+
+class TestLocator(unittest.TestCase):
+
+    def __set_locator_consts(self):
+        """Set a page to be used by the locator tests."""
+        self.title = b"<title>Rams at Seahawks - January 2nd, 2012</title>"
+        self.ref_table = (
+            b"<TABLE id='ref_info'><tr><td>Referee</td>"
+            b"<td><table><tr><td>Ed Hochuli</td></tr></table></td></tr></table >"
+        )
+        self.pbp_table = b"<table id='pbp_data'><tr><td>1</td></tr></table>"
+        self.page = (
+            b"<html><head>" + self.title + b"</head><body>"
+            b"<p>Not a table</p><tablet>Not a table either</tablet>"
+            b"<!-- <table id='commented'></table> -->"
+            b"<script>var s = '<table>';</script>"
+            + self.ref_table +
+            b"<div>In between</div>"
+            + self.pbp_table +
+            b"</body></html>"
+        )
+
+    def test_locate_sections(self):
+        self.__set_locator_consts()
+        spans = locate_sections(self.page)
+        self.assertEqual(
+                [self.page[start:end] for (start, end) in spans],
+                [self.title, self.ref_table, self.pbp_table]
+                )
+        # A table that is never closed runs to the end
+        page = b"<table><tr><td>1</td>"
+        self.assertEqual(locate_sections(page), [(0, len(page))])
+        # Nothing to find
+        self.assertEqual(locate_sections(b"<p>Nothing</p>"), [])
+        self.assertEqual(locate_sections(b""), [])
+
+    def test_section_locator(self):
+        self.__set_locator_consts()
+        # Every chunk size must find the same sections as the whole page
+        for chunk_size in (1, 2, 3, 5, 7, 11, 64, len(self.page)):
+            locator = SectionLocator()
+            for start in range(0, len(self.page), chunk_size):
+                locator.feed(self.page[start:start + chunk_size])
+            locator.close()
+            self.assertEqual(
+                    locator.sections,
+                    [self.title, self.ref_table, self.pbp_table]
+                    )
+        # A table that is never closed runs to the end
+        locator = SectionLocator()
+        locator.feed(b"<p></p><table><tr>")
+        locator.feed(b"<td>1</td>")
+        locator.close()
+        self.assertEqual(locator.sections, [b"<table><tr><td>1</td>"])
+
+    def test_decode_sections(self):
+        self.__set_locator_consts()
+        page = b"<table>\r\n<tr><td>Caf\xc3\xa9\r</td></tr></table>"
+        self.assertEqual(
+                decode_sections(page, locate_sections(page), "utf-8"),
+                "<table>\n<tr><td>Café\n</td></tr></table>"
+                )
+
+    def test_read_sections(self):
+        self.__set_locator_consts()
+        (handle, file_name) = tempfile.mkstemp(suffix=".htm")
+        try:
+            with os.fdopen(handle, "wb") as file_handle:
+                file_handle.write(self.page)
+            text = read_sections(file_name, "utf-8")
+            self.assertEqual(
+                    text,
+                    "\n".join(
+                        s.decode("utf-8")
+                        for s in (self.title, self.ref_table, self.pbp_table)
+                        )
+                    )
+            # Empty files can't be memory mapped, but have nothing to read
+            with open(file_name, "wb"):
+                pass
+            self.assertEqual(read_sections(file_name), '')
+        finally:
+            os.remove(file_name)
+
+
+if __name__ == '__main__':
+    unittest.main()
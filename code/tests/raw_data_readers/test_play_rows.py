@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+import io
+import unittest
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from raw_data_readers.play_rows import PlayRow, iter_play_rows, soup_play_rows
+
+
+class TestPlayRows(unittest.TestCase):
+
+    def __set_play_row_consts(self):
+        """Set a page to be used by the play row tests."""
+        self.page = (
+            "<html><head><title>Game</title><script>var t = '<tr><td>no</td></tr>';</script></head><body>"
+            "<table id='other'><tr class='x'><td>Not a play</td></tr></table>"
+            "<table id='pbp_data'><thead><tr><th>Quarter</th><th>Time</th><th>Down</th></tr></thead><tbody>"
+            "<tr class='thead onecell'><td colspan='8'>1st Quarter</td></tr>"
+            "<tr class=''><td>1</td><td>15:00</td><td></td><td></td><td>DEN 35</td>"
+            "<td><a href='/p'>Matt Prater</a> kicks off 65 yards, touchback &amp; more</td><td>0</td><td>0</td></tr>"
+            "<tr class='is_scoring pos_change'><td>1</td><td>14:12</td><td>1</td><td>10</td><td>BAL 20</td>"
+            "<td>Joe\nFlacco pass <!-- comment -->complete</td><td>0</td><td>7</td></tr>"
+            "<tr><td>2</td></tr>"
+            "</tbody></table>"
+            "<table><tr class='late'><td>After the table</td></tr></table>"
+            "</body></html>"
+        )
+        self.rows = [
+            PlayRow(None, ["Quarter", "Time", "Down"], []),
+            PlayRow(["thead", "onecell"], [], ["1st Quarter"]),
+            PlayRow(
+                [],
+                [],
+                ["1", "15:00", "", "", "DEN 35", "Matt Prater kicks off 65 yards, touchback & more", "0", "0"]
+                ),
+            PlayRow(
+                ["is_scoring", "pos_change"],
+                [],
+                ["1", "14:12", "1", "10", "BAL 20", "Joe\nFlacco pass complete", "0", "7"]
+                ),
+            PlayRow(None, [], ["2"]),
+        ]
+
+    def test_text(self):
+        self.__set_play_row_consts()
+        self.assertEqual(self.rows[0].text, "Quarter Time Down")
+        self.assertEqual(self.rows[1].text, "1st Quarter")
+        self.assertEqual(
+                self.rows[2].text,
+                "1 15:00 DEN 35 Matt Prater kicks off 65 yards, touchback & more 0 0"
+                )
+
+    def test_iter_play_rows(self):
+        self.__set_play_row_consts()
+        # From a string
+        self.assertEqual(list(iter_play_rows(self.page)), self.rows)
+        # From a file, in chunks small enough to split tags and text
+        for chunk_size in (1, 7, 64):
+            self.assertEqual(
+                    list(iter_play_rows(io.StringIO(self.page), chunk_size=chunk_size)),
+                    self.rows
+                    )
+        # A different table
+        self.assertEqual(
+                list(iter_play_rows(self.page, table_id="other")),
+                [PlayRow(["x"], [], ["Not a play"])]
+                )
+        # No table
+        self.assertEqual(list(iter_play_rows(self.page, table_id="none")), [])
+
+    def test_soup_play_rows(self):
+        self.__set_play_row_consts()
+        soup = BeautifulSoup(
+                self.page,
+                "html.parser",
+                parse_only=SoupStrainer(id="pbp_data")
+                )
+        self.assertEqual(list(soup_play_rows(soup)), self.rows)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from raw_data_readers.sections import Section
+
+
+class TestSections(unittest.TestCase):
+
+    def __set_section_consts(self):
+        """Set a page to be used by the section tests."""
+        self.page = (
+            "<html><head><title>Rams at Seahawks - January 2nd, 2012</title></head>"
+            "<body><div id='nav'><p>Not a table</p></div>"
+            "<table id='game_info'><tr><td>Surface</td><td>grass</td></tr></table>"
+            "<table id='def_stats'><tbody><tr class=''><td>A. Player</td><td>SEA</td></tr></tbody></table>"
+            "<table class='stats_table'><tr><td>Outer</td></tr>"
+            "<tr><td><table><tr><td>Inner</td></tr></table></td></tr></table>"
+            "</body></html>"
+        )
+        self.tree = BeautifulSoup(
+                self.page,
+                "html.parser",
+                parse_only=SoupStrainer(["title", "table"])
+                )
+
+    def __strained(self, spec):
+        """Returns the soup that a SoupStrainer made from spec would give."""
+        return BeautifulSoup(
+                self.page,
+                "html.parser",
+                parse_only=SoupStrainer(**spec)
+                )
+
+    def test_roots(self):
+        self.__set_section_consts()
+        # Nested tables are not roots of their own
+        section = Section(self.tree, {"name": "table"})
+        self.assertEqual(len(section.roots), 3)
+        # Searching by id
+        section = Section(self.tree, {"id": "game_info"})
+        self.assertEqual(len(section.roots), 1)
+        # Nothing matches
+        section = Section(self.tree, {"id": "pbp_data"})
+        self.assertEqual(section.roots, [])
+        self.assertEqual(section.find_all("tr"), [])
+        self.assertEqual(section.find("tr"), None)
+
+    def test_find_all(self):
+        self.__set_section_consts()
+        searches = (
+            ({"name": "title"}, ("title",), {}),
+            ({"id": "game_info"}, ("td",), {}),
+            ({"name": "table", "id": "def_stats"}, ("tbody",), {}),
+            ({"name": "table"}, ("table",), {}),
+            ({"name": "table"}, ("tr",), {}),
+            ({"name": "table"}, ("table",), {"recursive": False}),
+        )
+        for (spec, args, kwargs) in searches:
+            section = Section(self.tree, spec)
+            strained = self.__strained(spec)
+            self.assertEqual(
+                    [str(tag) for tag in section.find_all(*args, **kwargs)],
+                    [str(tag) for tag in strained.find_all(*args, **kwargs)]
+                    )
+
+    def test_find(self):
+        self.__set_section_consts()
+        section = Section(self.tree, {"name": "title"})
+        self.assertEqual(
+                section.find("title").get_text(strip=True),
+                "Rams at Seahawks - January 2nd, 2012"
+                )
+        section = Section(self.tree, {"name": "table"})
+        self.assertEqual(section.find("td").get_text(), "Surface")
+
+
+if __name__ == '__main__':
+    unittest.main()
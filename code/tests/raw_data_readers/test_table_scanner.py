@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from raw_data_readers.table_scanner import scan_tables
+
+
+class TestTableScanner(unittest.TestCase):
+
+    def __set_scanner_consts(self):
+        """Set a page to be used by the scanner tests."""
+        self.page = (
+            "<html><head><title>Rams at Seahawks - January 2nd, 2012</title>"
+            "<script>var t = '<table id=\"fake\"></table>';</script></head><body>"
+            "<div id='nav'><p>Not a table</p></div><!-- <table id='commented'></table> -->"
+            "<table id='game_info'><tr><td>Stadium</td><td>Qwest &amp; Field<br/>(dome)</td></tr></table>"
+            "<table class='stats_table' id=''><tr class='thead'><th data-stat='pos'>Pos</th></tr>"
+            "<tr class='stat_total'><td>Seattle Seahawks</td></tr>"
+            "<tr class=''><td><a href='/p'>Marshawn\nLynch</a></td><td>RB</td></tr></table>"
+            "<table class='stats_table no_highlight'><tr><td>St. Louis Rams</td></tr>"
+            "<tr><td><table><tbody><tr><td>Inner <!-- c -->Player</td></tr></tbody></table></td></tr></table>"
+            "<table id='pbp_data'><tr class='is_scoring'><td>1</td></tr></table>"
+            "</body></html>"
+        )
+        self.soup = BeautifulSoup(
+                self.page,
+                "html.parser",
+                parse_only=SoupStrainer(["title", "table"])
+                )
+        self.tree = scan_tables(self.page)
+
+    def __assert_same(self, soup_items, tree_items):
+        """Check that lists of Tags and Elements have the same text and
+        attributes."""
+        self.assertEqual(len(soup_items), len(tree_items))
+        for (soup_item, tree_item) in zip(soup_items, tree_items):
+            self.assertEqual(soup_item.name, tree_item.name)
+            self.assertEqual(soup_item.attrs, tree_item.attrs)
+            self.assertEqual(
+                    soup_item.get_text(' ', strip=True),
+                    tree_item.get_text(' ', strip=True)
+                    )
+            self.assertEqual(soup_item.get_text(), tree_item.get_text())
+
+    def test_find_all(self):
+        self.__set_scanner_consts()
+        searches = (
+            (("title",), {}),
+            (("table",), {}),
+            (("table",), {"recursive": False}),
+            (("tr",), {}),
+            (("td",), {}),
+            (("tbody",), {}),
+            ((), {"id": "game_info"}),
+            (("table",), {"id": ""}),
+            (("table",), {"id": "pbp_data"}),
+            (("th",), {"attrs": {"data-stat": "pos"}}),
+            (("tr",), {"class": "stat_total"}),
+            ((["title", "tbody"],), {}),
+        )
+        for (args, kwargs) in searches:
+            self.__assert_same(
+                    self.soup.find_all(*args, **kwargs),
+                    self.tree.find_all(*args, **kwargs)
+                    )
+
+    def test_element(self):
+        self.__set_scanner_consts()
+        th = self.tree.find("th")
+        table = th.parent.parent
+        self.assertEqual(table.name, "table")
+        self.assertEqual(table["class"], ["stats_table"])
+        self.assertTrue(table.has_attr("id"))
+        self.assertFalse(table.has_attr("style"))
+        self.assertEqual(table.get("style"), None)
+        rows = table.find_all("tr")
+        self.assertEqual([row["class"] for row in rows], [["thead"], ["stat_total"], []])
+        self.assertEqual(rows[2].find("td").get_text(' ', strip=True), "Marshawn\nLynch")
+        self.assertEqual(self.tree.find(id="none"), None)
+
+    def test_skip_ids(self):
+        self.__set_scanner_consts()
+        tree = scan_tables(self.page, skip_ids=("pbp_data",))
+        self.assertEqual(tree.find(id="pbp_data"), None)
+        self.assertEqual(len(tree.find_all("table")), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+
+from itertools import product
+import json
+import os
+import tempfile
+import unittest
+
+from converter import Converter, convert_game, json_unchanged, get_output_dir, iter_converted_games
+from game_writer import encoders, encoder_available, write_game
+from manifest import Manifest
+from raw_data_readers.backends import backends, backend_available
+
+# A small game page, and the JSON it converts to with the versions below
+data_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "data")
+game_file = os.path.join(data_dir, "game.htm")
+expected_file = os.path.join(data_dir, "game.json")
+versions = {"parser_version": "parser", "raw_version": "raw"}
+
+
+class TestConverter(unittest.TestCase):
+
+    def __set_expected_consts(self):
+        """Set the expected output for the game page."""
+        with open(expected_file, "r") as file_handle:
+            # The file ends with a newline, which written games don't
+            self.expected_text = file_handle.read().rstrip("\n")
+        self.expected = json.loads(self.expected_text)
+        # The content hash is only added when the game is serialized
+        self.expected_json = dict(self.expected)
+        self.expected_json["_version"] = dict(self.expected["_version"])
+        del self.expected_json["_version"]["content"]
+
+    def test_converter(self):
+        self.__set_expected_consts()
+        for backend in backends:
+            if not backend_available(backend):
+                continue
+            for (single_pass, stream_pbp, locate) in product((True, False), repeat=3):
+                converter = Converter(
+                        game_file,
+                        backend,
+                        single_pass=single_pass,
+                        stream_pbp=stream_pbp,
+                        locate=locate,
+                        **versions
+                        )
+                self.assertEqual(converter.json, self.expected_json)
+                self.assertEqual(converter.season, 1999)
+        # From a file object
+        with open(game_file, "rb") as file_handle:
+            converter = Converter("game.htm", file_obj=file_handle, **versions)
+        self.assertEqual(converter.json, self.expected_json)
+
+    def test_convert_game(self):
+        self.__set_expected_consts()
+        with tempfile.TemporaryDirectory() as directory:
+            out_file_name = os.path.join(directory, "1999", "1999_19991120_SEA_at_PIT.json")
+            for (backend, encoder) in product(backends, encoders):
+                if not backend_available(backend) or not encoder_available(encoder):
+                    continue
+                result = convert_game(
+                        game_file,
+                        backend=backend,
+                        output_directory=directory,
+                        encoder=encoder,
+                        **versions
+                        )
+                self.assertEqual(result, (out_file_name, 1999, self.expected_text))
+            # An unchanged game is not written again
+            os.makedirs(os.path.dirname(out_file_name))
+            with open(out_file_name, "w") as file_handle:
+                file_handle.write(self.expected_text)
+            result = convert_game(game_file, output_directory=directory, **versions)
+            self.assertEqual(result, (out_file_name, 1999, None))
+            result = convert_game(
+                    game_file,
+                    output_directory=directory,
+                    force_overwrite=True,
+                    **versions
+                    )
+            self.assertEqual(result, (out_file_name, 1999, self.expected_text))
+
+    def test_json_unchanged(self):
+        game = {"home team": "SEA", "_version": {"parser": "abc", "raw": "def"}}
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "game.json")
+            # No file yet
+            self.assertFalse(json_unchanged(file_name, game))
+            with open(file_name, "w") as file_handle:
+                json.dump({"home team": "SEA", "_version": {"parser": "123"}}, file_handle)
+            self.assertTrue(json_unchanged(file_name, game))
+            self.assertFalse(json_unchanged(file_name, {"home team": "PIT"}))
+        # The game is not changed
+        self.assertEqual(game["_version"], {"parser": "abc", "raw": "def"})
+
+    def test_get_output_dir(self):
+        self.assertEqual(get_output_dir("/tmp/out/", 1999), "/tmp/out/1999")
+        self.assertEqual(get_output_dir("/tmp/out/", 1999, True), "/tmp/out")
+
+    def test_iter_converted_games(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_names = [os.path.join(directory, str(i) + ".htm") for i in range(10)]
+            for (jobs, threads) in ((1, 1), (3, 1), (1, 3)):
+                results = list(iter_converted_games(
+                    file_names,
+                    jobs,
+                    output_directory=directory,
+                    threads=threads
+                    ))
+                # Failures come back in the order of the files
+                self.assertEqual([result[0] for result in results], file_names)
+                for (_, out_file_name, season, text, error) in results:
+                    self.assertIsNone(out_file_name)
+                    self.assertIsNone(season)
+                    self.assertIsNone(text)
+                    self.assertIn("FileNotFoundError", error)
+
+    def test_iter_converted_games_order(self):
+        with open(game_file, "r") as file_handle:
+            page = file_handle.read()
+        with tempfile.TemporaryDirectory() as directory:
+            # Copies of the game on different days, so that each has its own
+            # output file, with missing files in between
+            file_names = []
+            for day in ("20th", "21st", "22nd", "23rd", "24th"):
+                file_names.append(os.path.join(directory, day + ".htm"))
+                with open(file_names[-1], "w") as file_handle:
+                    file_handle.write(page.replace("November 20th", "November " + day))
+                file_names.append(os.path.join(directory, "missing_" + day + ".htm"))
+            output_directory = os.path.join(directory, "out")
+            modes = ((1, 1), (3, 1), (1, 3))
+
+            def converted_games(jobs, threads, manifest=None):
+                return list(iter_converted_games(
+                    file_names,
+                    jobs,
+                    output_directory=output_directory,
+                    force_overwrite=True,
+                    manifest=manifest,
+                    threads=threads
+                    ))
+
+            expected = converted_games(1, 1)
+            self.assertEqual([result[0] for result in expected], file_names)
+            for (raw_file, out_file_name, season, text, error) in expected:
+                if "missing" in raw_file:
+                    self.assertIn("FileNotFoundError", error)
+                else:
+                    self.assertIsNone(error)
+                    self.assertEqual(season, 1999)
+                    self.assertEqual(json.loads(text)["datetime"]["date"][:8], "1999-11-")
+            self.assertEqual(len(set(result[1] for result in expected if result[4] is None)), 5)
+            for (jobs, threads) in modes[1:]:
+                self.assertEqual(converted_games(jobs, threads), expected)
+
+            # Write every other game, so that the manifest skips those
+            manifest_file = os.path.join(directory, "manifest.json")
+            manifest = Manifest(manifest_file, "parser")
+            skipped = [result[0] for result in expected[::4]]
+            for (raw_file, out_file_name, _, text, _) in expected[::4]:
+                # The file is fingerprinted when it is checked
+                self.assertIsNone(manifest.is_current(raw_file))
+                write_game(raw_file, out_file_name, text)
+                manifest.record(raw_file, out_file_name)
+            manifest.save()
+            for (jobs, threads) in modes:
+                results = converted_games(jobs, threads, Manifest(manifest_file, "parser"))
+                self.assertEqual([result[0] for result in results], file_names)
+                for (result, expected_result) in zip(results, expected):
+                    if result[0] in skipped:
+                        self.assertEqual(result, expected_result[:2] + (None, None, None))
+                    else:
+                        self.assertEqual(result, expected_result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import tempfile
+import unittest
+
+from game_writer import encoders, encoder_available, dumps, serialize_game, read_content_hash, write_game, json_format, SeasonBundles, get_bundle_file_name
+
+
+class TestGameWriter(unittest.TestCase):
+
+    def __set_game_consts(self):
+        """Set a game, and the exact text it must be written as, to be used
+        by the writer tests."""
+        self.game = {
+                "_version": {"parser": "abc", "raw": "unknown"},
+                "home team": "SEA",
+                "away team": "PIT",
+                "betting": {"over under": 44.5, "spread": -3.5, "winner": "home"},
+                "weather": {"relative humidity": 0.29, "temperature": 41},
+                "players": {"home": {}, "away": {"QB": "Jérôme Léger"}},
+                "plays": [
+                    {
+                        "desc": "Señor \"Punter\" punts\tback\\\u0001 \u2028",
+                        "penalty": [],
+                        "yards": 0,
+                        "scoring": None,
+                        "turnover": False
+                        }
+                    ],
+                }
+        self.golden = """{
+  "_version": {
+    "parser": "abc",
+    "raw": "unknown"
+  },
+  "away team": "PIT",
+  "betting": {
+    "over under": 44.5,
+    "spread": -3.5,
+    "winner": "home"
+  },
+  "home team": "SEA",
+  "players": {
+    "away": {
+      "QB": "Jérôme Léger"
+    },
+    "home": {}
+  },
+  "plays": [
+    {
+      "desc": "Señor \\"Punter\\" punts\\tback\\\\\\u0001 \u2028",
+      "penalty": [],
+      "scoring": null,
+      "turnover": false,
+      "yards": 0
+    }
+  ],
+  "weather": {
+    "relative humidity": 0.29,
+    "temperature": 41
+  }
+}"""
+
+    def __installed_encoders(self):
+        return [encoder for encoder in encoders if encoder_available(encoder)]
+
+    def test_golden(self):
+        self.__set_game_consts()
+        # The format every game has always been written in
+        self.assertEqual(json.dumps(self.game, **json_format), self.golden)
+        for encoder in self.__installed_encoders():
+            self.assertEqual(dumps(self.game, encoder), self.golden, encoder)
+
+    def test_fallback(self):
+        # Values orjson writes differently from json
+        odd_values = [
+                1e16, -1.5e300, 1e-5, float("nan"), float("inf"),
+                2**64, -2**63 - 1, {1: "a"}, [0.0, -0.0, 1e-4, 123.25]
+                ]
+        for encoder in self.__installed_encoders():
+            for value in odd_values:
+                obj = {"a": [{"b": value}]}
+                self.assertEqual(dumps(obj, encoder), json.dumps(obj, **json_format), (encoder, value))
+
+    def test_encoder_available(self):
+        self.assertTrue(encoder_available("json"))
+        self.assertRaises(ValueError, encoder_available, "pickle")
+
+    def test_serialize_game(self):
+        game = {
+                "home team": "SEA",
+                "plays": [{"desc": "Señor Punter punts"}],
+                "_version": {"parser": "abc", "raw": "def"}
+                }
+        (text, content_hash) = serialize_game(game)
+        for encoder in self.__installed_encoders():
+            self.assertEqual(serialize_game(game, encoder), (text, content_hash))
+        expected = dict(game)
+        expected["_version"] = {"content": content_hash, "parser": "abc", "raw": "def"}
+        self.assertEqual(text, json.dumps(expected, **json_format))
+        # The hash does not depend on the _version hashes
+        game["_version"] = {"parser": "123"}
+        self.assertEqual(serialize_game(game)[1], content_hash)
+        game["home team"] = "PIT"
+        self.assertNotEqual(serialize_game(game)[1], content_hash)
+        # Keys that sort before _version
+        game = {"Home": "SEA", "_version": {}}
+        (text, content_hash) = serialize_game(game)
+        self.assertEqual(text, json.dumps({"Home": "SEA", "_version": {"content": content_hash}}, **json_format))
+
+    def test_read_content_hash(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "game.json")
+            # No file
+            self.assertIsNone(read_content_hash(file_name))
+            # Written without a hash
+            with open(file_name, "w") as file_handle:
+                json.dump({"_version": {"parser": "abc"}, "home team": "SEA"}, file_handle, **json_format)
+            self.assertEqual(read_content_hash(file_name), "")
+            # Written with a hash
+            (text, content_hash) = serialize_game({"_version": {"parser": "abc"}, "home team": "SEA"})
+            with open(file_name, "w") as file_handle:
+                file_handle.write(text)
+            self.assertEqual(read_content_hash(file_name), content_hash)
+
+    def test_write_game(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "1999", "game.json")
+            self.assertTrue(write_game("game.htm", file_name, "{}"))
+            with open(file_name, "r") as file_handle:
+                self.assertEqual(file_handle.read(), "{}")
+
+    def test_season_bundles(self):
+        self.__set_game_consts()
+        games = []
+        for (i, season) in enumerate((1999, 2000, 1999)):
+            game = dict(self.game)
+            game["home team"] = "T" + str(i)
+            games.append((season, game))
+        with tempfile.TemporaryDirectory() as directory:
+            with SeasonBundles(directory) as bundles:
+                for (season, game) in games:
+                    self.assertTrue(bundles.add(season, serialize_game(game)[0]))
+            self.assertEqual(sorted(os.listdir(directory)), ["1999.json", "2000.json"])
+            for season in (1999, 2000):
+                expected = {
+                        "season": season,
+                        "games": [json.loads(serialize_game(game)[0]) for (game_season, game) in games if game_season == season]
+                        }
+                with open(get_bundle_file_name(directory, season), "r") as file_handle:
+                    self.assertEqual(file_handle.read(), json.dumps(expected, **json_format))
+
+            # Unfinished bundles leave the old ones
+            try:
+                with SeasonBundles(directory) as bundles:
+                    bundles.add(1999, "{}")
+                    raise KeyboardInterrupt
+            except KeyboardInterrupt:
+                pass
+            self.assertEqual(sorted(os.listdir(directory)), ["1999.json", "2000.json"])
+            with open(get_bundle_file_name(directory, 1999), "r") as file_handle:
+                self.assertEqual(len(json.load(file_handle)["games"]), 2)
+
+            # A discarded season keeps its old bundle, even if more games of
+            # it are added, while the others are written
+            with SeasonBundles(directory) as bundles:
+                bundles.add(1999, "{}")
+                bundles.add(2000, "{}")
+                bundles.discard(1999)
+                self.assertFalse(bundles.add(1999, "{}"))
+            self.assertEqual(sorted(os.listdir(directory)), ["1999.json", "2000.json"])
+            with open(get_bundle_file_name(directory, 1999), "r") as file_handle:
+                self.assertEqual(len(json.load(file_handle)["games"]), 2)
+            with open(get_bundle_file_name(directory, 2000), "r") as file_handle:
+                self.assertEqual(json.load(file_handle)["games"], [{}])
+
+            # Discarding every season keeps every old bundle
+            with SeasonBundles(directory) as bundles:
+                bundles.add(2000, "{}")
+                bundles.discard()
+                self.assertFalse(bundles.add(1999, "{}"))
+            self.assertEqual(sorted(os.listdir(directory)), ["1999.json", "2000.json"])
+            with open(get_bundle_file_name(directory, 1999), "r") as file_handle:
+                self.assertEqual(len(json.load(file_handle)["games"]), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+import os
+import tempfile
+import unittest
+
+from git_version import find_git_dir, read_head, GitVersions
+
+
+class TestGitVersion(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.repo = os.path.realpath(self.directory.name)
+        self.git_dir = os.path.join(self.repo, ".git")
+        os.makedirs(os.path.join(self.git_dir, "refs", "heads"))
+        self.hash = "1c11f08555394d99d67c39db49335056ea536d24"
+        self.other_hash = "9fceb02d0ae598e95dc970b74767f19372d61af8"
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def __write(self, name, text):
+        with open(os.path.join(self.git_dir, name), "w") as file_handle:
+            file_handle.write(text)
+
+    def test_find_git_dir(self):
+        subdirectory = os.path.join(self.repo, "a", "b")
+        os.makedirs(subdirectory)
+        self.assertEqual(find_git_dir(subdirectory), self.git_dir)
+        self.assertEqual(find_git_dir(self.repo), self.git_dir)
+        # A .git file pointing at the real git directory
+        worktree = os.path.join(self.repo, "worktree")
+        os.makedirs(worktree)
+        with open(os.path.join(worktree, ".git"), "w") as file_handle:
+            file_handle.write("gitdir: ../.git/worktrees/worktree\n")
+        self.assertEqual(
+                find_git_dir(worktree),
+                os.path.join(self.git_dir, "worktrees", "worktree")
+                )
+
+    def test_read_head(self):
+        # Loose ref
+        self.__write("HEAD", "ref: refs/heads/main\n")
+        self.__write("refs/heads/main", self.hash + "\n")
+        self.assertEqual(read_head(self.git_dir), self.hash)
+        # Packed ref
+        os.remove(os.path.join(self.git_dir, "refs", "heads", "main"))
+        self.__write(
+                "packed-refs",
+                "# pack-refs with: peeled fully-peeled sorted\n"
+                + self.other_hash + " refs/heads/dev\n"
+                + self.hash + " refs/heads/main\n"
+                + "^" + self.other_hash + "\n"
+                )
+        self.assertEqual(read_head(self.git_dir), self.hash)
+        # Detached
+        self.__write("HEAD", self.other_hash + "\n")
+        self.assertEqual(read_head(self.git_dir), self.other_hash)
+        # No commits yet
+        self.__write("HEAD", "ref: refs/heads/new\n")
+        self.assertIsNone(read_head(self.git_dir))
+
+    def test_versions(self):
+        self.__write("HEAD", "ref: refs/heads/main\n")
+        self.__write("refs/heads/main", self.hash + "\n")
+        versions = GitVersions()
+        self.assertEqual(versions.version(self.repo), self.hash)
+        # Looked up only once
+        self.__write("refs/heads/main", self.other_hash + "\n")
+        self.assertEqual(versions.version(self.repo), self.hash)
+        self.assertEqual(GitVersions().version(self.repo), self.other_hash)
+        # Not a directory
+        missing = os.path.join(self.repo, "missing")
+        self.assertEqual(versions.version(missing), "unknown")
+
+
+if __name__ == '__main__':
+    unittest.main()
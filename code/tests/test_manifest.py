@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+import os
+import tempfile
+import unittest
+
+from manifest import Manifest
+
+
+class TestManifest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.raw_file = os.path.join(self.directory.name, "game.htm")
+        self.out_file = os.path.join(self.directory.name, "game.json")
+        self.manifest_file = os.path.join(self.directory.name, "manifest.json")
+        with open(self.raw_file, "w") as file_handle:
+            file_handle.write("<html></html>")
+        with open(self.out_file, "w") as file_handle:
+            file_handle.write("{}")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def __record(self, parser_version="abc", settings=None):
+        manifest = Manifest(self.manifest_file, parser_version, settings)
+        self.assertIsNone(manifest.is_current(self.raw_file))
+        manifest.record(self.raw_file, self.out_file)
+        manifest.save()
+
+    def test_current(self):
+        self.__record()
+        manifest = Manifest(self.manifest_file, "abc")
+        self.assertEqual(manifest.is_current(self.raw_file), self.out_file)
+        # Touched but not changed
+        os.utime(self.raw_file, (0, 0))
+        manifest = Manifest(self.manifest_file, "abc")
+        self.assertEqual(manifest.is_current(self.raw_file), self.out_file)
+
+    def test_changed(self):
+        self.__record()
+        # New parser
+        self.assertIsNone(Manifest(self.manifest_file, "def").is_current(self.raw_file))
+        self.assertIsNone(Manifest(self.manifest_file, "unknown").is_current(self.raw_file))
+        # New settings
+        self.assertIsNone(Manifest(self.manifest_file, "abc", ["out"]).is_current(self.raw_file))
+        # New bytes, of the same size
+        with open(self.raw_file, "w") as file_handle:
+            file_handle.write("<html></htm>")
+        os.utime(self.raw_file, (0, 0))
+        self.assertIsNone(Manifest(self.manifest_file, "abc").is_current(self.raw_file))
+
+    def test_missing_output(self):
+        self.__record()
+        os.remove(self.out_file)
+        self.assertIsNone(Manifest(self.manifest_file, "abc").is_current(self.raw_file))
+
+    def test_forget(self):
+        self.__record()
+        manifest = Manifest(self.manifest_file, "abc")
+        manifest.forget(self.raw_file)
+        manifest.save()
+        self.assertIsNone(Manifest(self.manifest_file, "abc").is_current(self.raw_file))
+
+    def test_data(self):
+        manifest = Manifest(self.manifest_file, "abc")
+        member = os.path.join(self.raw_file + ".zip", "game.htm")
+        self.assertIsNone(manifest.is_current(member, b"<html></html>"))
+        manifest.record(member, self.out_file)
+        self.assertEqual(manifest.is_current(member, b"<html></html>"), self.out_file)
+        self.assertIsNone(manifest.is_current(member, b"<html></htm>"))
+
+    def test_bad_manifest(self):
+        with open(self.manifest_file, "w") as file_handle:
+            file_handle.write("not json")
+        self.assertEqual(Manifest(self.manifest_file, "abc").files, {})
+        self.assertIsNone(Manifest(self.manifest_file, "abc").is_current("/not/a/file"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from play_by_play import PlayInfo, PlayByPlay
+from raw_data_readers.play_rows import PlayRow
+
+
+class TestPlayInfo(unittest.TestCase):
+
+    def test_defaults(self):
+        info = PlayInfo()
+        self.assertEqual(info.time, 0)
+        self.assertEqual(info.quarter, 1)
+        self.assertEqual(info.offense, None)
+        self.assertEqual(info.home_score, 0)
+        self.assertEqual(info.away_score, 0)
+        self.assertEqual(info.description, '')
+        self.assertEqual(info.type, None)
+        self.assertEqual(info.number, -1)
+        # Slots prevent typos from creating new fields
+        self.assertRaises(AttributeError, setattr, info, "home score", 7)
+
+    def test_copy(self):
+        info = PlayInfo(398, 2, "home", 14, 7, "Jerome Bettis up the middle for 4 yards", "run", 57)
+        copy = info.copy()
+        self.assertIsNot(copy, info)
+        for name in PlayInfo.__slots__:
+            self.assertEqual(getattr(copy, name), getattr(info, name))
+        # Changing the copy leaves the original alone
+        copy.number += 1
+        copy.offense = "away"
+        self.assertEqual(info.number, 57)
+        self.assertEqual(info.offense, "home")
+
+
+class TestPlayByPlay(unittest.TestCase):
+
+    def __set_pbp_consts(self):
+        """Set a short game to be used by the play-by-play tests."""
+        self.rows = (
+            PlayRow(["thead"], ["Quarter", "Time", "Down", "ToGo", "Location", "Detail", "DEN", "SEA", "EPB", "EPA"], []),
+            PlayRow(["thead", "onecell"], [], ["1st Quarter"]),
+            PlayRow([], [], ["1", "15:00", "", "", "SEA 35", "Steven Hauschka kicks off 65 yards, touchback", "0", "0", "0", "0"]),
+            PlayRow(["pos_change"], [], ["1", "15:00", "1", "10", "DEN 20", "Peyton Manning pass complete short left to Wes Welker for 5 yards (tackle by Earl Thomas)", "0", "0", "0", "0"]),
+            PlayRow([], [], ["1", "14:30", "2", "5", "DEN 25", "Knowshon Moreno up the middle for 3 yards (tackle by Bobby Wagner)", "0", "0", "0", "0"]),
+        )
+        self.args = (
+            2013,
+            "SEA",
+            "DEN",
+            ("Steven Hauschka", "Earl Thomas", "Bobby Wagner"),
+            ("Peyton Manning", "Wes Welker", "Knowshon Moreno"),
+        )
+
+    def __rows_then_fail(self, n_rows):
+        """Yields the first n_rows rows, then fails if asked for more."""
+        for row in self.rows[:n_rows]:
+            yield row
+        raise AssertionError("Read too many rows")
+
+    def test_play_by_play(self):
+        self.__set_pbp_consts()
+        pbp = PlayByPlay(iter(self.rows), *self.args)
+        self.assertEqual(
+                [play["number"] for play in pbp.json],
+                [0, 1, 2]
+                )
+        self.assertEqual(
+                [play["play"]["type"] for play in pbp.json],
+                ["kick off", "complete pass", "run"]
+                )
+        self.assertEqual(pbp.json[2]["state"]["yards to goal"], 75)
+
+    def test_iter_plays(self):
+        self.__set_pbp_consts()
+        pbp = PlayByPlay(iter(self.rows), *self.args)
+        self.assertEqual(
+                list(PlayByPlay.iter_plays(iter(self.rows), *self.args)),
+                pbp.json
+                )
+        # Each play is yielded as soon as its row is read
+        plays = PlayByPlay.iter_plays(self.__rows_then_fail(3), *self.args)
+        self.assertEqual(next(plays), pbp.json[0])
+        # Nothing is parsed until asked for
+        lazy = PlayByPlay(iter(self.rows), *self.args, parse=False)
+        self.assertEqual(lazy.json, [])
+        self.assertEqual(list(lazy.plays()), pbp.json)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+
+import os
+import tempfile
+import unittest
+
+from roster_builder import page_players, build_rosters, merge_rosters, shared_players, format_rosters
+
+
+class TestRosterBuilder(unittest.TestCase):
+
+    def __set_page_consts(self):
+        """Set a page to be used by the roster builder tests."""
+        self.page = (
+            "<html><head><title>Seattle Seahawks at Pittsburgh Steelers - November 20th, 1999</title></head><body>"
+            "<table class='stats_table' id=''><tr class='thead'><th data-stat='player'>Player</th><th data-stat='pos'>Pos</th></tr>"
+            "<tr class='stat_total'><td colspan=2>Seattle Seahawks</td></tr>"
+            "<tr class=''><td><a href='/p'>Ahman Green</a></td><td>RB</td></tr>"
+            "</table>"
+            "<table class='stats_table' id=''><tr class='thead'><th data-stat='player'>Player</th><th data-stat='pos'>Pos</th></tr>"
+            "<tr class='stat_total'><td colspan=2>Pittsburgh Steelers</td></tr>"
+            "<tr class=''><td><a href='/p'>Hines Ward</a></td><td>WR</td></tr>"
+            "</table>"
+            "<table class='stats_table no_highlight'>"
+            "<tr><td>Seattle Seahawks</td></tr><tr><td><table><tbody>"
+            "<tr><td>Jon Kitna</td><td>7</td></tr>"
+            "</tbody></table></td></tr>"
+            "<tr><td>Pittsburgh Steelers</td></tr><tr><td><table><tbody>"
+            "<tr><td>Kris Brown</td><td>7</td></tr>"
+            "</tbody></table></td></tr>"
+            "</table>"
+            "<table id='def_stats'><thead><tr><th>Player</th><th>Tm</th></tr></thead><tbody>"
+            "<tr class=''><td>Chad Brown</td><td>SEA</td></tr>"
+            "<tr class='thead'><td>Player</td><td>Tm</td></tr>"
+            "<tr class=''><td>Joey Porter</td><td>PIT</td></tr>"
+            "</tbody></table>"
+            "<table id='skill_stats'><thead><tr><th>Player</th><th>Tm</th></tr></thead><tbody>"
+            "<tr class=''><td>Jerome Bettis</td><td>PIT</td></tr>"
+            "</tbody></table>"
+            "<table id='kick_stats'><thead><tr><th>Player</th><th>Tm</th></tr></thead><tbody>"
+            "<tr class=''><td>Todd Peterson</td><td>SEA</td></tr>"
+            "</tbody></table>"
+            "</body></html>"
+        )
+        self.players = {
+            "PIT": set(["Hines Ward", "Kris Brown", "Joey Porter", "Jerome Bettis"]),
+            "SEA": set(["Ahman Green", "Jon Kitna", "Chad Brown", "Todd Peterson"]),
+        }
+
+    def test_page_players(self):
+        self.__set_page_consts()
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "game.htm")
+            with open(file_name, "w") as file_handle:
+                file_handle.write(self.page)
+            self.assertEqual(page_players(file_name), (1999, self.players))
+        # From bytes
+        self.assertEqual(
+                page_players("game.htm", self.page.encode("utf-8")),
+                (1999, self.players)
+                )
+
+    def test_build_rosters(self):
+        self.__set_page_consts()
+        with tempfile.TemporaryDirectory() as directory:
+            file_names = []
+            for name in ("game1.htm", "game2.htm"):
+                file_names.append(os.path.join(directory, name))
+                with open(file_names[-1], "w") as file_handle:
+                    file_handle.write(self.page)
+            # Not a page
+            file_names.append(os.path.join(directory, "bad.htm"))
+            with open(file_names[-1], "w") as file_handle:
+                file_handle.write("<html></html>")
+            (rosters, failed) = build_rosters(file_names, jobs=2)
+        self.assertEqual(rosters, {
+            "PIT": {1999: self.players["PIT"]},
+            "SEA": {1999: self.players["SEA"]},
+            })
+        self.assertEqual([file_name for (file_name, _) in failed], [file_names[-1]])
+        # The reason is kept
+        self.assertIn("Error", failed[0][1])
+
+    def test_merge_rosters(self):
+        rosters = {"PIT": {1999: set(["Hines Ward"])}}
+        merge_rosters(rosters, {
+            "PIT": {1999: set(["Kris Brown"]), 2000: set(["Plaxico Burress"])},
+            "SEA": {1999: set(["Jon Kitna"])},
+            })
+        self.assertEqual(rosters, {
+            "PIT": {1999: set(["Hines Ward", "Kris Brown"]), 2000: set(["Plaxico Burress"])},
+            "SEA": {1999: set(["Jon Kitna"])},
+            })
+
+    def test_shared_players(self):
+        rosters = {
+            "PIT": {1999: set(["Hines Ward", "J.J. Jones"]), 2000: set(["Mike Vrabel"])},
+            "SEA": {1999: set(["Hines Ward", "J. J. Jones"]), 2000: set(["Jon Kitna"])},
+            "NE": {2000: set(["Mike Vrabel"])},
+        }
+        shared = shared_players(rosters)
+        self.assertEqual(sorted(shared), [1999, 2000])
+        self.assertEqual(shared[1999]["Hines Ward"], ["PIT", "SEA"])
+        self.assertEqual(list(shared[1999].values()), [["PIT", "SEA"], ["PIT", "SEA"]])
+        self.assertEqual(shared[2000], {"Mike Vrabel": ["NE", "PIT"]})
+
+    def test_format_rosters(self):
+        rosters = {
+            "SEA": {1999: set(["Jon Kitna"]), 2000: set()},
+            "PIT": {1999: set(["Hines Ward", "Kris Brown", "Jérôme \"The Bus\" Bettis"])},
+        }
+        source = format_rosters(rosters)
+        self.assertTrue(source.startswith("#!/usr/bin/env python3\n\n# PLEASE NOTE"))
+        self.assertIn(
+                '        1999: set([\n'
+                '            "Jérôme \\"The Bus\\" Bettis",\n'
+                '            "Kris Brown",\n'
+                '            "Hines Ward"\n'
+                '        ])\n',
+                source
+                )
+        namespace = {}
+        exec(source, namespace)
+        self.assertEqual(namespace["rosters"], rosters)
+
+
+if __name__ == '__main__':
+    unittest.main()